@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from tommy.support.application_settings import application_settings
+
+# The cache folder used while collecting the tests, so objects that are
+# created when their module is imported do not use the real user cache
+_collection_cache_folder = tempfile.mkdtemp(prefix="tommy-test-cache-")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Point the cache folder to a temporary folder before collection"""
+    application_settings.cache_folder = _collection_cache_folder
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the temporary cache folder of the collection"""
+    shutil.rmtree(_collection_cache_folder, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def cache_folder(tmp_path, monkeypatch) -> str:
+    """
+    Fixture that points the cache folder of the application settings to a
+    temporary folder of the test, so tests do not write into the cache of
+    the user and do not use entries cached by other tests.
+    """
+    folder = os.path.join(tmp_path, "cache")
+    monkeypatch.setattr(application_settings, "cache_folder", folder)
+    return folder
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -106,6 +106,8 @@ def helper_check_model_refs(controller: Controller):
 
     assert preprocessing_controller._stopwords_model is stopwords_model
     assert preprocessing_controller._synonyms_model is synonyms_model
+    assert (preprocessing_controller._model_parameters_model is
+            model_parameters_model)
 
     assert corpus_controller._corpus_model is corpus_model
 
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from tommy.controller.corpus_controller import CorpusController
+from tommy.controller.project_settings_controller import (
+    ProjectSettingsController)
+from tommy.model.corpus_model import CorpusModel
+from tommy.model.project_settings_model import ProjectSettingsModel
+from tommy.support.application_settings import application_settings
+
+
+@pytest.fixture
+def corpus_controller() -> CorpusController:
+    corpus_controller = CorpusController()
+    corpus_controller.set_model_refs(CorpusModel())
+    return corpus_controller
+
+
+@pytest.fixture
+def duplicates_folder(corpus_controller, tmp_path) -> str:
+    for name, text in [("origineel.txt", "Verhaaltje over een kat"),
+                       ("kopie.txt", "Verhaaltje over een kat"),
+                       ("ander.txt", "Verhaaltje over een hond")]:
+        with open(os.path.join(tmp_path, name), "w") as file:
+            file.write(text)
+    project_settings_controller = ProjectSettingsController()
+    project_settings_controller.set_model_refs(ProjectSettingsModel())
+    corpus_controller.set_controller_refs(project_settings_controller, None)
+    project_settings_controller.set_input_folder_path(str(tmp_path))
+    return str(tmp_path)
+
+
+def test_duplicates_kept_by_default(corpus_controller, duplicates_folder):
+    files = list(corpus_controller.get_raw_files())
+
+    assert len(files) == 3
+    assert corpus_controller.describe_removed_duplicates() == []
+
+
+def test_removed_duplicates_counted(corpus_controller, duplicates_folder,
+                                   monkeypatch):
+    monkeypatch.setattr(application_settings, "remove_duplicates", True)
+
+    files = list(corpus_controller.get_raw_files())
+
+    # Only one of the two copies is kept
+    names = [file.metadata.name for file in files]
+    assert len(names) == 2
+    assert "ander" in names
+    messages = corpus_controller.describe_removed_duplicates()
+    assert len(messages) == 1
+    assert messages[0].startswith("1 document(en)")
+
+
+def test_import_running_event(corpus_controller, tmp_path):
+    with open(os.path.join(tmp_path, "kat.txt"), "w") as file:
+        file.write("Verhaaltje over een kat")
+    running_states = []
+    corpus_controller.import_running_event.subscribe(running_states.append)
+
+    corpus_controller.extract_and_store_metadata(str(tmp_path))
+
+    assert running_states == [True, False]
+    assert len(corpus_controller.get_metadata()) == 1
+
+
+def test_import_running_event_after_error(corpus_controller, tmp_path,
+                                          mocker):
+    mocker.patch.object(corpus_controller, "_import_metadata",
+                        side_effect=OSError("Map niet leesbaar"))
+    running_states = []
+    corpus_controller.import_running_event.subscribe(running_states.append)
+
+    with pytest.raises(OSError):
+        corpus_controller.extract_and_store_metadata(str(tmp_path))
+
+    # The actions are enabled again when the import fails
+    assert running_states == [True, False]
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
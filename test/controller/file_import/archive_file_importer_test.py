@@ -0,0 +1,135 @@
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from tommy.controller.file_import import archive_reader
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data'))
+
+ARCHIVE_MEMBERS = {
+    'verhalen/kattenverhaaltje 1.txt':
+        os.path.join('test_txt_files', 'correct_files',
+                     'kattenverhaaltje 1.txt'),
+    'verhalen/kattenverhaaltje 2.pdf':
+        os.path.join('test_pdf_files', 'correct_files',
+                     'kattenverhaaltje 2.pdf'),
+    'verhalen/kattenverhaaltje 2.docx':
+        os.path.join('test_docx_files', 'correct_files',
+                     'kattenverhaaltje 2.docx'),
+    'correct.csv': os.path.join('test_csv_files', 'correct.csv'),
+}
+
+
+@pytest.fixture
+def generic_file_importer():
+    return GenericFileImporter()
+
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = os.path.join(tmp_path, 'corpus.zip')
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, data_path in ARCHIVE_MEMBERS.items():
+            archive.write(os.path.join(TEST_DATA_DIR, data_path), name)
+    return path
+
+
+@pytest.fixture
+def tar_path(tmp_path):
+    path = os.path.join(tmp_path, 'corpus.tar.gz')
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data_path in ARCHIVE_MEMBERS.items():
+            archive.add(os.path.join(TEST_DATA_DIR, data_path), name)
+    return path
+
+
+@pytest.mark.parametrize('archive_fixture', ['zip_path', 'tar_path'])
+def test_import_archive(generic_file_importer, archive_fixture, request):
+    archive_path = request.getfixturevalue(archive_fixture)
+    files = list(generic_file_importer.import_file(archive_path))
+
+    # Every member is imported as if it was a file on disk
+    expected_files = [file for data_path in ARCHIVE_MEMBERS.values()
+                      for file in generic_file_importer.import_file(
+                          os.path.join(TEST_DATA_DIR, data_path))]
+    assert len(files) == len(expected_files) == 54
+    for file, expected_file in zip(files, expected_files):
+        assert file.body == expected_file.body
+        assert file.metadata.title == expected_file.metadata.title
+        assert file.metadata.size == expected_file.metadata.size
+
+    # The paths point inside the archive
+    assert files[0].metadata.path == os.path.join(
+        archive_path, 'verhalen', 'kattenverhaaltje 1.txt')
+    assert files[1].metadata.path == os.path.relpath(os.path.join(
+        archive_path, 'verhalen', 'kattenverhaaltje 2.pdf'))
+
+
+def test_import_archive_with_unsupported_member(generic_file_importer,
+                                                tmp_path):
+    archive_path = os.path.join(tmp_path, 'corpus.zip')
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('.verborgen.txt', 'Wordt overgeslagen')
+        archive.writestr('notities.unknown', 'Onbekend formaat')
+        archive.writestr('brief.txt', 'Een brief over een kat')
+
+    files = []
+    with pytest.raises(NotImplementedError, match='notities.unknown'):
+        for file in generic_file_importer.import_file(archive_path):
+            files.append(file)
+
+    assert [file.body.body for file in files] == ['Een brief over een kat']
+
+
+def test_members_are_read_when_opened(zip_path, mocker):
+    open_member = mocker.spy(zipfile.ZipFile, 'open')
+
+    member_names = [member.path for member
+                    in archive_reader.read_members(zip_path)]
+    assert len(member_names) == len(ARCHIVE_MEMBERS)
+    assert open_member.call_count == 0
+
+    for member in archive_reader.read_members(zip_path):
+        with archive_reader.open_file(member) as file:
+            first_read = file.read()
+        with archive_reader.open_file(member) as file:
+            second_read = file.read()
+        assert first_read == second_read
+        assert archive_reader.get_size(member) == len(first_read)
+    # Small members are only read from the archive once
+    assert open_member.call_count == len(ARCHIVE_MEMBERS)
+
+
+def test_open_member_outside_import(zip_path, tar_path):
+    for archive_path in [zip_path, tar_path]:
+        member_path = os.path.join(archive_path, 'verhalen',
+                                   'kattenverhaaltje 1.txt')
+        assert archive_reader.split_archive_path(member_path) == (
+            archive_path, 'verhalen/kattenverhaaltje 1.txt')
+
+        with archive_reader.open_text_file(member_path) as file:
+            text = file.read()
+        assert text.startswith('In een rustige buurt')
+        assert archive_reader.get_size(member_path) == os.path.getsize(
+            os.path.join(TEST_DATA_DIR, ARCHIVE_MEMBERS[
+                'verhalen/kattenverhaaltje 1.txt']))
+
+    with pytest.raises(FileNotFoundError):
+        archive_reader.open_file(os.path.join(zip_path, 'bestaat niet.txt'))
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,74 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from tommy.controller.file_import import date_parser as date_parser_module
+from tommy.controller.file_import.date_parser import (DateParser,
+                                                      parse_fuzzy_date)
+
+
+@pytest.fixture
+def date_parser():
+    return DateParser()
+
+
+@pytest.mark.parametrize("file_date", ["24 augustus 2021 dinsdag",
+                                       "dinsdag 24 augustus 2021",
+                                       "24 aug. 2021",
+                                       "1 Mei 2020"])
+def test_textual_dates_match_fuzzy_parser(date_parser, file_date):
+    assert date_parser.parse_dates([file_date]) == [
+        parse_fuzzy_date(file_date)]
+    assert date_parser.date_format == "textual"
+    assert date_parser.fallback_count == 0
+
+
+def test_infer_numeric_format(date_parser):
+    dates = date_parser.parse_dates(["05-03-2021", None, "31-12-2020"])
+
+    assert date_parser.date_format == "%d-%m-%Y"
+    assert dates == [datetime(2021, 3, 5), None, datetime(2020, 12, 31)]
+    assert date_parser.fallback_count == 0
+
+
+def test_outliers_use_fallback(date_parser):
+    dates = date_parser.parse_dates(["24 augustus 2021 dinsdag",
+                                     "25 augustus 2021 woensdag",
+                                     "26 augustus 2021 14:30",
+                                     "geen datum"])
+
+    assert date_parser.date_format == "textual"
+    assert dates == [datetime(2021, 8, 24), datetime(2021, 8, 25),
+                     datetime(2021, 8, 26, 14, 30), None]
+    assert date_parser.fallback_count == 2
+
+
+def test_repeated_dates_are_parsed_once(date_parser):
+    with patch.object(date_parser_module, "parse_fuzzy_date",
+                      wraps=parse_fuzzy_date) as fuzzy_parser:
+        date_parser.parse_dates(["geen datum"] * 10)
+        date_parser.parse_dates(["geen datum"])
+
+    fuzzy_parser.assert_called_once()
+    # Every date that needed the fuzzy parser is counted
+    assert date_parser.fallback_count == 11
+
+
+@pytest.mark.parametrize("dominant_date", ["05-03-2021", "2021-03-05"])
+def test_fallback_agrees_with_formats(date_parser, dominant_date):
+    dates = date_parser.parse_dates([dominant_date, dominant_date,
+                                     "2021-03-04"])
+
+    # A year-first date is read the same way whichever format dominates
+    assert dates[2] == datetime(2021, 3, 4)
+    assert parse_fuzzy_date("2021-03-04") == datetime(2021, 3, 4)
+    assert parse_fuzzy_date("04-03-2021") == datetime(2021, 3, 4)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,88 @@
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from tommy.controller.file_import.document_store import DocumentStore
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+from tommy.controller.file_import.metadata import Metadata
+
+# Test data directory
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data'))
+
+
+@pytest.fixture
+def generic_file_importer():
+    return GenericFileImporter()
+
+
+@pytest.fixture
+def document_store(generic_file_importer):
+    return DocumentStore(generic_file_importer, cache_size=2)
+
+
+@pytest.mark.parametrize('path', [
+    os.path.join('test_txt_files', 'correct_files', 'kattenverhaaltje 1.txt'),
+    os.path.join('test_csv_files', 'correct.csv'),
+    os.path.join('test_jsonl_files', 'correct.jsonl'),
+    os.path.join('test_docx_files', 'correct_files',
+                 'kattenverhaaltje 2.docx'),
+])
+def test_get_body(generic_file_importer, document_store, path):
+    files = list(generic_file_importer.import_file(
+        os.path.join(TEST_DATA_DIR, path)))
+
+    # Every document can be loaded on its own, in any order
+    for file in reversed(files):
+        assert document_store.get_body(file.metadata) == file.body
+
+
+def test_get_body_from_archive(generic_file_importer, document_store,
+                               tmp_path):
+    archive_path = os.path.join(tmp_path, 'corpus.zip')
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.write(os.path.join(TEST_DATA_DIR, 'test_jsonl_files',
+                                   'correct.jsonl'), 'artikelen.jsonl')
+    files = list(generic_file_importer.import_file(archive_path))
+
+    assert files[1].metadata.locator.path == os.path.join(archive_path,
+                                                          'artikelen.jsonl')
+    assert document_store.get_body(files[1].metadata) == files[1].body
+
+
+def test_get_body_is_cached(generic_file_importer, document_store,
+                            tmp_path):
+    path = os.path.join(tmp_path, 'kattenverhaaltje 1.txt')
+    shutil.copy(os.path.join(TEST_DATA_DIR, 'test_txt_files',
+                             'correct_files', 'kattenverhaaltje 1.txt'),
+                path)
+    file = next(generic_file_importer.import_file(path))
+    assert document_store.get_body(file.metadata) == file.body
+
+    # The text that was loaded last is kept in memory
+    os.remove(path)
+    assert document_store.get_body(file.metadata) == file.body
+
+    document_store.clear()
+    with pytest.raises(FileNotFoundError):
+        document_store.get_body(file.metadata)
+
+
+def test_get_body_without_locator(document_store):
+    with pytest.raises(ValueError):
+        document_store.get_body(Metadata("onbekend", 0, 0, "txt"))
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -4,7 +4,8 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from tommy.controller.file_import.docx_file_importer import DocxFileImporter
+from tommy.controller.file_import.docx_file_importer import (
+    DocxFileImporter, read_paragraphs)
 
 TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
                                              '..',
@@ -20,6 +21,33 @@ def docx_file_importer():
     return DocxFileImporter()
 
 
+@pytest.fixture
+def revised_docx_path(tmp_path):
+    """A Word file with tabs, revisions, a table and a text box"""
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+        'wordprocessingml/2006/main" xmlns:mc="http://schemas.'
+        'openxmlformats.org/markup-compatibility/2006" '
+        'xmlns:v="urn:schemas-microsoft-com:vml"><w:body>'
+        '<w:p><w:pPr><w:tabs><w:tab w:val="left"/></w:tabs></w:pPr>'
+        '<w:r><w:t>Een</w:t><w:tab/><w:t xml:space="preserve"> kat </w:t>'
+        '</w:r><w:del><w:r><w:delText>weg</w:delText></w:r></w:del>'
+        '<w:ins><w:r><w:t>erbij</w:t></w:r></w:ins>'
+        '<w:r><w:instrText>HYPERLINK</w:instrText></w:r></w:p>'
+        '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>cel</w:t></w:r></w:p></w:tc>'
+        '</w:tr></w:tbl>'
+        '<w:p><w:r><mc:AlternateContent><mc:Choice><w:t>nieuw</w:t>'
+        '</mc:Choice><mc:Fallback><w:pict><v:shape><v:textbox>'
+        '<w:txbxContent><w:p><w:r><w:t>doos</w:t></w:r></w:p>'
+        '</w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r><w:r><w:t>na</w:t></w:r></w:p>'
+        '</w:body></w:document>')
+    path = os.path.join(tmp_path, "herzien.docx")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return path
+
+
 def test_compatible_file(docx_file_importer):
     compatible_path = os.path.join(TEST_DATA_DIR,
                                    'correct_files',
@@ -36,8 +64,11 @@ def test_corrupted_file(docx_file_importer):
     corrupted_path = os.path.join(TEST_DATA_DIR,
                                   'corrupt_files',
                                   'hondenverhaaltje 1.docx')
+    # The file is not parsed when checking compatibility
+    assert docx_file_importer.compatible_file(corrupted_path)
+
     with pytest.raises(zipfile.BadZipFile) as exception_info:
-        docx_file_importer.compatible_file(corrupted_path)
+        list(docx_file_importer.load_file(corrupted_path))
 
 
 def test_load_file(docx_file_importer):
@@ -53,6 +84,13 @@ def test_load_file(docx_file_importer):
         assert file_text == "Verhaaltje over een kat"
 
 
+def test_read_paragraphs(revised_docx_path):
+    # Deleted text, field instructions and the alternative content of the
+    # text box are skipped, and the text box follows its paragraph
+    assert list(read_paragraphs(revised_docx_path)) == [
+        "Een\t kat erbij\n\n", "cel\n\n", "na\n\ndoos\n\n"]
+
+
 def test_generate_file(docx_file_importer):
     filepath = os.path.join(TEST_DATA_DIR,
                             'correct_files',
@@ -0,0 +1,116 @@
+import pytest
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.duplicate_filter import DuplicateFilter
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_body import RawBody
+from tommy.controller.file_import.raw_file import RawFile
+
+ARTICLE = ("Het kabinet heeft dinsdag bekendgemaakt dat de subsidie voor "
+           "zonnepanelen op daken van huurwoningen volgend jaar wordt "
+           "verhoogd. Volgens de minister moeten daardoor tienduizenden "
+           "woningen extra worden verduurzaamd, al waarschuwen "
+           "woningcorporaties dat er te weinig installateurs zijn om de "
+           "plannen op tijd uit te voeren. De oppositie noemt het voorstel "
+           "een stap in de goede richting, maar vindt het bedrag te laag.")
+
+
+def create_file(name: str, body: str) -> RawFile:
+    return RawFile(RawBody(body),
+                   Metadata(name, len(body), body.count(" ") + 1, "txt"))
+
+
+@pytest.fixture
+def files():
+    return [create_file("origineel", ARTICLE),
+            create_file("kopie", ARTICLE + "\n"),
+            # A syndicated copy with a different byline
+            create_file("overgenomen", "Den Haag (ANP) - " + ARTICLE),
+            create_file("ander artikel", "De gemeente Utrecht opent "
+                                         "volgende maand een nieuwe "
+                                         "bibliotheek in het centrum van "
+                                         "de stad, met plek voor duizend "
+                                         "bezoekers per dag."),
+            create_file("leeg", "")]
+
+
+def test_filter(files):
+    duplicate_filter = DuplicateFilter(threshold=0.8)
+    kept = list(duplicate_filter.filter(files))
+
+    assert [file.metadata.name for file in kept] == ["origineel",
+                                                     "ander artikel",
+                                                     "leeg"]
+    assert [metadata.name for metadata in duplicate_filter.removed] == [
+        "kopie", "overgenomen"]
+    assert all(metadata.duplicate_of == "origineel"
+               for metadata in duplicate_filter.removed)
+    assert kept[0].metadata.duplicate_of is None
+
+
+def test_filter_describes_original_row():
+    duplicate_filter = DuplicateFilter(threshold=None)
+    files = [create_file("artikelen.csv", ARTICLE),
+             create_file("artikelen.csv", ARTICLE)]
+    files[0].metadata.title = "Subsidie zonnepanelen"
+    files[0].metadata.locator = DocumentLocator("artikelen.csv", row=3)
+
+    kept = list(duplicate_filter.filter(files))
+
+    assert len(kept) == 1
+    assert duplicate_filter.removed[0].duplicate_of == (
+        "Subsidie zonnepanelen (artikelen.csv, document 3)")
+
+
+@pytest.mark.parametrize("locator, description", [
+    (None, "Titel"),
+    (DocumentLocator("a.jsonl"), "Titel"),
+    (DocumentLocator("a.jsonl", offset=120), "Titel (a.jsonl, byte 120)"),
+    (DocumentLocator("a.jsonl", row=2, offset=120),
+     "Titel (a.jsonl, document 2)")])
+def test_describe_original(locator, description):
+    metadata = Metadata("a.jsonl", 1, 1, "jsonl", title="Titel",
+                        locator=locator)
+
+    assert DuplicateFilter.describe_original(metadata) == description
+
+
+def test_filter_exact_only(files):
+    duplicate_filter = DuplicateFilter(threshold=None)
+    kept = list(duplicate_filter.filter(files))
+
+    assert [metadata.name for metadata in duplicate_filter.removed] == [
+        "kopie"]
+    assert len(kept) == 4
+
+
+def test_signature_similarity():
+    duplicate_filter = DuplicateFilter()
+    signature = duplicate_filter.signature(ARTICLE)
+    changed_signature = duplicate_filter.signature(
+        ARTICLE.replace("dinsdag", "woensdag"))
+
+    assert len(signature) == duplicate_filter.permutations
+    assert (duplicate_filter.signature(ARTICLE.upper()) == signature).all()
+    # Changing one word changes the shingles around it, so the estimated
+    # similarity is high but not exact
+    assert 0.6 < (signature == changed_signature).mean() < 1
+    assert duplicate_filter.signature("...") is None
+
+
+@pytest.mark.parametrize('threshold', [0.5, 0.8, 0.9, 0.95])
+def test_bands(threshold):
+    duplicate_filter = DuplicateFilter(threshold)
+    assert (duplicate_filter.bands * duplicate_filter.rows
+            == duplicate_filter.permutations)
+    band_threshold = ((1 / duplicate_filter.bands)
+                      ** (1 / duplicate_filter.rows))
+    assert band_threshold <= threshold
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
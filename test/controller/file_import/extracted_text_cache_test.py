@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+
+
+@pytest.fixture
+def extracted_text_cache(tmp_path):
+    return ExtractedTextCache(os.path.join(tmp_path, "cache"), 1 << 20)
+
+
+def create_file(folder, name: str, text: str) -> str:
+    path = os.path.join(folder, name)
+    with open(path, "w") as file:
+        file.write(text)
+    return path
+
+
+def test_get_stored_entry(extracted_text_cache, tmp_path):
+    path = create_file(tmp_path, "a.txt", "Verhaaltje over een kat")
+    key = extracted_text_cache.key(path, "txt", 1)
+
+    assert extracted_text_cache.get(key) is None
+    extracted_text_cache.put(key, {"text": "Verhaaltje over een kat"})
+    assert extracted_text_cache.get(key) == {
+        "text": "Verhaaltje over een kat"}
+
+
+def test_key_depends_on_file_and_version(extracted_text_cache, tmp_path):
+    first = create_file(tmp_path, "a.txt", "Verhaaltje over een kat")
+    second = create_file(tmp_path, "b.txt", "Verhaaltje over een kat")
+    key = extracted_text_cache.key(first, "txt", 1)
+
+    assert extracted_text_cache.key(first, "txt", 1) == key
+    assert extracted_text_cache.key(second, "txt", 1) != key
+    assert extracted_text_cache.key(first, "txt", 2) != key
+
+    # Changing the file changes its modification time and size
+    create_file(tmp_path, "a.txt", "Verhaaltje over een hond")
+    os.utime(first, ns=(1, 1))
+    assert extracted_text_cache.key(first, "txt", 1) != key
+
+
+def test_key_does_not_read_file(extracted_text_cache, tmp_path, mocker):
+    path = create_file(tmp_path, "a.txt", "Verhaaltje over een kat")
+    open_file = mocker.patch(
+        "tommy.controller.file_import.archive_reader.open_file")
+
+    extracted_text_cache.key(path, "txt", 1)
+
+    open_file.assert_not_called()
+
+
+def test_least_recently_used_entries_are_removed(tmp_path):
+    extracted_text_cache = ExtractedTextCache(str(tmp_path), 1 << 20)
+    paths = [create_file(tmp_path, f"{number}.txt", f"tekst {number}")
+             for number in range(3)]
+    keys = [extracted_text_cache.key(path, "txt", 1) for path in paths]
+    for number, key in enumerate(keys):
+        extracted_text_cache.put(key, {"text": f"tekst {number}"})
+        # Make the entries ordered by the time they were used
+        os.utime(extracted_text_cache._entry_path(key), (number, number))
+    entry_size = os.path.getsize(extracted_text_cache._entry_path(keys[0]))
+
+    # Using the first entry makes the second entry the least recently used
+    assert extracted_text_cache.get(keys[0]) is not None
+    # The cache is one byte too small for all three entries
+    extracted_text_cache.max_bytes = 3 * entry_size - 1
+    extracted_text_cache.prune()
+
+    assert extracted_text_cache.get(keys[0]) is not None
+    assert extracted_text_cache.get(keys[1]) is None
+    assert extracted_text_cache.get(keys[2]) is not None
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from tommy.controller.file_import.folder_crawler import (
+    FolderCrawler, IgnorePattern)
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+from tommy.controller.file_import.import_progress import CancelToken
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    files = ['brief.txt', 'foto.jpg', 'notities.xml', '.verborgen.txt',
+             'archief/artikel.pdf', 'archief/artikel.pdf.xml',
+             'archief/2021/verslag.docx', 'archief/2021/concept.txt',
+             'bijlagen/tabel.csv', '.git/config.txt']
+    for file in files:
+        path = os.path.join(tmp_path, *file.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('tekst')
+    return str(tmp_path)
+
+
+@pytest.fixture
+def is_supported():
+    return GenericFileImporter().has_supported_extension
+
+
+def relative_paths(folder, paths):
+    return [os.path.relpath(path, folder).replace(os.sep, '/')
+            for path in paths]
+
+
+def test_crawl(input_folder, is_supported):
+    crawler = FolderCrawler(is_supported)
+    paths = relative_paths(input_folder, crawler.crawl(input_folder))
+
+    # Files of a folder come before the files in its subfolders, and hidden
+    # files and folders are skipped
+    assert sorted(paths) == ['archief/2021/concept.txt',
+                             'archief/2021/verslag.docx',
+                             'archief/artikel.pdf', 'bijlagen/tabel.csv',
+                             'brief.txt']
+    assert paths.index('brief.txt') < paths.index('archief/artikel.pdf')
+    assert (paths.index('archief/artikel.pdf')
+            < paths.index('archief/2021/verslag.docx'))
+
+    # The unsupported files are only counted
+    assert crawler.statistics.unsupported_files == 3
+    assert len(crawler.statistics.describe()) == 1
+
+
+def test_exclude_patterns(input_folder, is_supported):
+    crawler = FolderCrawler(is_supported, ['bijlagen/', '**/2021/*.txt'])
+    paths = relative_paths(input_folder, crawler.crawl(input_folder))
+
+    assert sorted(paths) == ['archief/2021/verslag.docx',
+                             'archief/artikel.pdf', 'brief.txt']
+    assert crawler.statistics.excluded_files == 1
+    assert crawler.statistics.excluded_folders == 1
+
+
+def test_ignore_file(input_folder, is_supported):
+    with open(os.path.join(input_folder, '.tommyignore'), 'w') as file:
+        file.write('# Alleen de brief\n*.txt\n!/brief.txt\narchief\n')
+    crawler = FolderCrawler(is_supported)
+    paths = relative_paths(input_folder, crawler.crawl(input_folder))
+
+    assert sorted(paths) == ['bijlagen/tabel.csv', 'brief.txt']
+
+
+def test_limits(input_folder, is_supported):
+    crawler = FolderCrawler(is_supported, max_depth=1)
+    paths = relative_paths(input_folder, crawler.crawl(input_folder))
+    assert sorted(paths) == ['archief/artikel.pdf', 'bijlagen/tabel.csv',
+                             'brief.txt']
+    assert crawler.statistics.folders_too_deep == 1
+
+    crawler = FolderCrawler(is_supported, max_files=2)
+    assert len(list(crawler.crawl(input_folder))) == 2
+    assert crawler.statistics.file_limit_reached
+
+
+def test_cancel(input_folder, is_supported):
+    crawler = FolderCrawler(is_supported)
+    cancel_token = CancelToken()
+    paths = []
+    for path in crawler.crawl(input_folder, cancel_token):
+        paths.append(path)
+        cancel_token.cancel()
+
+    assert len(paths) == 1
+
+
+@pytest.mark.parametrize('pattern, path, is_directory, expected', [
+    ('*.jpg', 'foto.jpg', False, True),
+    ('*.jpg', 'archief/foto.jpg', False, True),
+    ('/foto.jpg', 'archief/foto.jpg', False, False),
+    ('archief/*.xml', 'archief/artikel.xml', False, True),
+    ('archief/*.xml', 'archief/2021/artikel.xml', False, False),
+    ('archief/**/*.xml', 'archief/2021/artikel.xml', False, True),
+    ('bijlagen/', 'bijlagen', True, True),
+    ('bijlagen/', 'bijlagen', False, False),
+    ('verslag?.doc[xm]', 'verslag1.docx', False, True),
+    ('verslag?.doc[!xm]', 'verslag1.docx', False, False),
+])
+def test_ignore_pattern(pattern, path, is_directory, expected):
+    assert IgnorePattern.parse(pattern).matches(path,
+                                                is_directory) == expected
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
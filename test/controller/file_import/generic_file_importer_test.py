@@ -1,5 +1,6 @@
 import os
 
+import pypdf
 import pytest
 
 from tommy.controller.file_import.generic_file_importer import \
@@ -51,6 +52,38 @@ def test_import_file_unknown(generic_file_importer):
     os.remove(unknown_path)
 
 
+
+def test_import_file_without_extension(generic_file_importer, tmp_path):
+    pdf_path = os.path.join(TEST_DATA_DIR, '..', 'test_pdf_files',
+                            'correct_files', 'kattenverhaaltje 2.pdf')
+    path = os.path.join(tmp_path, 'kattenverhaaltje')
+    with open(pdf_path, 'rb') as source, open(path, 'wb') as target:
+        target.write(source.read())
+
+    files = list(generic_file_importer.import_file(path))
+
+    assert len(files) == 1
+    assert files[0].metadata.format == "pdf"
+    assert files[0].body.body.strip() == "Verhaaltje over een kat"
+
+
+def test_import_file_only_parses_once(mocker):
+    generic_file_importer = GenericFileImporter()
+    pdf_path = os.path.join(TEST_DATA_DIR, '..', 'test_pdf_files',
+                            'correct_files', 'kattenverhaaltje 2.pdf')
+    pdf_reader = mocker.patch(
+        'tommy.controller.file_import.pdf_file_importer.PdfReader',
+        wraps=pypdf.PdfReader)
+
+    first_import = list(generic_file_importer.import_file(pdf_path))
+    assert pdf_reader.call_count == 1
+
+    # The second import uses the extracted text cache
+    second_import = list(generic_file_importer.import_file(pdf_path))
+    assert pdf_reader.call_count == 1
+    assert second_import == first_import
+
+
 """
 This program has been developed by students from the bachelor Computer Science
 at Utrecht University within the Software Project course.
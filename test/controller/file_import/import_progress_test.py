@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from tommy.controller.file_import.import_progress import (
+    CancelToken, ImportProgressTracker, get_file_type)
+from tommy.support.event_handler import EventHandler
+
+# Test data directory
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data'))
+
+
+@pytest.fixture
+def published():
+    return []
+
+
+@pytest.fixture
+def tracker(published):
+    progress_event = EventHandler()
+    progress_event.subscribe(published.append)
+    return ImportProgressTracker(progress_event, CancelToken(),
+                                 publish_interval=0)
+
+
+def test_cancel_token():
+    cancel_token = CancelToken()
+    assert not cancel_token.cancelled
+
+    cancel_token.cancel()
+    assert cancel_token.cancelled
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('map/verslag.PDF', 'pdf'),
+    ('map/artikelen.tar.gz', 'tar.gz'),
+    ('map/artikelen.zip', 'zip'),
+    ('map/LEESMIJ', 'onbekend'),
+])
+def test_get_file_type(path, expected):
+    assert get_file_type(path) == expected
+
+
+def test_tracker(tracker, published):
+    csv_path = os.path.join(TEST_DATA_DIR, 'test_csv_files', 'correct.csv')
+    txt_path = os.path.join(TEST_DATA_DIR, 'test_txt_files',
+                            'correct_files', 'kattenverhaaltje 1.txt')
+    tracker.file_found()
+    tracker.file_found()
+    assert published[-1].files_found == 2
+    assert published[-1].files_total is None
+
+    tracker.crawl_finished()
+    tracker.file_done(csv_path, 51, seconds=0.5)
+    # Files of which the metadata was already known are not counted in the
+    # throughput of their file type
+    tracker.file_done(txt_path, 1)
+    tracker.finish()
+
+    progress = published[-1]
+    assert progress.files_total == 2
+    assert progress.files_done == 2
+    assert progress.documents_done == 52
+    assert progress.bytes_done == (os.path.getsize(csv_path)
+                                   + os.path.getsize(txt_path))
+    assert list(progress.file_types) == ['csv']
+    assert progress.file_types['csv'].documents_per_second == 102
+    assert progress.finished
+    assert not progress.cancelled
+
+
+def test_tracker_throttles(published):
+    progress_event = EventHandler()
+    progress_event.subscribe(published.append)
+    tracker = ImportProgressTracker(progress_event, CancelToken(),
+                                    publish_interval=60)
+    for _ in range(10):
+        tracker.file_found()
+    tracker.crawl_finished()
+
+    # Only the end of the crawl is published within the interval
+    assert len(published) == 1
+    assert published[0].files_total == 10
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
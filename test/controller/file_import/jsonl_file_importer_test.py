@@ -0,0 +1,104 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from tommy.controller.file_import.jsonl_file_importer import (
+    JsonlFileImporter)
+
+# Test data directory
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data',
+                                             'test_jsonl_files'))
+
+
+@pytest.fixture
+def jsonl_file_importer():
+    return JsonlFileImporter()
+
+
+def test_compatible_file(jsonl_file_importer):
+    assert jsonl_file_importer.compatible_file(
+        os.path.join(TEST_DATA_DIR, 'correct.jsonl'))
+    assert not jsonl_file_importer.compatible_file(
+        os.path.join(TEST_DATA_DIR, 'correct.csv'))
+
+
+def test_load_file(jsonl_file_importer):
+    jsonl_path = os.path.join(TEST_DATA_DIR, 'correct.jsonl')
+    files = list(jsonl_file_importer.load_file(jsonl_path))
+
+    # The empty line is skipped
+    assert len(files) == 3
+    assert files[0].body.body == "Minoes is terug in de buurt."
+    assert files[0].metadata.title == "Kat gevonden"
+    assert files[0].metadata.author == "Anna"
+    assert files[0].metadata.url == "https://example.nl/kat"
+    assert files[0].metadata.date == datetime(2021, 8, 24)
+    assert files[0].metadata.format == "jsonl"
+    assert files[0].metadata.length == 6
+    assert files[0].metadata.size == os.path.getsize(jsonl_path)
+    assert files[1].metadata.author is None
+    # Documents without a title get the name of the file as title
+    assert files[2].metadata.title == "correct"
+
+
+def test_load_file_in_chunks(jsonl_file_importer):
+    jsonl_path = os.path.join(TEST_DATA_DIR, 'correct.jsonl')
+    files = list(jsonl_file_importer.load_file(jsonl_path))
+
+    jsonl_file_importer.chunk_size = 2
+    chunked_files = list(jsonl_file_importer.load_file(jsonl_path))
+
+    assert chunked_files == files
+
+
+def test_load_file_with_errors(jsonl_file_importer):
+    jsonl_path = os.path.join(TEST_DATA_DIR, 'incorrect.jsonl')
+    files = []
+    with pytest.raises(ExceptionGroup) as exception_info:
+        for file in jsonl_file_importer.load_file(jsonl_path):
+            files.append(file)
+
+    # The correct lines are still imported, the document with the date
+    # that could not be parsed without a date
+    assert [file.body.body for file in files] == ["Een goed document",
+                                                  "Rare datum"]
+    assert files[1].metadata.date is None
+
+    errors = exception_info.value.exceptions
+    assert [type(error) for error in errors] == [ValueError, KeyError,
+                                                 SyntaxWarning]
+    assert "Regel 2" in str(errors[0])
+    assert "regel 3" in str(errors[1])
+    assert "regel 4" in str(errors[2])
+
+
+def test_field_mapping(tmp_path):
+    jsonl_path = os.path.join(tmp_path, 'scraper.jsonl')
+    with open(jsonl_path, 'w', encoding='utf-8') as file:
+        file.write(json.dumps({"kop": "Kat gevonden",
+                               "tekst": "Minoes is terug.",
+                               "meta": {"auteur": "Anna"}}) + "\n")
+
+    importer = JsonlFileImporter({'body': 'tekst', 'title': 'kop',
+                                  'author': 'meta.auteur'})
+    files = list(importer.load_file(jsonl_path))
+
+    assert len(files) == 1
+    assert files[0].body.body == "Minoes is terug."
+    assert files[0].metadata.title == "Kat gevonden"
+    assert files[0].metadata.author == "Anna"
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
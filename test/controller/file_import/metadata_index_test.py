@@ -0,0 +1,170 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+from tommy.controller.file_import.jsonl_file_importer import (
+    JsonlFileImporter)
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.metadata_index import MetadataIndex
+from tommy.controller.file_import.pdf_file_importer import PdfFileImporter
+
+
+def create_file(folder, name: str, text: str) -> str:
+    path = os.path.join(folder, name)
+    with open(path, "w") as file:
+        file.write(text)
+    return path
+
+
+@pytest.fixture
+def input_folder(tmp_path) -> str:
+    folder = os.path.join(tmp_path, "invoer")
+    os.makedirs(folder)
+    return folder
+
+
+@pytest.fixture
+def index_folder(tmp_path) -> str:
+    return os.path.join(tmp_path, "cache")
+
+
+def test_lookup_unchanged_file(input_folder, index_folder):
+    path = create_file(input_folder, "a.txt", "Verhaaltje over een kat")
+    metadata = [Metadata(name="a", size=23, length=4, format="txt",
+                         date=datetime(2021, 8, 24, tzinfo=timezone.utc))]
+
+    index = MetadataIndex.load(input_folder, index_folder)
+    assert index.lookup(path, "txt-v1") is None
+    index.store(path, "txt-v1", metadata)
+    index.save()
+
+    assert (MetadataIndex.load(input_folder, index_folder)
+            .lookup(path, "txt-v1") == metadata)
+
+
+def test_index_not_stored_in_input_folder(input_folder, index_folder):
+    path = create_file(input_folder, "a.jsonl", '{"body": "Een kat"}\n')
+    metadata = [Metadata(name="a", size=20, length=2, format="jsonl",
+                         locator=DocumentLocator(path, row=1, offset=0))]
+    index = MetadataIndex.load(input_folder, index_folder)
+    index.store(path, "jsonl-v1", metadata)
+    index.save()
+
+    assert os.listdir(input_folder) == ["a.jsonl"]
+    assert os.path.isfile(index.index_path)
+    assert index.index_path.startswith(index_folder)
+    locator = (MetadataIndex.load(input_folder, index_folder)
+               .lookup(path, "jsonl-v1")[0].locator)
+    assert locator == DocumentLocator(path, row=1, offset=0)
+
+
+def test_folders_have_separate_indices(tmp_path, index_folder):
+    first_folder = os.path.join(tmp_path, "een")
+    second_folder = os.path.join(tmp_path, "twee")
+    os.makedirs(first_folder)
+    os.makedirs(second_folder)
+    path = create_file(first_folder, "a.txt", "Een")
+    index = MetadataIndex.load(first_folder, index_folder)
+    index.store(path, "txt-v1",
+                [Metadata(name="a", size=3, length=1, format="txt")])
+    index.save()
+
+    other_index = MetadataIndex.load(second_folder, index_folder)
+
+    assert other_index.index_path != index.index_path
+    assert other_index.lookup(
+        create_file(second_folder, "a.txt", "Een"), "txt-v1") is None
+
+
+def test_lookup_changed_file(input_folder, index_folder):
+    path = create_file(input_folder, "a.txt", "Verhaaltje over een kat")
+    index = MetadataIndex.load(input_folder, index_folder)
+    index.store(path, "txt-v1",
+                [Metadata(name="a", size=23, length=4, format="txt")])
+    index.save()
+
+    create_file(input_folder, "a.txt",
+                "Verhaaltje over een hond, en nog meer")
+
+    assert (MetadataIndex.load(input_folder, index_folder)
+            .lookup(path, "txt-v1") is None)
+
+
+def test_lookup_changed_importer(input_folder, index_folder):
+    path = create_file(input_folder, "a.txt", "Verhaaltje over een kat")
+    index = MetadataIndex.load(input_folder, index_folder)
+    index.store(path, "txt-v1",
+                [Metadata(name="a", size=23, length=4, format="txt")])
+    index.save()
+
+    assert (MetadataIndex.load(input_folder, index_folder)
+            .lookup(path, "txt-v2") is None)
+
+
+def test_importer_key_includes_settings():
+    importer = GenericFileImporter()
+    jsonl_importer = JsonlFileImporter({"body": "content"})
+
+    assert (jsonl_importer.index_key()
+            != JsonlFileImporter().index_key())
+    assert (PdfFileImporter(max_pages=2).index_key()
+            != PdfFileImporter(max_pages=3).index_key())
+    assert (importer.index_key("documenten.zip")
+            .startswith("ArchiveFileImporter-archive-v1"))
+    assert importer.index_key("documenten.onbekend") == ""
+
+
+def test_removed_files_are_not_saved(input_folder, index_folder):
+    first = create_file(input_folder, "a.txt", "Een")
+    second = create_file(input_folder, "b.txt", "Twee")
+    index = MetadataIndex.load(input_folder, index_folder)
+    index.store(first, "txt-v1",
+                [Metadata(name="a", size=3, length=1, format="txt")])
+    index.store(second, "txt-v1",
+                [Metadata(name="b", size=4, length=1, format="txt")])
+    index.save()
+
+    # Only the first file is still found in the folder
+    index = MetadataIndex.load(input_folder, index_folder)
+    index.lookup(first, "txt-v1")
+    index.save()
+
+    index = MetadataIndex.load(input_folder, index_folder)
+    assert index.lookup(first, "txt-v1") is not None
+    assert index.lookup(second, "txt-v1") is None
+
+
+def test_damaged_index_is_ignored(input_folder, index_folder):
+    path = create_file(input_folder, "a.txt", "Een")
+    index = MetadataIndex.load(input_folder, index_folder)
+    os.makedirs(os.path.dirname(index.index_path))
+    with open(index.index_path, "w") as file:
+        file.write("{geen json")
+
+    assert (MetadataIndex.load(input_folder, index_folder)
+            .lookup(path, "txt-v1") is None)
+
+
+def test_index_without_folder_is_not_stored(input_folder):
+    path = create_file(input_folder, "a.txt", "Een")
+    index = MetadataIndex.load(input_folder, None)
+    index.store(path, "txt-v1",
+                [Metadata(name="a", size=3, length=1, format="txt")])
+    index.save()
+
+    assert index.index_path is None
+    assert os.listdir(input_folder) == ["a.txt"]
+    assert MetadataIndex.load(input_folder, None).lookup(
+        path, "txt-v1") is None
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,90 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.metadata_table import MetadataTable
+
+
+@pytest.fixture
+def metadata():
+    return [Metadata(name="artikelen", size=300, length=12, format="csv",
+                     author="Anna", title="Kat gevonden",
+                     date=datetime(2021, 8, 24, 15, 30),
+                     path="artikelen.csv",
+                     locator=DocumentLocator("/map/artikelen.csv", row=1)),
+            Metadata(name="artikelen", size=300, length=7, format="csv",
+                     title="Hond zoek", path="artikelen.csv",
+                     locator=DocumentLocator("/map/artikelen.csv", row=2)),
+            Metadata(name="verslag", size=1200, length=250, format="pdf",
+                     date=datetime(2022, 1, 3, tzinfo=timezone.utc),
+                     duplicate_of="artikelen",
+                     locator=DocumentLocator("/map/verslag.pdf")),
+            Metadata(name="leeg", size=0, length=1, format="txt"),
+            Metadata(name="notitie", size=10, length=2, format="txt",
+                     date=date(2020, 5, 1))]
+
+
+@pytest.fixture
+def metadata_table(metadata):
+    return MetadataTable.from_metadata(metadata)
+
+
+def test_rows(metadata, metadata_table):
+    # Every row can be read back as the same Metadata object
+    assert len(metadata_table) == 5
+    assert list(metadata_table) == metadata
+    assert metadata_table[-1] == metadata[-1]
+    assert type(metadata_table[-1].date) is date
+    with pytest.raises(IndexError):
+        metadata_table[5]
+
+
+def test_columns(metadata_table):
+    assert metadata_table.column("length").tolist() == [12, 7, 250, 1, 2]
+    assert metadata_table.column("author").tolist() == ["Anna", None, None,
+                                                        None, None]
+    dates = metadata_table.column("date")
+    assert dates[0] == np.datetime64("2021-08-24T15:30")
+    assert np.isnat(dates[1])
+
+    # Equal strings are stored once
+    codes, categories = metadata_table.categories("name")
+    assert codes.tolist() == [1, 1, 2, 3, 4]
+    assert categories == [None, "artikelen", "verslag", "leeg", "notitie"]
+
+    with pytest.raises(KeyError):
+        metadata_table.column("locator")
+
+
+def test_take_and_concatenate(metadata, metadata_table):
+    assert list(metadata_table[2:]) == metadata[2:]
+    assert list(metadata_table.take([2, 0])) == [metadata[2], metadata[0]]
+
+    tables = [MetadataTable.from_metadata(metadata[2:]),
+              MetadataTable.from_metadata([]),
+              MetadataTable.from_metadata(metadata[:2])]
+    assert (list(MetadataTable.concatenate(tables))
+            == metadata[2:] + metadata[:2])
+
+
+def test_rows_without_metadata(metadata):
+    metadata_table = MetadataTable.from_metadata([metadata[0], None])
+
+    assert list(metadata_table) == [metadata[0], None]
+    assert metadata_table.column("length").tolist() == [12, 0]
+    assert np.isnat(metadata_table.column("date")[1])
+    assert list(metadata_table.take([1, 0])) == [None, metadata[0]]
+    assert list(MetadataTable.concatenate(
+        [metadata_table, MetadataTable.from_metadata(metadata[1:2])])) == [
+        metadata[0], None, metadata[1]]
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
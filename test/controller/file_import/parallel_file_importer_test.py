@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+from tommy.controller.file_import.import_progress import CancelToken
+from tommy.controller.file_import.parallel_file_importer import (
+    ParallelFileImporter, describe_fallback_dates, describe_unparsed_dates,
+    import_file_safely)
+
+# Test data directory
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data'))
+
+
+@pytest.fixture
+def parallel_file_importer():
+    return ParallelFileImporter(workers=2, chunk_size=1)
+
+
+def test_import_file_safely_collects_error():
+    path = os.path.join(TEST_DATA_DIR, 'test_pdf_files', 'corrupt_files',
+                        'hondenverhaaltje 5.pdf')
+    result = import_file_safely(path)
+
+    assert result.files == []
+    assert "hondenverhaaltje 5.pdf" in result.error
+
+
+def test_import_files_keeps_order(parallel_file_importer):
+    paths = [os.path.join(TEST_DATA_DIR, 'test_txt_files', 'correct_files',
+                          'kattenverhaaltje 2.txt'),
+             os.path.join(TEST_DATA_DIR, 'test_csv_files', 'correct.csv'),
+             os.path.join(TEST_DATA_DIR, 'test_txt_files', 'correct_files',
+                          'kattenverhaaltje 1.txt')]
+    results = list(parallel_file_importer.import_files(paths))
+
+    assert [result.path for result in results] == paths
+    assert [len(result.files) for result in results] == [1, 51, 1]
+    assert all(result.error is None for result in results)
+    assert results[0].files[0].metadata.name == "kattenverhaaltje 2"
+    assert results[2].files[0].metadata.name == "kattenverhaaltje 1"
+
+
+def test_fallback_dates_returned_from_workers(parallel_file_importer,
+                                              tmp_path):
+    path = os.path.join(tmp_path, "datums.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("body,date\n"
+                   "Een kat,24 augustus 2021 dinsdag\n"
+                   "Een hond,25 augustus 2021 woensdag\n"
+                   "Een muis,26 augustus 2021 14:30\n")
+
+    results = list(parallel_file_importer.import_files([path], True))
+
+    assert results[0].error is None
+    assert results[0].fallback_dates == 1
+    assert describe_fallback_dates(0) == []
+    assert len(describe_fallback_dates(results[0].fallback_dates)) == 1
+
+
+def test_unparsed_dates_returned_from_workers(parallel_file_importer,
+                                              tmp_path):
+    rtf_path = os.path.join(TEST_DATA_DIR, 'test_rtf_files',
+                            'correct_files', 'artikel 1.rtf')
+    with open(rtf_path, encoding="utf-8") as file:
+        content = file.read()
+    path = os.path.join(tmp_path, "artikel.rtf")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content.replace("24 augustus 2021 dinsdag",
+                                   "ergens in de zomer"))
+
+    results = list(parallel_file_importer.import_files([path], True))
+
+    assert results[0].error is None
+    assert len(results[0].metadata) == 1
+    assert results[0].unparsed_dates == 1
+    assert describe_unparsed_dates(0) == []
+    assert len(describe_unparsed_dates(results[0].unparsed_dates)) == 1
+
+
+def test_import_files_cancelled(parallel_file_importer):
+    paths = [os.path.join(TEST_DATA_DIR, 'test_txt_files', 'correct_files',
+                          f'kattenverhaaltje {number}.txt')
+             for number in (1, 2)]
+    cancel_token = CancelToken()
+    cancel_token.cancel()
+
+    assert list(parallel_file_importer.import_files(
+        paths, cancel_token=cancel_token)) == []
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
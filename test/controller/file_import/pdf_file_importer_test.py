@@ -35,8 +35,13 @@ def test_corrupted_file(pdf_file_importer):
     corrupted_path = os.path.join(TEST_DATA_DIR,
                             'corrupt_files',
                             'hondenverhaaltje 5.pdf')
-    with pytest.raises(pypdf.errors.PdfStreamError) as exception_info:
-        pdf_file_importer.compatible_file(corrupted_path)
+    # The file is not parsed when checking compatibility
+    assert pdf_file_importer.compatible_file(corrupted_path)
+
+    with pytest.raises(Exception) as exception_info:
+        list(pdf_file_importer.load_file(corrupted_path))
+    assert isinstance(exception_info.value.__cause__,
+                      pypdf.errors.PdfStreamError)
 
 
 def test_load_file(pdf_file_importer):
@@ -71,6 +76,40 @@ def test_generate_file(pdf_file_importer):
     assert file.metadata.title == 'kattenverhaaltje 1'
 
 
+
+@pytest.fixture
+def long_pdf_path(tmp_path):
+    """A PDF file with five copies of the page of a test file"""
+    page_path = os.path.join(TEST_DATA_DIR, 'correct_files',
+                             'kattenverhaaltje 2.pdf')
+    writer = pypdf.PdfWriter()
+    for _ in range(5):
+        writer.append(page_path)
+    path = os.path.join(tmp_path, 'lang verhaal.pdf')
+    writer.write(path)
+    return path
+
+
+def test_extract_pages_in_parallel(long_pdf_path):
+    serial_importer = PdfFileImporter()
+    parallel_importer = PdfFileImporter(page_workers=2)
+    parallel_importer.pages_per_task = 2
+
+    serial_text = serial_importer.extract_text(long_pdf_path)["text"]
+    parallel_text = parallel_importer.extract_text(long_pdf_path)["text"]
+
+    assert serial_text.count("Verhaaltje over een kat") == 5
+    assert parallel_text == serial_text
+
+
+def test_max_pages(long_pdf_path):
+    pdf_file_importer = PdfFileImporter(max_pages=2)
+
+    text = pdf_file_importer.extract_text(long_pdf_path)["text"]
+
+    assert text.count("Verhaaltje over een kat") == 2
+    assert pdf_file_importer.cache_name() == "pdf-max2"
+
 """
 This program has been developed by students from the bachelor Computer Science
 at Utrecht University within the Software Project course.
@@ -0,0 +1,97 @@
+import pytest
+from gensim.corpora import Dictionary
+
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.metadata_table import MetadataTable
+from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
+from tommy.controller.file_import.processed_file import ProcessedFile
+
+
+@pytest.fixture
+def documents() -> list[list[str]]:
+    return [["kat", "mat", "zitten", "kat"],
+            [],
+            ["hond", "kat", "blaffen"],
+            ["mat", "hond", "hond", "appel"]]
+
+
+@pytest.fixture
+def processed_corpus(documents) -> ProcessedCorpus:
+    return ProcessedCorpus(
+        [ProcessedFile(Metadata(f"document {index}", 0, len(tokens), "txt"),
+                       ProcessedBody(tokens))
+         for index, tokens in enumerate(documents)])
+
+
+def test_iterate_documents(processed_corpus, documents):
+    assert len(processed_corpus) == 4
+    assert [document.body.body for document in processed_corpus] == documents
+    assert ([document.metadata.name for document in processed_corpus]
+            == [f"document {index}" for index in range(4)])
+
+
+def test_tokens_are_stored_as_ids(processed_corpus):
+    assert processed_corpus.tokens.dtype.itemsize == 4
+    assert len(processed_corpus.vocabulary) == 6
+    assert processed_corpus.offsets.tolist() == [0, 4, 4, 7, 11]
+    assert isinstance(processed_corpus.metadata, MetadataTable)
+
+
+def test_dictionary_matches_gensim(processed_corpus, documents):
+    expected = Dictionary(documents)
+
+    dictionary = processed_corpus.to_dictionary()
+
+    assert dictionary.token2id == expected.token2id
+    assert dictionary.dfs == expected.dfs
+    assert dictionary.cfs == expected.cfs
+    assert dictionary.num_docs == expected.num_docs
+    assert dictionary.num_pos == expected.num_pos
+    assert dictionary.num_nnz == expected.num_nnz
+    assert dictionary[0] == expected[0]
+
+
+def test_bags_of_words_match_gensim(processed_corpus, documents):
+    dictionary = Dictionary(documents)
+    other_dictionary = Dictionary([["hond", "appel", "peer"]])
+
+    assert (processed_corpus.bags_of_words()
+            == [dictionary.doc2bow(tokens) for tokens in documents])
+    assert (processed_corpus.bags_of_words(other_dictionary.token2id)
+            == [other_dictionary.doc2bow(tokens) for tokens in documents])
+
+
+def test_take_documents(processed_corpus, documents):
+    taken = processed_corpus.take([3, 0])
+
+    assert ([document.body.body for document in taken]
+            == [documents[3], documents[0]])
+    assert ([document.metadata.name for document in taken]
+            == ["document 3", "document 0"])
+    assert isinstance(taken.metadata, MetadataTable)
+    assert taken.metadata.column("length").tolist() == [4, 4]
+    # Tokens that are not in the taken documents are left out
+    assert "blaffen" not in taken.vocabulary
+
+
+def test_from_documents_keeps_corpus(processed_corpus):
+    assert ProcessedCorpus.from_documents(processed_corpus) is processed_corpus
+    assert len(ProcessedCorpus.from_documents(list(processed_corpus))) == 4
+
+
+def test_empty_corpus():
+    processed_corpus = ProcessedCorpus()
+
+    assert not processed_corpus
+    assert list(processed_corpus) == []
+    assert processed_corpus.bags_of_words() == []
+    assert len(processed_corpus.to_dictionary()) == 0
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,94 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from tommy.controller.file_import.rtf_file_importer import RtfFileImporter
+
+TEST_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                             '..',
+                                             '..',
+                                             '..',
+                                             'test',
+                                             'test_data',
+                                             'test_rtf_files'))
+
+
+@pytest.fixture
+def rtf_file_importer():
+    return RtfFileImporter()
+
+
+def test_compatible_file(rtf_file_importer):
+    compatible_path = os.path.join(TEST_DATA_DIR, 'correct_files',
+                                   'artikel 1.rtf')
+    assert rtf_file_importer.compatible_file(compatible_path)
+    assert not rtf_file_importer.compatible_file(
+        compatible_path.replace('.rtf', '.txt'))
+
+
+def test_load_file(rtf_file_importer):
+    path = os.path.join(TEST_DATA_DIR, 'correct_files', 'artikel 1.rtf')
+    files = list(rtf_file_importer.load_file(path))
+
+    assert len(files) == 1
+    assert files[0].metadata.title == ("Bedreiging Complotdenker door "
+                                       "Spanje uitgezet naar NL")
+    assert files[0].metadata.date == datetime(2021, 8, 24)
+    assert files[0].metadata.format == "rtf"
+    assert files[0].metadata.size == os.path.getsize(path)
+    # The text between the 'Body' and 'Graphic' lines, without empty lines
+    assert files[0].body.body == (
+        "Joost Knevel werd op verzoek van het Nederlandse OM in Spanje "
+        "aangehouden. De complotdenker wordt verdacht van bedreiging en "
+        "één keer opruiing.")
+
+
+def test_load_file_with_long_title(rtf_file_importer):
+    path = os.path.join(TEST_DATA_DIR, 'correct_files', 'artikel 2.rtf')
+    file = next(rtf_file_importer.load_file(path))
+
+    # The title continues on the second line and the quotes are removed
+    assert file.metadata.title == ("In de ban van het complot; "
+                                   "Amateur-speurneuzen maken het leven van "
+                                   "slachtoffers tot een hel")
+    assert file.metadata.date == datetime(2021, 8, 28)
+    assert file.body.body == ("Het is vaste prik bij mediagevoelige "
+                              "drama's. Amateur-speurneuzen gaan zich "
+                              "ongevraagd met de zaak bemoeien.")
+
+
+def test_load_file_with_unparsed_date(rtf_file_importer, tmp_path):
+    with open(os.path.join(TEST_DATA_DIR, 'correct_files', 'artikel 1.rtf'),
+              encoding='utf-8') as rtf_file:
+        content = rtf_file.read()
+    path = os.path.join(tmp_path, 'artikel.rtf')
+    with open(path, 'w', encoding='utf-8') as rtf_file:
+        rtf_file.write(content.replace('24 augustus 2021 dinsdag',
+                                       'ergens in de zomer'))
+
+    # The article is loaded without a date instead of failing
+    files = list(rtf_file_importer.load_file(path))
+
+    assert len(files) == 1
+    assert files[0].metadata.date is None
+    assert rtf_file_importer.unparsed_date_count() == 1
+
+    list(rtf_file_importer.load_file(
+        os.path.join(TEST_DATA_DIR, 'correct_files', 'artikel 1.rtf')))
+    assert rtf_file_importer.unparsed_date_count() == 0
+
+
+def test_load_incorrect_file(rtf_file_importer):
+    path = os.path.join(TEST_DATA_DIR, 'incorrect_files',
+                        'leeg artikel.rtf')
+    with pytest.raises(ValueError):
+        list(rtf_file_importer.load_file(path))
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+from gensim.corpora import Dictionary
+
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
+from tommy.controller.file_import.processed_file import ProcessedFile
+from tommy.controller.file_import.streamed_corpus import StreamedCorpus
+from tommy.controller.topic_modelling_runners.lda_runner import LdaRunner
+from tommy.model.topic_model import TopicModel
+
+
+@pytest.fixture
+def documents() -> list[list[str]]:
+    return [["kat", "mat", "zitten", "kat"],
+            [],
+            ["hond", "kat", "blaffen"],
+            ["mat", "hond", "hond", "appel"]]
+
+
+@pytest.fixture
+def processed_files(documents) -> list[ProcessedFile]:
+    return [ProcessedFile(Metadata(f"document {index}", 0, len(tokens),
+                                   "txt"),
+                          ProcessedBody(tokens))
+            for index, tokens in enumerate(documents)]
+
+
+@pytest.fixture
+def streamed_corpus(processed_files) -> StreamedCorpus:
+    # The files are written while they are produced
+    return StreamedCorpus.from_documents(iter(processed_files))
+
+
+def test_iterate_documents(streamed_corpus, documents):
+    assert len(streamed_corpus) == 4
+    # The order of the tokens within a document is not stored
+    assert ([sorted(document.body.body) for document in streamed_corpus]
+            == [sorted(tokens) for tokens in documents])
+    assert ([document.metadata.name for document in streamed_corpus]
+            == [f"document {index}" for index in range(4)])
+
+
+def test_dictionary_matches_processed_corpus(streamed_corpus,
+                                             processed_files):
+    expected = ProcessedCorpus(processed_files).to_dictionary()
+
+    dictionary = streamed_corpus.to_dictionary()
+
+    assert dictionary.token2id == expected.token2id
+    assert dictionary.dfs == expected.dfs
+    assert dictionary.cfs == expected.cfs
+    assert dictionary.num_docs == expected.num_docs
+    assert dictionary.num_pos == expected.num_pos
+    assert dictionary.num_nnz == expected.num_nnz
+
+
+def test_bags_of_words_match_gensim(streamed_corpus, documents):
+    dictionary = Dictionary(documents)
+    other_dictionary = Dictionary([["hond", "appel", "peer"]])
+
+    # The bags of words can be read more than once
+    for _ in range(2):
+        assert (list(streamed_corpus.bags_of_words())
+                == [dictionary.doc2bow(tokens) for tokens in documents])
+    assert (list(streamed_corpus.bags_of_words(other_dictionary.token2id))
+            == [other_dictionary.doc2bow(tokens) for tokens in documents])
+
+
+def test_take_documents(streamed_corpus, documents):
+    taken = streamed_corpus.take([3, 0])
+
+    assert ([sorted(document.body.body) for document in taken]
+            == [sorted(documents[3]), sorted(documents[0])])
+    assert ([metadata.name for metadata in taken.metadata]
+            == ["document 3", "document 0"])
+    assert (taken.take([1]).get_token_ids(0).tolist()
+            == streamed_corpus.get_token_ids(0).tolist())
+
+
+def test_from_documents_keeps_corpus(streamed_corpus):
+    assert StreamedCorpus.from_documents(streamed_corpus) is streamed_corpus
+    assert ProcessedCorpus.from_documents(streamed_corpus) is streamed_corpus
+
+
+def test_empty_corpus():
+    streamed_corpus = StreamedCorpus.from_documents([])
+
+    assert not streamed_corpus
+    assert list(streamed_corpus) == []
+    assert list(streamed_corpus.bags_of_words()) == []
+    assert len(streamed_corpus.to_dictionary()) == 0
+
+
+def test_files_removed_when_unused(streamed_corpus):
+    folder = streamed_corpus._folder.name
+    assert os.path.isdir(folder)
+
+    streamed_corpus._folder.cleanup()
+
+    assert not os.path.exists(folder)
+
+
+def test_lda_trained_on_stream_matches_memory(processed_files):
+    in_memory = LdaRunner(TopicModel(), ProcessedCorpus(processed_files),
+                          0, 2)
+    streamed = LdaRunner(TopicModel(),
+                         StreamedCorpus.from_documents(processed_files),
+                         0, 2)
+
+    assert (streamed.get_topics_with_scores(3)
+            == in_memory.get_topics_with_scores(3))
+    for (_, streamed_probabilities), (_, probabilities) in zip(
+            streamed._topic_model.document_topics,
+            in_memory._topic_model.document_topics):
+        assert streamed_probabilities == pytest.approx(probabilities)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
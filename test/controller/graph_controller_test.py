@@ -5,6 +5,7 @@ from pytest_mock import MockerFixture
 
 from tommy.controller.corpus_controller import (
     CorpusController)
+from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.file_import.processed_body import ProcessedBody
 from tommy.controller.file_import.processed_corpus import ProcessedCorpus
 from tommy.controller.file_import.processed_file import ProcessedFile
@@ -216,7 +217,8 @@ def test_visualizations_available(graph_controller: GraphController):
 
     processed_corpus = ProcessedCorpus()
     processed_corpus.documents = [
-        ProcessedFile(None, ProcessedBody([f"doc{i}"])) for i in range(10)]
+        ProcessedFile(Metadata(f"doc{i}", 0, 1, "txt"),
+                      ProcessedBody([f"doc{i}"])) for i in range(10)]
 
     graph_controller._current_topic_runner = LdaRunner(topic_model,
                                                        processed_corpus, 0, 5)
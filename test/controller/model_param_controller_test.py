@@ -4,6 +4,7 @@ from tommy.controller.model_parameters_controller import (
     ModelParametersController)
 from tommy.model.model_parameters_model import ModelParametersModel
 from tommy.support.model_type import ModelType
+from tommy.support.preprocessing_profile import PreprocessingProfile
 
 
 @pytest.fixture(scope='function')
@@ -63,6 +64,29 @@ def test_set_get_model_type(
     assert model_parameters_controller.get_model_type() == ModelType.NMF
 
 
+def test_set_get_preprocessing_profile(
+        model_parameters_controller: ModelParametersController):
+    assert (model_parameters_controller.get_preprocessing_profile()
+            == PreprocessingProfile.Full)
+    model_parameters_controller.set_preprocessing_profile(
+        PreprocessingProfile.Throughput)
+    assert (model_parameters_controller.get_preprocessing_profile()
+            == PreprocessingProfile.Throughput)
+
+
+def test_preprocessing_profile_saved_in_dict():
+    model = ModelParametersModel()
+    model.preprocessing_profile = PreprocessingProfile.Throughput
+    model_dict = model.to_dict()
+    assert (ModelParametersModel.from_dict(model_dict).preprocessing_profile
+            == PreprocessingProfile.Throughput)
+
+    # projects saved before there were profiles use the full pipeline
+    del model_dict["preprocessing_profile"]
+    assert (ModelParametersModel.from_dict(model_dict).preprocessing_profile
+            == PreprocessingProfile.Full)
+
+
 """
 This program has been developed by students from the bachelor Computer Science
 at Utrecht University within the Software Project course.
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import pytest
+import spacy
+
+from tommy.controller.pipeline_registry import (
+    PipelineRegistry, bundled_lemma_lookups_version)
+from tommy.support.preprocessing_profile import PreprocessingProfile
+from tommy.support.supported_languages import SupportedLanguage
+
+
+@pytest.fixture
+def spacy_load():
+    with patch("tommy.controller.pipeline_registry.spacy.load",
+               side_effect=lambda *args, **kwargs: spacy.blank("nl")
+               ) as spacy_load:
+        yield spacy_load
+
+
+def test_pipeline_loaded_once_on_first_use(spacy_load):
+    registry = PipelineRegistry(1 << 30)
+    assert not registry.is_loaded(SupportedLanguage.Dutch)
+    spacy_load.assert_not_called()
+
+    nlp = registry.get_pipeline(SupportedLanguage.Dutch)
+
+    assert registry.get_pipeline(SupportedLanguage.Dutch) is nlp
+    assert registry.is_loaded(SupportedLanguage.Dutch)
+    assert "merge_entities" in nlp.pipe_names
+    spacy_load.assert_called_once()
+
+
+def test_least_recently_used_pipeline_unloaded(spacy_load):
+    registry = PipelineRegistry(15)
+    with patch.object(PipelineRegistry, "_estimate_size", return_value=10):
+        registry.get_pipeline(SupportedLanguage.Dutch)
+        registry.get_pipeline(SupportedLanguage.English)
+
+    # The pipeline that was used last is kept, even though it exceeds the
+    # budget on its own
+    assert not registry.is_loaded(SupportedLanguage.Dutch)
+    assert registry.is_loaded(SupportedLanguage.English)
+
+
+def test_warm_up_loads_in_background(spacy_load):
+    registry = PipelineRegistry(1 << 30)
+
+    registry.warm_up(SupportedLanguage.English).join()
+
+    assert registry.is_loaded(SupportedLanguage.English)
+    registry.get_pipeline(SupportedLanguage.English)
+    spacy_load.assert_called_once()
+
+
+def test_pipeline_id_does_not_load_pipeline(spacy_load):
+    registry = PipelineRegistry(1 << 30)
+
+    dutch_id = registry.get_pipeline_id(SupportedLanguage.Dutch)
+
+    assert "nl_core_news_sm" in dutch_id
+    assert dutch_id != registry.get_pipeline_id(SupportedLanguage.English)
+    spacy_load.assert_not_called()
+
+
+def test_throughput_pipeline_id_names_lemma_table():
+    registry = PipelineRegistry(1 << 30)
+
+    pipeline_id = registry.get_pipeline_id(SupportedLanguage.Dutch,
+                                           PreprocessingProfile.Throughput)
+
+    assert pipeline_id.endswith(
+        f"-throughput-lookups{bundled_lemma_lookups_version}")
+
+
+def test_lemma_table_loaded_from_data_folder():
+    lookups = PipelineRegistry._load_lemma_lookups("nl")
+
+    assert lookups.get_table("lemma_lookup")["honden"] == "hond"
+
+
+def test_missing_lemma_table_raises_error():
+    with pytest.raises(OSError, match="lemma table"):
+        PipelineRegistry._load_lemma_lookups("xx")
+
+
+def test_sentence_tokenizer_loaded_once():
+    registry = PipelineRegistry(1 << 30)
+
+    tokenizer = registry.get_sentence_tokenizer(SupportedLanguage.Dutch)
+
+    assert (registry.get_sentence_tokenizer(SupportedLanguage.Dutch)
+            is tokenizer)
+    assert tokenizer.tokenize("Dit is een zin. Dit ook.") == [
+        "Dit is een zin.", "Dit ook."]
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
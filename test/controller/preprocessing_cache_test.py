@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from tommy.controller.preprocessing_cache import PreprocessingCache
+
+
+@pytest.fixture
+def preprocessing_cache(tmp_path):
+    return PreprocessingCache(os.path.join(tmp_path, "cache"), 1 << 20)
+
+
+def create_analysis(*lemmas: str) -> dict[str, list[str]]:
+    return {"lemmas": list(lemmas),
+            "pos": ["NOUN"] * len(lemmas),
+            "entity_types": [""] * len(lemmas)}
+
+
+def test_get_stored_entry(preprocessing_cache):
+    key = preprocessing_cache.key("De kat zat op de mat", "Dutch-pipeline")
+    analysis = create_analysis("kat", "zitten", "mat")
+
+    assert preprocessing_cache.get(key) is None
+    preprocessing_cache.put(key, analysis)
+    assert preprocessing_cache.get(key) == analysis
+
+
+def test_key_depends_on_text_and_pipeline(preprocessing_cache):
+    key = preprocessing_cache.key("De kat zat op de mat", "Dutch-pipeline")
+
+    assert key == preprocessing_cache.key("De kat zat op de mat",
+                                          "Dutch-pipeline")
+    assert key != preprocessing_cache.key("De hond zat op de mat",
+                                          "Dutch-pipeline")
+    assert key != preprocessing_cache.key("De kat zat op de mat",
+                                          "English-pipeline")
+
+
+def test_least_recently_used_entries_are_removed(tmp_path):
+    preprocessing_cache = PreprocessingCache(str(tmp_path), 1 << 20)
+    keys = [preprocessing_cache.key(f"tekst {number}", "Dutch-pipeline")
+            for number in range(3)]
+    for number, key in enumerate(keys):
+        preprocessing_cache.put(key, create_analysis(f"woord{number}"))
+        # Make the entries ordered by the time they were used
+        os.utime(preprocessing_cache._entry_path(key), (number, number))
+    entry_size = os.path.getsize(preprocessing_cache._entry_path(keys[0]))
+
+    # Using the first entry makes the second entry the least recently used
+    assert preprocessing_cache.get(keys[0]) is not None
+    # The cache is one byte too small for all three entries
+    preprocessing_cache.max_bytes = 3 * entry_size - 1
+    preprocessing_cache.prune()
+
+    assert preprocessing_cache.get(keys[0]) is not None
+    assert preprocessing_cache.get(keys[1]) is None
+    assert preprocessing_cache.get(keys[2]) is not None
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
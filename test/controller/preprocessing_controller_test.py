@@ -1,14 +1,26 @@
+import itertools
+import os
 from unittest.mock import patch
 
 import pytest
+import spacy
 import spacy.tokens
 
 from tommy.controller.controller import Controller
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.processed_file import ProcessedFile
+from tommy.controller.file_import.raw_body import RawBody
+from tommy.controller.file_import.raw_file import RawFile
 from tommy.controller.language_controller import LanguageController
+from tommy.controller.preprocessing_cache import PreprocessingCache
 from tommy.controller.preprocessing_controller import PreprocessingController
 from tommy.controller.stopwords_controller import StopwordsController
+from tommy.model.model_parameters_model import ModelParametersModel
 from tommy.model.stopwords_model import StopwordsModel
 from tommy.model.synonyms_model import SynonymsModel
+from tommy.support.application_settings import application_settings
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.supported_languages import SupportedLanguage
 
 
@@ -109,6 +121,340 @@ def test_process_text_english(preprocessing_controller_english,
     assert "token2" in tokens
 
 
+@pytest.fixture()
+def throughput_controller_dutch(language_controller_dutch,
+                                stopwords_model_dutch, empty_synonyms_model):
+    model_parameters_model = ModelParametersModel()
+    model_parameters_model.preprocessing_profile = (
+        PreprocessingProfile.Throughput)
+    controller = PreprocessingController()
+    controller.set_model_refs(stopwords_model_dutch, empty_synonyms_model,
+                              model_parameters_model)
+    controller.set_controller_refs(language_controller_dutch)
+    return controller
+
+
+@pytest.fixture()
+def full_controller_dutch(language_controller_dutch, stopwords_model_dutch,
+                          empty_synonyms_model):
+    model_parameters_model = ModelParametersModel()
+    model_parameters_model.preprocessing_profile = PreprocessingProfile.Full
+    controller = PreprocessingController()
+    controller.set_model_refs(stopwords_model_dutch, empty_synonyms_model,
+                              model_parameters_model)
+    controller.set_controller_refs(language_controller_dutch)
+    return controller
+
+
+def test_throughput_profile_only_lemmatizes(throughput_controller_dutch):
+    """
+    Test that the throughput profile does not run the trained components
+    of the SpaCy pipeline.
+    """
+    assert throughput_controller_dutch._get_nlp().pipe_names == [
+        "lemmatizer"]
+    assert throughput_controller_dutch.pipeline_id.endswith(
+        f"-v{PreprocessingController.analysis_version}")
+    assert "throughput" in throughput_controller_dutch.pipeline_id
+
+
+def test_process_text_throughput(throughput_controller_dutch):
+    """
+    Test that the throughput profile removes stopwords, short words and
+    words that look like numbers and dates.
+    """
+    text = ("Op 12-03-2024 om 10:30 stegen de prijzen met 3,5% tot 2000 "
+            "euro, voor de 2de keer.")
+    tokens = throughput_controller_dutch.process_text(text)
+
+    assert "prijzen" in tokens or "prijs" in tokens
+    assert "euro" in tokens
+    assert not any(character.isdigit() for token in tokens
+                   for character in token)
+    assert all(token == token.lower() for token in tokens)
+    assert "voor" not in tokens
+
+
+def test_throughput_profile_uses_lemma_table(throughput_controller_dutch):
+    """
+    Test that the throughput profile looks up the lemmas in the table that
+    is shipped in the data folder.
+    """
+    tokens = throughput_controller_dutch.process_text(
+        "De honden hebben gisteren urenlang gelopen.")
+
+    assert "hond" in tokens
+    assert "lopen" in tokens
+
+
+@pytest.mark.skipif("TOMMY_SLOW_TESTS" not in os.environ,
+                    reason="Slow test, set TOMMY_SLOW_TESTS to run it")
+def test_throughput_profile_overlaps_full_profile(
+        full_controller_dutch, throughput_controller_dutch):
+    """
+    Compare the tokens of the throughput profile with those of the full
+    profile on a few hundred texts. The test only runs when the
+    TOMMY_SLOW_TESTS environment variable is set, and is skipped when the
+    weights of the SpaCy pipeline are not available.
+    """
+    try:
+        full_controller_dutch._get_nlp()
+    except OSError:
+        pytest.skip("The weights of the SpaCy pipeline are not available")
+
+    sentences = ["De gemeenteraad van Utrecht heeft dinsdag ingestemd met "
+                 "de bouw van duizend nieuwe woningen.",
+                 "Volgens de wethouder moeten de eerste huizen over twee "
+                 "jaar klaar zijn.",
+                 "Omwonenden maken zich zorgen over de drukte in de "
+                 "smalle straten van de wijk.",
+                 "De provincie betaalt een deel van de kosten van de "
+                 "nieuwe fietsbrug over het kanaal.",
+                 "Bewoners konden hun mening geven tijdens een drukbezochte "
+                 "avond in het buurthuis.",
+                 "De oppositie vindt dat er te weinig sociale huurwoningen "
+                 "worden gebouwd.",
+                 "Het college wil de plannen na de zomer verder uitwerken "
+                 "met de woningcorporaties.",
+                 "Ondernemers in het centrum verwachten meer klanten door "
+                 "de komst van de nieuwe bewoners."]
+    # Every text is different, so no text is taken from the cache
+    texts = [" ".join(combination)
+             for combination in itertools.permutations(sentences, 3)]
+
+    tokens = {}
+    for name, controller in [("full", full_controller_dutch),
+                             ("throughput", throughput_controller_dutch)]:
+        tokens[name] = list(controller.process_texts(texts, n_process=1))
+
+    # The part of the tokens of the full profile that the throughput
+    # profile also finds in the same text
+    found = sum(min(full_tokens.count(token),
+                    throughput_tokens.count(token))
+                for full_tokens, throughput_tokens
+                in zip(tokens["full"], tokens["throughput"])
+                for token in set(full_tokens))
+    overlap = found / sum(len(full_tokens) for full_tokens in tokens["full"])
+
+    assert overlap >= 0.5
+
+
+def test_split_into_chunks(throughput_controller_dutch):
+    """
+    Test that long texts are split into chunks on paragraph and sentence
+    boundaries.
+    """
+    text = ("De kat zat op de mat. Zij sliep lang.\n\n"
+            "De hond blafte hard naar de kat. De kat schrok wakker. "
+            "Daarna rende de kat het huis uit.")
+    with patch.object(application_settings, "preprocessing_chunk_size", 60):
+        chunks = throughput_controller_dutch._split_into_chunks(text)
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 60 for chunk in chunks)
+    assert chunks[0] == "De kat zat op de mat. Zij sliep lang.\n\n"
+    assert chunks[1] == ("De hond blafte hard naar de kat. "
+                         "De kat schrok wakker. ")
+    assert throughput_controller_dutch._split_into_chunks(text) == [text]
+
+
+def test_process_long_text_in_chunks(throughput_controller_dutch):
+    """
+    Test that processing a long text in chunks gives the same tokens as
+    processing it at once.
+    """
+    text = " ".join(["De kat zat op de mat in Utrecht.",
+                     "Daarna rende de hond door de tuin naar het huis."]
+                    * 20)
+    tokens = throughput_controller_dutch.process_text(text)
+    with patch.object(application_settings, "preprocessing_chunk_size", 50):
+        assert throughput_controller_dutch.process_text(text) == tokens
+        assert list(throughput_controller_dutch.process_texts(
+            ["Een korte tekst over katten.", text])) == [
+            throughput_controller_dutch.process_text(
+                "Een korte tekst over katten."), tokens]
+
+
+def test_process_texts(preprocessing_controller_dutch,
+                       stopwords_model_dutch, empty_synonyms_model):
+    """
+    Test that processing texts in batches gives the same tokens as
+    processing them one by one.
+    """
+    preprocessing_controller_dutch.set_model_refs(stopwords_model_dutch,
+                                                  empty_synonyms_model)
+    texts = ["Dit is een test zin token2.",
+             "De kat zat op de mat in Utrecht.",
+             "Op 3 mei 2021 kocht Anna twee fietsen."]
+
+    tokens = list(preprocessing_controller_dutch.process_texts(
+        texts, batch_size=2))
+
+    assert tokens == [preprocessing_controller_dutch.process_text(text)
+                      for text in texts]
+
+
+def test_process_files(preprocessing_controller_dutch,
+                       stopwords_model_dutch, empty_synonyms_model):
+    """
+    Test that processed files are yielded in order with their metadata.
+    """
+    preprocessing_controller_dutch.set_model_refs(stopwords_model_dutch,
+                                                  empty_synonyms_model)
+    files = [RawFile(RawBody(f"Dit is test zin nummer {number}."),
+                     Metadata(f"bestand {number}", 0, 6, "txt"))
+             for number in range(10)]
+
+    processed_files = list(preprocessing_controller_dutch.process_files(
+        iter(files), batch_size=3))
+
+    assert ([file.metadata for file in processed_files]
+            == [file.metadata for file in files])
+    assert all("test" in file.body.body for file in processed_files)
+
+
+def test_process_files_uses_cache(preprocessing_controller_dutch,
+                                  stopwords_model_dutch, empty_synonyms_model,
+                                  tmp_path):
+    """
+    Test that texts that were processed before are taken from the
+    preprocessing cache instead of running the pipeline again.
+    """
+    preprocessing_controller_dutch.set_model_refs(stopwords_model_dutch,
+                                                  empty_synonyms_model)
+    cache = preprocessing_controller_dutch._preprocessing_cache
+    preprocessing_controller_dutch._preprocessing_cache = (
+        PreprocessingCache(str(tmp_path), 1 << 20))
+    files = [RawFile(RawBody(f"De kat zat op mat nummer {number}."),
+                     Metadata(f"bestand {number}", 0, 7, "txt"))
+             for number in range(5)]
+
+    try:
+        first_run = list(preprocessing_controller_dutch.process_files(
+            files[::2], batch_size=2))
+        with patch.object(preprocessing_controller_dutch, "analyze",
+                          wraps=preprocessing_controller_dutch.analyze
+                          ) as analyze:
+            second_run = list(preprocessing_controller_dutch.process_files(
+                files, batch_size=2))
+    finally:
+        preprocessing_controller_dutch._preprocessing_cache = cache
+
+    # Only the files that were not processed before went through the
+    # pipeline, and the files are still in order
+    assert analyze.call_count == 2
+    assert ([file.metadata for file in second_run]
+            == [file.metadata for file in files])
+    assert ([file.body.body for file in second_run[::2]]
+            == [file.body.body for file in first_run])
+
+
+def test_cached_texts_read_in_windows(throughput_controller_dutch):
+    """
+    Test that texts that are all cached are yielded while the texts are
+    read, instead of after the whole stream has been read.
+    """
+    texts = [f"De kat zat op mat {word}." for word in
+             ["rood", "groen", "blauw", "geel", "paars", "wit", "zwart"]]
+    expected = list(throughput_controller_dutch.process_texts(texts))
+    read = []
+
+    def read_texts():
+        for text in texts:
+            read.append(text)
+            yield text
+
+    with patch.object(PreprocessingController, "_cache_window_batches", 1):
+        processed = throughput_controller_dutch.process_texts(
+            read_texts(), batch_size=2, n_process=1)
+        first = next(processed)
+        assert len(read) == 2
+        assert [first] + list(processed) == expected
+
+
+def test_lemmatize():
+    """
+    Test that lemmatizing keeps the lemmas of meaningful tokens in lower
+    case, without applying stopwords or synonyms.
+    """
+    preprocessing_controller = PreprocessingController()
+    preprocessing_controller._enable_pos = True
+    preprocessing_controller._pos_categories = {"NOUN", "VERB"}
+    preprocessing_controller._entity_categories = {"DATE"}
+    strings = ["", "Kat", "zitten", "op", "mei", "de", "   ", "Mat", "NOUN",
+               "VERB", "ADP", "DET", "SPACE", "DATE"]
+    analysis = {"strings": strings,
+                "lemmas": [1, 2, 3, 4, 5, 6, 7],
+                "pos": [8, 9, 10, 8, 11, 12, 8],
+                "entity_types": [0, 0, 0, 13, 0, 0, 0]}
+
+    assert (preprocessing_controller.lemmatize(analysis)
+            == ["kat", "zitten", "mat"])
+
+
+def test_process_tokens_of_doc_arrays():
+    """
+    Test that filtering the attribute arrays of a SpaCy document keeps the
+    same tokens as checking the tokens one by one.
+    """
+    preprocessing_controller = PreprocessingController()
+    preprocessing_controller._enable_pos = True
+    preprocessing_controller._pos_categories = {"NOUN", "VERB"}
+    preprocessing_controller._entity_categories = {"DATE"}
+    stopwords_model = StopwordsModel()
+    stopwords_model.add("zitten")
+    synonyms_model = SynonymsModel()
+    synonyms_model["poes"] = "kat"
+    preprocessing_controller.set_model_refs(stopwords_model, synonyms_model)
+
+    doc = spacy.blank("nl")("De Poes zat in mei op de mat en de kat ook")
+    for token, lemma, pos in zip(
+            doc, ["de", "Poes", "zitten", "in", "mei", "op", "de", "mat",
+                  "en", "de", "kat", "ook"],
+            ["DET", "NOUN", "VERB", "ADP", "NOUN", "ADP", "DET", "NOUN",
+             "CCONJ", "DET", "NOUN", "ADV"]):
+        token.lemma_ = lemma
+        token.pos_ = pos
+    doc.ents = [spacy.tokens.Span(doc, 4, 5, label="DATE")]
+
+    expected = [synonyms_model.get(token.lemma_.lower(),
+                                   token.lemma_.lower())
+                for token in doc
+                if token.ent_type_ != "DATE" and len(token.lemma_) > 2
+                and token.pos_ in {"NOUN", "VERB"}]
+    expected = [token for token in expected if token not in stopwords_model]
+
+    assert preprocessing_controller.process_tokens(doc) == expected
+    assert expected == ["kat", "mat", "kat"]
+
+
+def test_filter_corpus():
+    """
+    Test that filtering lemmatized files applies the synonyms and removes
+    the stopwords, also when a synonym is a stopword.
+    """
+    preprocessing_controller = PreprocessingController()
+    stopwords_model = StopwordsModel()
+    stopwords_model.add("zitten", "dier")
+    synonyms_model = SynonymsModel()
+    synonyms_model["poes"] = "kat"
+    synonyms_model["hond"] = "dier"
+    preprocessing_controller.set_model_refs(stopwords_model, synonyms_model)
+    files = [ProcessedFile(Metadata("a", 0, 4, "txt"),
+                           ProcessedBody(["poes", "zitten", "mat", "kat"])),
+             ProcessedFile(Metadata("b", 0, 2, "txt"),
+                           ProcessedBody(["hond", "mat"]))]
+
+    processed_files = preprocessing_controller.filter_corpus(files)
+
+    assert ([file.body.body for file in processed_files]
+            == [["kat", "mat", "kat"], ["mat"]])
+    assert ([file.metadata for file in processed_files]
+            == [file.metadata for file in files])
+    # The lemmatized files are not changed
+    assert files[0].body.body == ["poes", "zitten", "mat", "kat"]
+
+
 def test_process_tokens(preprocessing_controller_dutch,
                         stopwords_model_dutch, empty_synonyms_model):
     """
@@ -117,7 +463,7 @@ def test_process_tokens(preprocessing_controller_dutch,
     preprocessing_controller_dutch.set_model_refs(stopwords_model_dutch,
                                                   empty_synonyms_model)
     text = "Dit is een test zin token2."
-    doc = preprocessing_controller_dutch._nlp(text)
+    doc = preprocessing_controller_dutch._get_nlp()(text)
     tokens = preprocessing_controller_dutch.process_tokens(doc)
     assert isinstance(tokens, list)
 
@@ -199,7 +545,7 @@ def test_n_gram_merging(preprocessing_controller_dutch,
     preprocessing_controller_dutch.set_model_refs(stopwords_model_dutch,
                                                   empty_synonyms_model)
     tokens = "Hello Kitty is beter dan Ben Ten"
-    n_grams = preprocessing_controller_dutch._nlp(tokens)
+    n_grams = preprocessing_controller_dutch._get_nlp()(tokens)
     assert isinstance(n_grams, spacy.tokens.Doc)
 
     # Check whether the n_grams are merged
@@ -248,9 +594,9 @@ def test_apply_synonyms(preprocessing_controller_dutch,
     assert "exam" in tokens
 
 
-def test_preprocessing_pipeline_loaded_on_start():
+def test_preprocessing_pipeline_loaded_on_first_use():
     controller = Controller()
-    assert controller._preprocessing_controller._nlp is not None
+    assert controller._preprocessing_controller._get_nlp() is not None
 
 
 """
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from tommy.controller.file_import.metadata_table import MetadataTable
 from tommy.controller.preprocessing_controller import PreprocessingController
 from tommy.controller.topic_modelling_runners.bertopic_runner import (
     BertopicRunner)
@@ -46,7 +47,7 @@ def metadata():
                         'metadata.pkl')
     with open(path, 'rb') as file:
         metadata = pickle.load(file)
-        return metadata
+        return MetadataTable.from_metadata(metadata)
 
 
 @pytest.fixture(scope="module")
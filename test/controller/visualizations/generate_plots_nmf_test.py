@@ -4,6 +4,7 @@ import pickle
 import pytest
 from gensim import models, corpora
 
+from tommy.controller.file_import.metadata_table import MetadataTable
 from tommy.controller.topic_modelling_runners.nmf_runner import NmfRunner
 from tommy.controller.visualizations.correlation_matrix_creator import (
     CorrelationMatrixCreator)
@@ -84,7 +85,21 @@ def nmf_runner(nmf_model, nmf_model_dictionary, processed_files, mocker):
 def metadata(processed_files):
     # Extract metadata from processed_files
     metadata = [processed_file.metadata for processed_file in processed_files]
-    return metadata
+    return MetadataTable.from_metadata(metadata)
+
+
+def test_corpus_topics_use_bags_of_words(nmf_runner, nmf_model,
+                                         nmf_model_dictionary,
+                                         processed_files, mocker):
+    spy = mocker.spy(nmf_model, "get_document_topics")
+
+    corpus_topics = nmf_runner.get_corpus_topics(processed_files, 0.0)
+
+    # The model gets the same bags of words as doc2bow of the dictionary
+    assert len(corpus_topics) == len(processed_files)
+    assert ([call.args[0] for call in spy.call_args_list]
+            == [nmf_model_dictionary.doc2bow(processed_file.body.body)
+                for processed_file in processed_files])
 
 
 def test_generate_correlation_matrix(nmf_runner):
@@ -0,0 +1,61 @@
+import pytest
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from tommy.main_window import MainWindow
+
+
+@pytest.fixture(scope='function')
+def main_window(qtbot: QtBot) -> MainWindow:
+    main_window = MainWindow()
+    qtbot.addWidget(main_window)
+    return main_window
+
+
+def test_actions_disabled_during_import(main_window: MainWindow):
+    import_running_event = (main_window.controller.corpus_controller
+                            .import_running_event)
+
+    # Act
+    import_running_event.publish(True)
+
+    # Assert
+    assert main_window.menu_bar.export_topic_words_action.isEnabled() is False
+    assert main_window.model_params_view.apply_button.isEnabled() is False
+
+    # Act
+    import_running_event.publish(False)
+
+    # Assert
+    assert main_window.menu_bar.export_topic_words_action.isEnabled() is True
+    assert main_window.model_params_view.apply_button.isEnabled() is True
+
+
+def test_close_during_import_stops_import(main_window: MainWindow,
+                                          mocker: MockerFixture):
+    corpus_controller = main_window.controller.corpus_controller
+    cancel_import = mocker.patch.object(corpus_controller, "cancel_import")
+    main_window.show()
+    corpus_controller.import_running_event.publish(True)
+
+    # Act
+    closed = main_window.close()
+
+    # Assert
+    assert closed is False
+    assert main_window.isVisible() is True
+    cancel_import.assert_called_once()
+
+    # Act
+    corpus_controller.import_running_event.publish(False)
+
+    # Assert
+    assert main_window.isVisible() is False
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
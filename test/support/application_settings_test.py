@@ -0,0 +1,85 @@
+import json
+import os
+
+import pytest
+
+from tommy.support.application_settings import (ApplicationSettings,
+                                                load_settings_file)
+
+
+@pytest.fixture
+def settings() -> ApplicationSettings:
+    return ApplicationSettings("data")
+
+
+def write_settings_file(folder, values) -> str:
+    path = os.path.join(folder, "settings.json")
+    with open(path, "w", encoding="utf-8") as settings_file:
+        json.dump(values, settings_file)
+    return path
+
+
+def test_load_settings_file(settings, tmp_path):
+    values = {"remove_duplicates": True,
+              "import_workers": 4,
+              "pdf_page_workers": 2,
+              "streaming_corpus": True,
+              "preprocessing_processes": 3,
+              "duplicate_threshold": None,
+              "import_exclude_patterns": ["*.tmp"]}
+    path = write_settings_file(tmp_path, values)
+
+    problems = load_settings_file(settings, path)
+
+    assert problems == []
+    assert settings.remove_duplicates
+    assert settings.import_workers == 4
+    assert settings.pdf_page_workers == 2
+    assert settings.streaming_corpus
+    assert settings.preprocessing_processes == 3
+    assert settings.duplicate_threshold is None
+    assert settings.import_exclude_patterns == ["*.tmp"]
+
+
+def test_load_settings_file_ignores_invalid_settings(settings, tmp_path):
+    path = write_settings_file(tmp_path, {"import_workers": "4",
+                                          "remove_duplicates": 1,
+                                          "data_folder": "elders",
+                                          "unknown": 1,
+                                          "duplicate_threshold": 1})
+
+    problems = load_settings_file(settings, path)
+
+    assert len(problems) == 4
+    assert settings.import_workers == 1
+    assert not settings.remove_duplicates
+    assert settings.data_folder == "data"
+    assert settings.duplicate_threshold == 1
+
+
+def test_load_missing_settings_file(settings, tmp_path):
+    problems = load_settings_file(settings,
+                                  os.path.join(tmp_path, "settings.json"))
+
+    assert problems == []
+    assert settings == ApplicationSettings("data")
+
+
+@pytest.mark.parametrize("content", ["{", "[1, 2]"])
+def test_load_unreadable_settings_file(settings, tmp_path, content):
+    path = os.path.join(tmp_path, "settings.json")
+    with open(path, "w", encoding="utf-8") as settings_file:
+        settings_file.write(content)
+
+    problems = load_settings_file(settings, path)
+
+    assert len(problems) == 1
+    assert settings == ApplicationSettings("data")
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -4,6 +4,8 @@ from pytestqt.qtbot import QtBot
 
 from tommy.controller.config_controller import ConfigController
 from tommy.controller.corpus_controller import CorpusController
+from tommy.controller.file_import.import_progress import (
+    FileTypeProgress, ImportProgress)
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.topic_modelling_controller import \
     TopicModellingController
@@ -103,6 +105,32 @@ def test_sorting(imported_files_view: ImportedFilesView, qtbot: QtBot):
             .file.name == "file3")
 
 
+def test_import_progress(imported_files_view: ImportedFilesView,
+                         qtbot: QtBot):
+    progress_widget = imported_files_view.progress_widget
+    assert progress_widget.isHidden()
+
+    imported_files_view.on_import_progress(ImportProgress(files_found=3))
+    assert not progress_widget.isHidden()
+    assert progress_widget.progress_label.text() == ("Bestanden zoeken: 3 "
+                                                     "gevonden")
+
+    imported_files_view.on_import_progress(ImportProgress(
+        files_found=3, files_total=3, files_done=1, bytes_done=2_500_000,
+        documents_done=20, seconds=2.0,
+        file_types={'csv': FileTypeProgress(1, 20, 2_500_000, 0.5)}))
+    assert progress_widget.progress_label.text() == (
+        "Bestanden: 1/3 (2.5 MB), 10 documenten/s (csv: 40/s)")
+
+    # The stop button cancels the import of the corpus controller
+    qtbot.mouseClick(progress_widget.cancel_button, Qt.LeftButton)
+    assert imported_files_view._corpus_controller._import_cancel_token \
+        .cancelled
+
+    imported_files_view.on_import_progress(ImportProgress(finished=True))
+    assert progress_widget.isHidden()
+
+
 if __name__ == '__main__':
     pytest.main()
 
@@ -41,6 +41,24 @@ def test_enable_menu_on_finish_topic_modelling(
     assert menu_bar.import_input_folder_action.isEnabled() is True
 
 
+def test_disable_import_actions_during_import(menu_bar: MenuBar):
+    # Act
+    menu_bar.set_import_actions_enabled(False)
+
+    # Assert
+    assert menu_bar.import_input_folder_action.isEnabled() is False
+    assert menu_bar.load_settings_action.isEnabled() is False
+    assert menu_bar.export_to_gexf_action.isEnabled() is False
+    assert menu_bar.export_document_topic_action.isEnabled() is False
+
+    # Act
+    menu_bar.set_import_actions_enabled(True)
+
+    # Assert
+    assert menu_bar.import_input_folder_action.isEnabled() is True
+    assert menu_bar.load_settings_action.isEnabled() is True
+
+
 """
 This program has been developed by students from the bachelor Computer Science
 at Utrecht University within the Software Project course.
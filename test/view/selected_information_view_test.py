@@ -1,9 +1,11 @@
+import os
 from datetime import datetime
 
 import pytest
 from pytestqt.qtbot import QtBot
 
 from test.helper_fixtures import controller_no_pipeline
+from tommy.controller.file_import.document_locator import DocumentLocator
 from tommy.controller.file_import.metadata import Metadata
 from tommy.view.imported_files_view.file_label import FileLabel
 from tommy.view.selected_information_view import SelectedInformationView
@@ -21,7 +23,8 @@ def selected_information_view(qtbot: QtBot, controller) -> (
         SelectedInformationView):
     selected_information_view = SelectedInformationView(
         controller.graph_controller,
-        controller.model_parameters_controller)
+        controller.model_parameters_controller,
+        controller.corpus_controller)
     qtbot.addWidget(selected_information_view)
     return selected_information_view
 
@@ -93,6 +96,31 @@ def test_display_file_info_file_selected(
     assert selected_information_view.layout.count() == 2
 
 
+def test_display_file_info_shows_text(
+        selected_information_view: SelectedInformationView):
+    """
+    Test that the text of a selected file is loaded and shown.
+    """
+    # Arrange
+    path = os.path.join(os.path.dirname(__file__), '..', 'test_data',
+                        'test_txt_files', 'correct_files',
+                        'kattenverhaaltje 1.txt')
+    file_metadata = Metadata("kattenverhaaltje 1", 0, 0, "txt",
+                             locator=DocumentLocator(path))
+    file_label = FileLabel(file_metadata)
+    file_label.selected = True
+
+    # Act
+    selected_information_view.display_file_info(file_label)
+
+    # Assert
+    file_info_layout = selected_information_view.scroll_layout.itemAt(0)
+    text_label = file_info_layout.itemAt(
+        file_info_layout.count() - 1).widget()
+    with open(path, encoding='utf-8') as file:
+        assert text_label.text() == file.read()[:1000] + "…"
+
+
 def test_display_topic_info_topic_not_selected(
         selected_information_view: SelectedInformationView):
     """
@@ -2,6 +2,7 @@ import pytest
 
 from test.helper_fixtures import controller_no_pipeline
 from tommy.support.model_type import ModelType
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.supported_languages import SupportedLanguage
 from tommy.view.settings_view.abstract_settings.abstract_settings import \
     AbstractSettings
@@ -226,6 +227,35 @@ def test_language_field_changed_event(abstract_settings: AbstractSettings,
         SupportedLanguage.Dutch)
 
 
+def test_profile_field_changed_event(abstract_settings: AbstractSettings,
+                                     controller, mocker):
+    # Mock the scroll layout
+    abstract_settings._scroll_layout = mocker.MagicMock()
+    abstract_settings.initialize_profile_field()
+
+    # Select the throughput profile
+    abstract_settings._profile_field.setCurrentText("Snel")
+
+    # Assert
+    assert (controller.model_parameters_controller
+            .get_preprocessing_profile() == PreprocessingProfile.Throughput)
+
+
+def test_profile_field_set_from_backend(abstract_settings: AbstractSettings,
+                                        controller, mocker):
+    # Mock the scroll layout
+    abstract_settings._scroll_layout = mocker.MagicMock()
+    abstract_settings.initialize_profile_field()
+    controller.model_parameters_controller.set_preprocessing_profile(
+        PreprocessingProfile.Throughput)
+
+    # Act
+    abstract_settings.set_field_values_from_backend()
+
+    # Assert
+    assert abstract_settings._profile_field.currentText() == "Snel"
+
+
 def test_disable_input_field(abstract_settings: AbstractSettings, mocker):
     # Mock the input field
     input_field = mocker.MagicMock()
@@ -175,7 +175,8 @@ class Controller:
 
         self._preprocessing_controller.set_model_refs(
             self._model.stopwords_model,
-            self._model.synonyms_model)
+            self._model.synonyms_model,
+            self._model.model_parameters_model)
 
         self._corpus_controller.set_model_refs(
             self._model.corpus_model)
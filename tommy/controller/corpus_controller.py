@@ -1,19 +1,29 @@
-import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 
 from gensim.corpora import Dictionary
 
+from tommy.controller.file_import.document_store import DocumentStore
+from tommy.controller.file_import.duplicate_filter import (
+    DuplicateFilter, describe_removed_duplicates)
+from tommy.controller.file_import.folder_crawler import FolderCrawler
 from tommy.controller.file_import.generic_file_importer import (
     GenericFileImporter)
+from tommy.controller.file_import.import_progress import (
+    CancelToken, ImportProgress, ImportProgressTracker)
 from tommy.controller.file_import.metadata import Metadata
-from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.metadata_index import MetadataIndex
+from tommy.controller.file_import.metadata_table import MetadataTable
+from tommy.controller.file_import.parallel_file_importer import (
+    ImportResult, ParallelFileImporter, describe_fallback_dates,
+    describe_import_error, describe_unparsed_dates, import_file_safely)
 from tommy.controller.file_import.processed_corpus import ProcessedCorpus
-from tommy.controller.file_import.processed_file import ProcessedFile
 from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
+from tommy.controller.file_import.streamed_corpus import StreamedCorpus
 from tommy.controller.project_settings_controller import (
     ProjectSettingsController)
 from tommy.controller.preprocessing_controller import PreprocessingController
+from tommy.support.application_settings import application_settings
 from tommy.support.event_handler import EventHandler
 from tommy.model.corpus_model import CorpusModel
 from tommy.view.error_view import ErrorView
@@ -30,6 +40,11 @@ class CorpusController:
     _preprocessing_controller: PreprocessingController = None
     fileParsers: GenericFileImporter = GenericFileImporter()
     _metadata_changed_event: EventHandler[[Metadata]] = None
+    _import_progress_event: EventHandler[ImportProgress] = None
+    _import_running_event: EventHandler[bool] = None
+    _import_cancel_token: CancelToken = None
+    _document_store: DocumentStore = None
+    _removed_duplicates: int = 0
     corpus_version_id: int = -1
 
     @property
@@ -41,10 +56,37 @@ class CorpusController:
         """
         return self._metadata_changed_event
 
+    @property
+    def import_progress_event(self) -> EventHandler[ImportProgress]:
+        """
+        This event gets triggered regularly while the files of an input
+        folder are imported, and once more when the import is finished, so
+        the UI can show the progress of the import
+        :return: The event handler of the import progress
+        """
+        return self._import_progress_event
+
+    @property
+    def import_running_event(self) -> EventHandler[bool]:
+        """
+        This event gets triggered with True when an import of the input
+        folder starts and with False when it is finished, so the UI can
+        disable the actions that cannot be used during an import
+        :return: The event handler of the running state of the import
+        """
+        return self._import_running_event
+
     def __init__(self) -> None:
-        """Initialize corpus controller and eventhandler for metadata"""
+        """
+        Initialize corpus controller and eventhandlers for metadata and
+        import progress
+        """
         super().__init__()
         self._metadata_changed_event = EventHandler[[Metadata]]()
+        self._import_progress_event = EventHandler[ImportProgress]()
+        self._import_running_event = EventHandler[bool]()
+        self._import_cancel_token = CancelToken()
+        self._document_store = DocumentStore(self.fileParsers)
 
     def set_controller_refs(self,
                             project_settings_controller:
@@ -85,59 +127,141 @@ class CorpusController:
     None, None]:
         """
         Yields the contents of all compatible files in a given directory
-        and all its subdirectories.
+        and all its subdirectories. When more than one import worker is
+        configured in the application settings, the files are imported by a
+        pool of processes, but they are still yielded in the same order.
+        Files that are skipped by the crawler are reported in aggregate.
 
         :param path: The string of the path to the directory
+        :param show_error: Whether to show the errors that occurred during
+            the import to the user
         :return: A generator yielding File
         objects
         """
         if path == "":
             return None
         errors = []
-
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.startswith('.'):
-                    continue
+        fallback_dates = 0
+        unparsed_dates = 0
+        crawler = self._create_crawler()
+
+        if application_settings.import_workers > 1:
+            for result in self._import_files(crawler.crawl(path)):
+                yield from result.files
+                fallback_dates += result.fallback_dates
+                unparsed_dates += result.unparsed_dates
+                if result.error is not None:
+                    errors.append(result.error)
+        else:
+            for file_path in crawler.crawl(path):
                 try:
-                    yield from self.fileParsers.import_file(
-                        os.path.join(root,
-                                     file))
-                except NotImplementedError as e:
-                    errors.append(f"{file} bestaat uit een niet ondersteund "
-                                  f"file format. pad: "
-                                  f"{os.path.join(root, file)}")
-
-                except UnicodeDecodeError as e:
-                    errors.append(f"Dit bestand kon niet worden gedecodeerd: "
-                                  f"{file}. Probleem: {e}")
-                except Warning as e:
-                    errors.append(f"Waarschuwing bij bestand '{file}': {e}")
-                except ExceptionGroup as e:
-                    error_lines = "\n".join(str(error) for error in
-                                            e.exceptions)
-                    errors.append(f"Er zijn meerdere fouten opgetreden bij "
-                                  f"het laden van dit bestand: {file}. "
-                                  f"Problemen:\n{error_lines}")
+                    yield from self.fileParsers.import_file(file_path)
                 except Exception as e:
-                    errors.append(f"Er is een probleem opgetreden bij het "
-                                  f"laden van dit bestand: "
-                                  f" {file}. Probleem: {e}")
+                    errors.append(describe_import_error(file_path, e))
+                fallback_dates += self.fileParsers.fallback_date_count(
+                    file_path)
+                unparsed_dates += self.fileParsers.unparsed_date_count(
+                    file_path)
+        errors.extend(crawler.statistics.describe())
+        errors.extend(describe_fallback_dates(fallback_dates))
+        errors.extend(describe_unparsed_dates(unparsed_dates))
 
         if show_error and errors:
             ErrorView("Er is een probleem opgetreden bij het "
                       "importeren van de volgende bestanden:", errors)
 
+    @staticmethod
+    def _import_files(paths: Iterable[str], metadata_only: bool = False,
+                      cancel_token: CancelToken = None) -> (
+            Generator[ImportResult, None, None]):
+        """
+        Imports the given files one by one, or using a pool of processes
+        when more than one import worker is configured in the application
+        settings. The results are yielded in the order of the given paths.
+
+        :param paths: The paths of the files to import
+        :param metadata_only: Only import the metadata of the files
+        :param cancel_token: The token that stops the import, if any
+        :return: A generator yielding an ImportResult for every path that
+            was imported before the import was cancelled
+        """
+        if application_settings.import_workers > 1:
+            importer = ParallelFileImporter(
+                application_settings.import_workers)
+            yield from importer.import_files(paths, metadata_only,
+                                             cancel_token)
+            return
+        for path in paths:
+            if cancel_token is not None and cancel_token.cancelled:
+                return
+            yield import_file_safely(path, metadata_only)
+
+    def _create_crawler(self) -> FolderCrawler:
+        """
+        Create the crawler that lists the files to import from the input
+        folder, using the exclude patterns and limits of the application
+        settings. Files are only listed if they have the extension of a
+        file type that can be imported.
+
+        :return: The crawler of the input folder
+        """
+        return FolderCrawler(self.fileParsers.has_supported_extension,
+                             application_settings.import_exclude_patterns,
+                             application_settings.import_max_depth,
+                             application_settings.import_max_files)
+
     def _read_files_from_input_folder(self) -> Generator[RawFile, None, None]:
         """
         Private method to read all files in the folder specified in the
-        project settings model
+        project settings model. Duplicate documents are removed when this
+        is enabled in the application settings. Once all files are read,
+        the metadata of the corpus is replaced by the metadata of the files
+        that were read, in which the removed duplicates are marked, and the
+        number of removed duplicates is kept for describe_removed_duplicates.
 
         :return: A generator that iterates over the raw
         file contents and their metadata.
         """
         path = self._project_settings_controller.get_input_folder_path()
-        return self._read_files(path, False)
+        files = self._read_files(path, False)
+        if not application_settings.remove_duplicates:
+            yield from files
+            return
+
+        metadata = []
+        duplicate_filter = DuplicateFilter(
+            application_settings.duplicate_threshold)
+        for file in duplicate_filter.filter(
+                self._collect_metadata(files, metadata)):
+            yield file
+        self._corpus_model.metadata = MetadataTable.from_metadata(metadata)
+        self._removed_duplicates = len(duplicate_filter.removed)
+
+    def describe_removed_duplicates(self) -> list[str]:
+        """
+        Describe how many documents were removed as duplicates when the
+        corpus was last preprocessed. No documents are removed when the
+        lemmas of the corpus were already known.
+
+        :return: The message for the user, or no message if no documents
+            were removed
+        """
+        return describe_removed_duplicates(self._removed_duplicates)
+
+    @staticmethod
+    def _collect_metadata(files: Iterable[RawFile],
+                          metadata: list[Metadata]) -> (
+            Generator[RawFile, None, None]):
+        """
+        Yield the given files, while adding their metadata to a list.
+
+        :param files: The files to yield
+        :param metadata: The list to add the metadata of the files to
+        :return: A generator yielding the given files
+        """
+        for file in files:
+            metadata.append(file.metadata)
+            yield file
 
     def on_input_folder_path_changed(self, input_folder_path: str) -> None:
         """
@@ -153,28 +277,136 @@ class CorpusController:
         self.extract_and_store_metadata(input_folder_path)
         self._metadata_changed_event.publish(self._corpus_model.metadata)
 
+    def cancel_import(self) -> None:
+        """
+        Stop the import of the input folder that is in progress. The files
+        that were imported before the import stopped are kept.
+
+        :return: None
+        """
+        self._import_cancel_token.cancel()
+
     def extract_and_store_metadata(self, input_folder_path: str) -> None:
         """
         Gets the metadata from all files in the directory specified by the
-        project settings and stores it in the corpus model
+        project settings and stores it in the corpus model. Files that did
+        not change since the folder was last loaded are not imported again,
+        but their metadata is read from the metadata index of the folder,
+        which is stored in the cache folder.
+        The progress of the import is published on the import progress
+        event, and the import can be stopped with cancel_import. The import
+        running event is published when the import starts and finishes, so
+        the UI can disable the actions that would start another import or
+        use the corpus while it is imported.
 
         :param input_folder_path: The new path to the input folder
         :return: None
         """
-        files = self._read_files(input_folder_path, True)
-        metadata = [file.metadata for file in files]
+        self._document_store.clear()
+        self._corpus_model.lemmatized_corpus = None
+        if input_folder_path == "":
+            self._corpus_model.metadata = MetadataTable.from_metadata([])
+            return
+
+        self._import_running_event.publish(True)
+        try:
+            errors = self._import_metadata(input_folder_path)
+        finally:
+            self._import_running_event.publish(False)
+
+        if errors:
+            ErrorView("Er is een probleem opgetreden bij het "
+                      "importeren van de volgende bestanden:", errors)
+
+    def _import_metadata(self, input_folder_path: str) -> list[str]:
+        """
+        Import the metadata of the files in the input folder, or read it
+        from the metadata index for the files that did not change, and
+        store it in the corpus model.
 
-        self._corpus_model.metadata = metadata
+        :param input_folder_path: The path to the input folder
+        :return: The descriptions of the problems that occurred during the
+            import
+        """
+        cancel_token = self._import_cancel_token = CancelToken()
+        tracker = ImportProgressTracker(self._import_progress_event,
+                                        cancel_token)
+        index = MetadataIndex.load(input_folder_path,
+                                   application_settings.cache_folder)
+        # The importers are created with the current settings, which decide
+        # whether indexed metadata can be reused
+        file_importer = GenericFileImporter()
+        crawler = self._create_crawler()
+        paths = []
+        for path in crawler.crawl(input_folder_path, cancel_token):
+            paths.append(path)
+            tracker.file_found()
+        tracker.crawl_finished()
+
+        metadata_per_path = {}
+        changed_paths = []
+        importer_keys = {}
+        for path in paths:
+            importer_keys[path] = file_importer.index_key(path)
+            metadata = index.lookup(path, importer_keys[path])
+            if metadata is None:
+                changed_paths.append(path)
+            else:
+                metadata_per_path[path] = MetadataTable.from_metadata(
+                    metadata)
+                tracker.file_done(path, len(metadata))
 
-    def get_metadata(self) -> list[Metadata]:
+        errors = []
+        fallback_dates = 0
+        unparsed_dates = 0
+        for result in self._import_files(changed_paths, True, cancel_token):
+            fallback_dates += result.fallback_dates
+            unparsed_dates += result.unparsed_dates
+            metadata_per_path[result.path] = MetadataTable.from_metadata(
+                result.metadata)
+            tracker.file_done(result.path, len(result.metadata),
+                              result.seconds)
+            # Files with errors are not indexed, so the errors are shown
+            # again the next time the folder is loaded
+            if result.error is None:
+                index.store(result.path, importer_keys[result.path],
+                            result.metadata)
+            else:
+                errors.append(result.error)
+        # The entries of the files that were not crawled because the import
+        # was cancelled are kept for the next import
+        index.save(prune=not cancel_token.cancelled)
+        errors.extend(crawler.statistics.describe())
+        errors.extend(describe_fallback_dates(fallback_dates))
+        errors.extend(describe_unparsed_dates(unparsed_dates))
+        tracker.finish()
+
+        # The metadata of every file is stored in a table as soon as it is
+        # known, so there is no Metadata object per document at the same time
+        self._corpus_model.metadata = MetadataTable.concatenate(
+            [metadata_per_path[path] for path in paths
+             if path in metadata_per_path])
+        return errors
+
+    def get_metadata(self) -> MetadataTable:
         """
         Gets the metadata from all files in the corpus model. This method
         assumes that extract_and_store_metadata has already been called.
 
-        :return: The metadata of the files in the corpus
+        :return: The table with the metadata of the files in the corpus
         """
         return self._corpus_model.metadata
 
+    def get_body(self, metadata: Metadata) -> RawBody:
+        """
+        Get the text of a single document, without reading the other files
+        in the input folder.
+
+        :param metadata: The metadata of the document
+        :return: The text of the document
+        """
+        return self._document_store.get_body(metadata)
+
     def get_raw_bodies(self) -> Generator[RawBody, None, None]:
         """
         Get a generator that reads all the raw file contents from the input
@@ -208,17 +440,49 @@ class CorpusController:
         return self._corpus_model.processed_corpus
 
     def preprocess_corpus(self) -> ProcessedCorpus:
-        """Preprocessed the corpus and save it in the corpus model"""
-        processed_files = [ProcessedFile(doc.metadata, ProcessedBody(
-            self._preprocessing_controller.process_text(doc.body.body)))
-                           for
-                           doc in self.get_raw_files()]
-
-        processed_corpus = ProcessedCorpus(processed_files)
+        """
+        Preprocessed the corpus and save it in the corpus model. Only the
+        stopwords and synonyms of the current configuration are applied
+        when the lemmas of the corpus are already known, so changing them
+        or switching configurations does not run the SpaCy pipeline again.
+
+        In streaming mode the files are instead read, preprocessed and
+        written to disk as bags of words in a single pass, so neither the
+        lemmas nor the tokens of the corpus are kept in memory. The output
+        of the SpaCy pipeline is then only reused through the
+        preprocessing cache.
+        """
+        self._removed_duplicates = 0
+        if application_settings.streaming_corpus:
+            processed_corpus = StreamedCorpus.from_documents(
+                self._preprocessing_controller.process_files(
+                    self.get_raw_files()))
+        else:
+            processed_corpus = self._preprocessing_controller.filter_corpus(
+                self.get_lemmatized_corpus())
 
         self._corpus_model.processed_corpus = processed_corpus
         return processed_corpus
 
+    def get_lemmatized_corpus(self) -> ProcessedCorpus:
+        """
+        Get the lemmas of the documents in the input folder, before the
+        stopwords and synonyms are applied. The lemmas are kept in the
+        corpus model until the input folder or the language changes. The
+        files are read from the input folder while earlier files are
+        lemmatized in batches.
+
+        :return: The lemmatized files and a reference to their metadata
+        """
+        pipeline_id = self._preprocessing_controller.pipeline_id
+        if (self._corpus_model.lemmatized_corpus is None
+                or self._corpus_model.lemmatized_pipeline_id != pipeline_id):
+            self._corpus_model.lemmatized_corpus = ProcessedCorpus(
+                self._preprocessing_controller.lemmatize_files(
+                    self.get_raw_files()))
+            self._corpus_model.lemmatized_pipeline_id = pipeline_id
+        return self._corpus_model.lemmatized_corpus
+
     def get_dictionary(self) -> Dictionary:
         """
         Get the dictionary corresponding to the bag-of-words representation of
@@ -0,0 +1,126 @@
+import os
+from typing import Callable, Generator, Optional
+
+from tommy.controller.file_import import archive_reader
+from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.raw_file import RawFile
+
+
+class ArchiveFileImporter(file_importer_base.FileImporterBase):
+    """
+    Handles importing of zip and tar archives. The members are streamed
+    out of the archive without unpacking it, and every member is imported
+    by the importer for its file type. The path in the metadata of the
+    imported files points inside the archive.
+    """
+
+    def __init__(self, get_importer: Callable[
+            [archive_reader.FileSource],
+            Optional[file_importer_base.FileImporterBase]]) -> None:
+        """
+        Initializes a new instance of the class.
+
+        :param get_importer: The function that finds the importer for a
+            member of an archive, which returns None if there is none
+        """
+        self.get_importer = get_importer
+        # The number of dates in the members of the archive that was loaded
+        # last that needed the fuzzy parser
+        self._fallback_date_count = 0
+        # The number of documents in the members of the archive that was
+        # loaded last that were loaded without a date
+        self._unparsed_date_count = 0
+
+    def compatible_file(self, file: archive_reader.FileSource) -> bool:
+        """
+        Check if a file is an archive that can be imported, without opening
+        the archive.
+
+        :param file: The path to the file, or the member of an archive.
+        :return: bool: True is compatible, False otherwise.
+        """
+        return archive_reader.is_archive(archive_reader.get_path(file))
+
+    def cache_name(self) -> str:
+        """
+        Get the name of the importer. Archives have no single extension,
+        and their extractions are cached per member by the importers of
+        the members.
+
+        :return: The name of the importer.
+        """
+        return "archive"
+
+    def fallback_date_count(self) -> int:
+        """
+        Get the number of dates in all members of the archive that was
+        loaded last that needed the slow fuzzy parser.
+
+        :return: The number of dates that were parsed by the fuzzy parser.
+        """
+        return self._fallback_date_count
+
+    def unparsed_date_count(self) -> int:
+        """
+        Get the number of documents in all members of the archive that was
+        loaded last that were loaded without a date, because their date
+        could not be parsed.
+
+        :return: The number of dates that could not be parsed.
+        """
+        return self._unparsed_date_count
+
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
+        """
+        Loads all members of an archive and yields File objects. Hidden
+        files and archives inside the archive are skipped. Every member is
+        passed to the importer for its file type, which reads it while it
+        is imported. Problems with single members are raised after all
+        other members are loaded.
+
+        :param file: The string path to the archive.
+        :return: File: A File object generated from each document in the
+            archive.
+        """
+        errors = []
+        self._fallback_date_count = 0
+        self._unparsed_date_count = 0
+        path = archive_reader.get_path(file)
+        for member in archive_reader.read_members(path):
+            member_name = os.path.relpath(member.path, path)
+            if any(part.startswith(".") or part == "__MACOSX"
+                   for part in member_name.split(os.sep)):
+                continue
+
+            importer = None
+            if not archive_reader.is_archive(member.path):
+                importer = self.get_importer(member)
+            if importer is None:
+                errors.append(NotImplementedError(
+                    f"{member_name} bestaat uit een niet ondersteund file "
+                    f"format."))
+                continue
+
+            try:
+                yield from importer.load_file(member)
+            except Exception as e:
+                errors.append(Exception(f"{member_name}: {e}"))
+            self._fallback_date_count += importer.fallback_date_count()
+            self._unparsed_date_count += importer.unparsed_date_count()
+
+        if errors:
+            if len(errors) == 1:
+                raise errors[0]
+            else:
+                raise ExceptionGroup("Er zijn meerdere fouten opgetreden "
+                                     "bij het laden van het archief: ",
+                                     errors)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,250 @@
+import io
+import os
+import tarfile
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import BinaryIO, Callable, Generator, Optional
+
+# The extensions of the archives whose members can be imported
+archive_extensions = (".zip", ".tar", ".tar.gz", ".tgz")
+
+# Members up to this size are read into memory when they are first
+# opened, so that importers can open them more than once and seek in them
+# without decompressing them again
+in_memory_member_size = 64 * 1024 * 1024
+
+
+@dataclass
+class ArchiveMember:
+    """
+    A file inside an archive. Its path is the path of the archive followed
+    by the name of the member, e.g. 'corpus.zip/brieven/brief 1.txt'. The
+    contents of the member are only read when it is opened.
+    """
+    path: str
+    size: int
+    modification_time: float
+    # Opens the member as a stream from the archive
+    opener: Callable[[], BinaryIO]
+    # The contents of a small member, once it has been opened
+    _data: Optional[bytes] = field(default=None, repr=False)
+
+    def open(self) -> BinaryIO:
+        """
+        Open the member for reading in binary mode. A small member is read
+        into memory the first time it is opened, larger members are
+        streamed from the archive every time.
+
+        :return: The opened member
+        """
+        if self.size > in_memory_member_size:
+            return self.opener()
+        if self._data is None:
+            with self.opener() as file:
+                self._data = file.read()
+        return io.BytesIO(self._data)
+
+
+# A file that can be imported: the path of a file on disk or inside an
+# archive, or a member of an archive that is being read by read_members
+type FileSource = str | ArchiveMember
+
+
+def get_path(file: FileSource) -> str:
+    """
+    Get the path of a file on disk or inside an archive.
+
+    :param file: The path of the file, or the member of an archive
+    :return: The path of the file
+    """
+    if isinstance(file, ArchiveMember):
+        return file.path
+    return file
+
+
+def is_archive(path: str) -> bool:
+    """
+    Check if a file is an archive of which the members can be imported.
+
+    :param path: The path of the file
+    :return: True if the file has the extension of a supported archive
+    """
+    return path.lower().endswith(archive_extensions)
+
+
+def split_archive_path(path: str) -> Optional[tuple[str, str]]:
+    """
+    Split the path of a file inside an archive into the path of the
+    archive and the name of the member.
+
+    :param path: The path of the file inside an archive
+    :return: The path of the archive and the name of the member, or None
+        if the path does not point inside an archive
+    """
+    head, member_name = os.path.split(os.path.normpath(path))
+    while head and member_name:
+        if is_archive(head) and os.path.isfile(head):
+            return head, member_name
+        head, part = os.path.split(head)
+        if not part:
+            break
+        member_name = f"{part}/{member_name}"
+    return None
+
+
+@contextmanager
+def _open_archive(archive_path: str) -> (
+        Generator[zipfile.ZipFile | tarfile.TarFile, None, None]):
+    """Open a zip or (compressed) tar archive"""
+    if archive_path.lower().endswith(".zip"):
+        archive = zipfile.ZipFile(archive_path)
+    else:
+        archive = tarfile.open(archive_path, "r:*")
+    with archive:
+        yield archive
+
+
+def _member_path(archive_path: str, member_name: str) -> str:
+    """Get the path of a member, using the separators of the platform"""
+    return os.path.join(archive_path, *member_name.split("/"))
+
+
+def _zip_member(archive: zipfile.ZipFile, archive_path: str,
+                info: zipfile.ZipInfo) -> ArchiveMember:
+    """Describe a member of a zip archive, without reading it"""
+    return ArchiveMember(_member_path(archive_path, info.filename),
+                         info.file_size,
+                         datetime(*info.date_time).timestamp(),
+                         lambda: archive.open(info))
+
+
+def _tar_member(archive: tarfile.TarFile, archive_path: str,
+                info: tarfile.TarInfo) -> ArchiveMember:
+    """Describe a member of a tar archive, without reading it"""
+    return ArchiveMember(_member_path(archive_path, info.name), info.size,
+                         info.mtime, lambda: archive.extractfile(info))
+
+
+def read_members(archive_path: str) -> Generator[ArchiveMember, None, None]:
+    """
+    Stream the files in an archive, in the order in which they are stored.
+    Directories are skipped. The contents of a member are only read when
+    it is opened, which must happen while it is being handled, before the
+    next member is requested.
+
+    :param archive_path: The path of the archive
+    :return: A generator yielding every file in the archive
+    """
+    with _open_archive(archive_path) as archive:
+        if isinstance(archive, zipfile.ZipFile):
+            yield from (_zip_member(archive, archive_path, info)
+                        for info in archive.infolist() if not info.is_dir())
+        else:
+            yield from (_tar_member(archive, archive_path, info)
+                        for info in archive if info.isfile())
+
+
+def _find_member(path: str) -> ArchiveMember:
+    """
+    Find a member of an archive that is not being read by read_members.
+    The archive is searched from the start, so this is slow for tar
+    archives.
+
+    :param path: The path of the file inside the archive
+    :raises FileNotFoundError: if the path does not point inside an archive
+    :return: The member, of which the contents are read into memory
+    """
+    split_path = split_archive_path(path)
+    if split_path is None:
+        raise FileNotFoundError(f"Bestand niet gevonden: {path}")
+    archive_path, member_name = split_path
+    with _open_archive(archive_path) as archive:
+        try:
+            if isinstance(archive, zipfile.ZipFile):
+                info = archive.getinfo(member_name)
+                data = archive.read(info)
+                size = info.file_size
+                modification_time = datetime(*info.date_time).timestamp()
+            else:
+                info = archive.getmember(member_name)
+                data = archive.extractfile(info).read()
+                size, modification_time = info.size, info.mtime
+        except KeyError as e:
+            raise FileNotFoundError(f"Bestand niet gevonden: {path}") from e
+    return ArchiveMember(path, size, modification_time,
+                         lambda: io.BytesIO(data), data)
+
+
+def open_file(file: FileSource) -> BinaryIO:
+    """
+    Open a file for reading in binary mode. The file can be a file on disk
+    or a file inside an archive. A member of an archive that is being read
+    is opened without searching the archive again.
+
+    :param file: The path of the file, or the member of an archive
+    :return: The opened file
+    """
+    if isinstance(file, ArchiveMember):
+        return file.open()
+    path = file
+    try:
+        return open(path, "rb")
+    except (FileNotFoundError, NotADirectoryError):
+        return _find_member(path).open()
+
+
+def open_text_file(file: FileSource, newline: Optional[str] = None) -> (
+        io.TextIOWrapper):
+    """
+    Open a file on disk or inside an archive for reading in text mode. The
+    file is decoded as UTF-8, skipping a byte order mark.
+
+    :param file: The path of the file, or the member of an archive
+    :param newline: How line endings are handled, as for open
+    :return: The opened file
+    """
+    return io.TextIOWrapper(open_file(file), encoding="utf-8-sig",
+                            newline=newline)
+
+
+def get_size(file: FileSource) -> int:
+    """
+    Get the size in bytes of a file on disk or inside an archive.
+
+    :param file: The path of the file, or the member of an archive
+    :return: The size of the (uncompressed) file
+    """
+    if isinstance(file, ArchiveMember):
+        return file.size
+    path = file
+    try:
+        return os.stat(path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        return _find_member(path).size
+
+
+def get_modification_time(file: FileSource) -> float:
+    """
+    Get the time at which a file on disk or inside an archive was last
+    modified.
+
+    :param file: The path of the file, or the member of an archive
+    :return: The modification time, as a timestamp
+    """
+    if isinstance(file, ArchiveMember):
+        return file.modification_time
+    path = file
+    try:
+        return os.path.getmtime(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return _find_member(path).modification_time
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
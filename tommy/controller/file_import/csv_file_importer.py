@@ -1,52 +1,89 @@
+from __future__ import annotations
+
 import csv
 import os.path
+from dataclasses import dataclass
 from datetime import datetime
-from os import stat
-from typing import Generator
+from itertools import batched, islice
+from typing import Generator, Optional, TextIO
 
+from tommy.controller.file_import import archive_reader
 from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.date_parser import DateParser
+from tommy.controller.file_import.document_locator import DocumentLocator
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
 
 
+@dataclass
+class CsvFileInfo:
+    """
+    The metadata values that are the same for every row of a CSV file, so
+    they only have to be computed once per file
+    """
+    path: str
+    name: str
+    size: int
+    alt_title: str
+    # The path that the documents of the file are loaded from
+    source_path: str
+
+    @classmethod
+    def from_path(cls, file: archive_reader.FileSource) -> CsvFileInfo:
+        """
+        Compute the metadata values of the CSV file at the given path.
+
+        :param file: The string path to the CSV file, or the member of an
+            archive.
+        :return: The metadata values of the CSV file.
+        """
+        path = archive_reader.get_path(file)
+        relative_path = os.path.relpath(path)
+        return cls(path=relative_path,
+                   name=relative_path.split(".")[0],
+                   size=archive_reader.get_size(file),
+                   alt_title=os.path.basename(path).replace('.csv', ''),
+                   source_path=os.path.abspath(path))
+
+
 class CsvFileImporter(file_importer_base.FileImporterBase):
     """
-    Handles importing of csv files
+    Handles importing of csv files. The rows are streamed in chunks, so
+    the memory usage does not depend on the size of the file.
     """
     mandatory_fields: list[str] = ['body']
+    file_extension = ".csv"
+    # The number of rows of which the dates are parsed together
+    chunk_size: int = 1000
+    # The maximum number of problems with single rows that are reported,
+    # the other problems are only counted
+    max_errors: int = 20
 
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
         """
-        pass
+        # The date parser of the file that was loaded last, which reports
+        # how many dates needed the slow fuzzy parser
+        self.date_parser: Optional[DateParser] = None
 
-    def compatible_file(self, path: str) -> bool:
+    def check_headers(self, headers: Optional[list[str]]) -> None:
         """
-        A CSV file is compatible with this parser if and only if
-        the first row of the CSV file contains all mandatory headers
+        Check that the headers of a CSV file contain every mandatory header
+        exactly once.
 
-        :param path: The string path to the CSV file to be checked for
-                     compatibility.
-        :return: bool: True if the file is compatible, False otherwise.
+        :param headers: The lowercase headers of the CSV file.
+        :raises ValueError: if a mandatory header is missing or duplicated.
+        :return: None
         """
-        if not path.endswith('.csv'):
-            return False
-
-        with open(path, 'r', newline="", encoding='utf-8-sig') as csvfile:
-            csv_reader = csv.DictReader(csvfile, delimiter=',')
-
-            # To check whether each mandatory header exists and is unique,
-            # we keep an array of occurrences of all mandatory headers
-            mandatory_fields_counts = [0] * len(self.mandatory_fields)
-            for header in csv_reader.fieldnames:
-                if header.lower() in self.mandatory_fields:
-                    mandatory_fields_counts[self.mandatory_fields.index(
-                        header.lower())] += 1
-
-            if mandatory_fields_counts == [1] * len(self.mandatory_fields):
-                return True
+        # To check whether each mandatory header exists and is unique,
+        # we keep an array of occurrences of all mandatory headers
+        mandatory_fields_counts = [0] * len(self.mandatory_fields)
+        for header in headers or []:
+            if header in self.mandatory_fields:
+                mandatory_fields_counts[self.mandatory_fields.index(
+                    header)] += 1
 
         missing_headers = [header for count, header
                            in zip(mandatory_fields_counts,
@@ -69,40 +106,65 @@ class CsvFileImporter(file_importer_base.FileImporterBase):
             raise ValueError(f"CSV bestand heeft de volgende duplicate"
                              f" headers: {duplicate_headers}")
 
-    def load_file(self, path: str) -> Generator[RawFile, None, None]:
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
         """
-        Loads a CSV file and yields File objects.
+        Loads a CSV file and yields File objects. The headers are checked
+        when the file is opened, so a file with missing or duplicate
+        mandatory headers raises a ValueError. Problems with single rows
+        are raised after all other rows are loaded, of which at most
+        max_errors are described.
 
-        :param path: The string path to the CSV file.
+        :param file: The string path to the CSV file, or the member of an
+            archive.
         :return: File: A File object generated from each row of the CSV.
         """
-        with open(path, 'r', newline="", encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
-            reader.fieldnames = [str(header).lower() for header in
-                                 reader.fieldnames]
+        file_info = CsvFileInfo.from_path(file)
+        self.date_parser = DateParser()
+
+        with archive_reader.open_text_file(file, newline="") as csvfile:
+            reader = self.open_reader(csvfile)
             row: dict
 
             row_index = 1  # Only used for debugging
             errors = []
-            for row in reader:
-                # Remove empty fields
-                for key, value in row.items():
-                    if (not isinstance(value, str) or value == "" or
-                            value.isspace()):
-                        row[key] = None
-                try:
-                    correct_date_format, file = self.generate_file(row, path,
-                                                                   row_index)
-                    yield file
-                    if not correct_date_format:
-                        errors.append(
-                            SyntaxWarning(
-                                f"De datum van document {row_index} kon niet "
-                                f"worden geïnterpreteerd: '{row.get('date')}'."
-                                f" Dit bestand is zonder datum ingeladen."))
-                except Exception as e:
-                    errors.append(e)
-                row_index += 1
+            omitted_errors = 0
+            for rows in batched(reader, self.chunk_size):
+                for row in rows:
+                    # Remove empty fields
+                    for key, value in row.items():
+                        if (not isinstance(value, str) or value == "" or
+                                value.isspace()):
+                            row[key] = None
+
+                # Parse the dates of all rows in the chunk at once
+                dates = self.date_parser.parse_dates(
+                    [row.get("date") for row in rows])
+
+                for row, file_date in zip(rows, dates):
+                    error = None
+                    try:
+                        raw_file = self.generate_file(row, file_info,
+                                                      row_index, file_date)
+                        yield raw_file
+                        if row.get("date") is not None and file_date is None:
+                            error = SyntaxWarning(
+                                f"De datum van document {row_index} kon "
+                                f"niet worden geïnterpreteerd: "
+                                f"'{row.get('date')}'. Dit bestand is "
+                                f"zonder datum ingeladen.")
+                    except Exception as e:
+                        error = e
+                    if error is not None:
+                        if len(errors) < self.max_errors:
+                            errors.append(error)
+                        else:
+                            omitted_errors += 1
+                    row_index += 1
+
+        if omitted_errors:
+            errors.append(Exception(f"En nog {omitted_errors} andere "
+                                    f"fouten in dit bestand"))
 
         if errors:
             if len(errors) == 1:
@@ -111,19 +173,57 @@ class CsvFileImporter(file_importer_base.FileImporterBase):
                 raise ExceptionGroup("Er zijn meerdere fouten opgetreden "
                                      "bij het laden van het bestand: ", errors)
 
-    def generate_file(self, file: dict, path: str, row_index: int) -> (
-            tuple[bool, RawFile]):
+    def load_body(self, locator: DocumentLocator) -> RawBody:
+        """
+        Load the text of a single row of a CSV file. The rows before it are
+        read, but not converted to files and their dates are not parsed.
+
+        :param locator: The locator of the row, of which the row number
+            starts at 1 for the first row after the headers.
+        :raises ValueError: if the file does not contain the row, or the
+            row has no text.
+        :return: The text of the row.
+        """
+        with archive_reader.open_text_file(locator.path,
+                                           newline="") as csvfile:
+            reader = self.open_reader(csvfile)
+            row = next(islice(reader, locator.row - 1, None), None)
+
+        body = None if row is None else row.get("body")
+        if not isinstance(body, str) or body == "" or body.isspace():
+            raise ValueError(f"Document {locator.row} is niet gevonden in "
+                             f"{locator.path}")
+        return RawBody(body=body.strip())
+
+    def open_reader(self, csvfile: TextIO) -> csv.DictReader:
+        """
+        Open a reader of the rows of a CSV file, of which the headers are
+        made lowercase and checked.
+
+        :param csvfile: The opened CSV file.
+        :raises ValueError: if a mandatory header is missing or duplicated.
+        :return: The reader yielding every row as a dictionary.
+        """
+        reader = csv.DictReader(csvfile)
+        if reader.fieldnames is not None:
+            reader.fieldnames = [str(header).lower() for header in
+                                 reader.fieldnames]
+        self.check_headers(reader.fieldnames)
+        return reader
+
+    def generate_file(self, file: dict, file_info: CsvFileInfo,
+                      row_index: int,
+                      file_date: Optional[datetime]) -> RawFile:
         """
-        Generates a File object from a CSV row.
+        Generates a File object from a CSV row of which the date has already
+        been parsed.
 
         :param file: A dictionary representing a row of CSV data.
-        :param path: The string path to the CSV file.
+        :param file_info: The metadata values of the CSV file.
         :param row_index: The index of the row in the csv file. Used for
         debugging and error presentation to the user.
-        :return: A tuple of a boolean and a RawFile object. The boolean is
-        False if the datetime could not be parsed, and True if the datetime
-        was successfully parsed or if the datetime does not exist for that
-        document. A RawFile object generated from the CSV row containing
+        :param file_date: The parsed date of the row, if any.
+        :return: A RawFile object generated from the CSV row containing
         metadata and the raw text of the file.
         """
         for key in self.mandatory_fields:
@@ -131,27 +231,22 @@ class CsvFileImporter(file_importer_base.FileImporterBase):
                 raise KeyError(f"De kolom '{key}' is verplicht, maar is niet "
                                f"gevonden voor document {row_index}")
 
-        file_date_str: str = file.get("date")
-        file_date: datetime
-        correct_date_format: bool
-        if file_date_str is None:
-            file_date = None
-            correct_date_format = True
-        else:
-            file_date = self.parse_date(file_date_str)
-            correct_date_format = file_date is not None
+        body: str = file.get("body")
         dict_title = file.get("title")
-        alt_title = os.path.basename(path).replace('.csv', '')
-        file_title = alt_title if dict_title is None else dict_title
-        return correct_date_format, RawFile(
+        file_title = file_info.alt_title if dict_title is None else dict_title
+        return RawFile(
             metadata=Metadata(author=file.get("author"),
                               title=file_title, date=file_date,
-                              url=file.get("url"), path=os.path.relpath(path),
+                              url=file.get("url"), path=file_info.path,
                               format="csv",
-                              length=len(file.get("body").split(" ")),
-                              name=os.path.relpath(path).split(".")[0],
-                              size=stat(path).st_size),
-            body=RawBody(body=file.get("body").strip()))
+                              # Equal to the number of parts when splitting
+                              # the body on spaces
+                              length=body.count(" ") + 1,
+                              name=file_info.name,
+                              size=file_info.size,
+                              locator=DocumentLocator(file_info.source_path,
+                                                      row=row_index)),
+            body=RawBody(body=body.strip()))
 
 
 """
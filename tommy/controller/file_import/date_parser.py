@@ -0,0 +1,225 @@
+import re
+from datetime import datetime
+from typing import Callable, Optional
+
+from dateutil import parser
+from dateutil.parser import ParserError
+
+
+class DutchParseInfo(parser.parserinfo):
+    """
+    Dutch date information to parse dates.
+    """
+
+    def __init__(self):
+        """
+        The initialization of the DutchParseInfo object.
+        """
+        self.MONTHS = [('January', 'Januari', 'Jan', 'Jan.'),
+                       ('February', 'Februari', 'Feb', 'Feb.', 'Febr',
+                        'Febr.'),
+                       ('March', 'Maart', 'Mrt', 'Mrt.', 'Mar', 'Mar.'),
+                       ('April', 'Apr', 'Apr.'),
+                       ('May', 'Mei'),
+                       ('June', 'Juni', 'Jun', 'Jun.'),
+                       ('July', 'Juli', 'Jul', 'Jul.'),
+                       ('August', 'Augustus', 'Aug', 'Aug.'),
+                       ('September', 'Sep', 'Sep.', 'Sept', 'Sept.'),
+                       ('October', 'Oktober', 'Okt', 'Okt.', 'Oct', 'Oct.'),
+                       ('November', 'Nov', 'Nov.'),
+                       ('December', 'Dec', 'Dec.')]
+
+        self.WEEKDAYS = [('Mon', 'Monday', 'Maandag', 'Ma', 'Ma.'),
+                         ('Tue', 'Tuesday', 'Dinsdag', 'Di', 'Di.'),
+                         ('Wed', 'Wednesday', 'Woensdag', 'Wo', 'Wo.',
+                          'Woe', 'Woe.'),
+                         ('Thu', 'Thursday', 'Donderdag', 'Do', 'Do.'),
+                         ('Fri', 'Friday', 'Vrijdag', 'Vr', 'Vr.', 'Vrij',
+                          'Vrij.'),
+                         ('Sat', 'Saturday', 'Zaterdag', 'Za', 'Za.', 'Zat',
+                          'Zat.'),
+                         ('Sun', 'Sunday', 'Zondag', 'Zo', 'Zo.')]
+
+        super().__init__(dayfirst=True)
+
+
+dutch_parse_info = DutchParseInfo()
+
+# A numeric date that starts with the year, e.g. "2021-03-04"
+_year_first_pattern = re.compile(r"(?<!\d)\d{4}[-/.]\d{1,2}[-/.]\d{1,2}(?!\d)")
+
+
+def parse_fuzzy_date(file_date: str) -> Optional[datetime]:
+    """
+    Parse a Dutch date string into a date object, ignoring any text in the
+    string that is not part of the date. Numeric dates put the day first,
+    except dates that start with the year, which put the month second like
+    the year-first formats of DateParser.
+
+    :param file_date: The date string to parse.
+    :return: The date object, or None if the string contains no date.
+    """
+    year_first = _year_first_pattern.search(file_date) is not None
+    try:
+        return parser.parse(file_date, parserinfo=dutch_parse_info,
+                            fuzzy=True, dayfirst=not year_first,
+                            yearfirst=year_first)
+    except (ParserError, OverflowError):
+        return None
+
+
+# Dates with a written month, optionally surrounded by the day of the week,
+# e.g. "24 augustus 2021 dinsdag" or "di 24 aug. 2021"
+_textual_date_pattern = re.compile(
+    r"^\s*(?:([^\W\d_]+)\.?,?\s+)?(\d{1,2})\s+([^\W\d_]+)\.?,?\s+(\d{4})"
+    r"(?:,?\s+([^\W\d_]+)\.?)?\s*$")
+
+
+def _parse_textual_date(file_date: str) -> Optional[datetime]:
+    """
+    Parse a date with a written Dutch or English month.
+
+    :param file_date: The date string to parse.
+    :return: The date object, or None if the string has a different format.
+    """
+    match = _textual_date_pattern.match(file_date)
+    if match is None:
+        return None
+    weekday_before, day, month, year, weekday_after = match.groups()
+    month_index = dutch_parse_info.month(month)
+    if month_index is None:
+        return None
+    for weekday in (weekday_before, weekday_after):
+        if weekday is not None and dutch_parse_info.weekday(weekday) is None:
+            return None
+    try:
+        return datetime(int(year), month_index, int(day))
+    except ValueError:
+        return None
+
+
+def _strptime_parser(date_format: str) -> Callable[[str], Optional[datetime]]:
+    """
+    Create a parser for dates in a fixed numeric format.
+
+    :param date_format: The format of the dates, as used by strptime.
+    :return: A function parsing a date string in the given format.
+    """
+    def parse(file_date: str) -> Optional[datetime]:
+        try:
+            return datetime.strptime(file_date.strip(), date_format)
+        except ValueError:
+            return None
+    return parse
+
+
+class DateParser:
+    """
+    Parses the date strings of a column or folder of documents. The
+    dominant format of the dates is inferred from a sample, after which
+    the dates in that format are parsed by a fast parser for that format.
+    Only dates in other formats go to the slow fuzzy Dutch parser, which
+    reads a date the same way as the formats below. Every distinct date
+    string is parsed once, but every date that needs the fuzzy parser is
+    counted.
+    """
+
+    # The formats that can be recognized, in order of preference
+    date_formats: dict[str, Callable[[str], Optional[datetime]]] = {
+        "textual": _parse_textual_date,
+        "%d-%m-%Y": _strptime_parser("%d-%m-%Y"),
+        "%d/%m/%Y": _strptime_parser("%d/%m/%Y"),
+        "%d.%m.%Y": _strptime_parser("%d.%m.%Y"),
+        "%d-%m-%Y %H:%M": _strptime_parser("%d-%m-%Y %H:%M"),
+        "%Y-%m-%d": _strptime_parser("%Y-%m-%d"),
+        "%Y-%m-%d %H:%M:%S": _strptime_parser("%Y-%m-%d %H:%M:%S"),
+        "%Y-%m-%dT%H:%M:%S": _strptime_parser("%Y-%m-%dT%H:%M:%S"),
+        "%Y/%m/%d": _strptime_parser("%Y/%m/%d"),
+    }
+
+    def __init__(self, sample_size: int = 50,
+                 max_cached_dates: int = 100_000) -> None:
+        """
+        Initialize a date parser that has not inferred a format yet.
+
+        :param sample_size: The number of distinct date strings used to
+            infer the dominant format
+        :param max_cached_dates: The maximum number of parsed date strings
+            that are remembered
+        """
+        self.sample_size = sample_size
+        self.max_cached_dates = max_cached_dates
+        self.date_format: Optional[str] = None
+        self.fallback_count = 0
+        self._format_inferred = False
+        # The parsed date of every date string, and whether it needed the
+        # fuzzy parser
+        self._parsed_dates: dict[str, tuple[Optional[datetime], bool]] = {}
+
+    def parse_dates(self, file_dates: list[Optional[str]]) -> (
+            list[Optional[datetime]]):
+        """
+        Parse a batch of date strings. The format is inferred from the first
+        batch that contains dates.
+
+        :param file_dates: The date strings to parse, None for missing dates.
+        :return: The date objects, None for missing or unparsable dates.
+        """
+        if not self._format_inferred:
+            sample = list(dict.fromkeys(
+                date for date in file_dates if date is not None))
+            if sample:
+                self.infer_format(sample[:self.sample_size])
+
+        return [None if date is None else self.parse_date(date)
+                for date in file_dates]
+
+    def parse_date(self, file_date: str) -> Optional[datetime]:
+        """
+        Parse a single date string, using the inferred format if possible.
+
+        :param file_date: The date string to parse.
+        :return: The date object, or None if the string contains no date.
+        """
+        if file_date in self._parsed_dates:
+            parsed_date, used_fallback = self._parsed_dates[file_date]
+        else:
+            parsed_date = None
+            if self.date_format is not None:
+                parsed_date = self.date_formats[self.date_format](file_date)
+            used_fallback = parsed_date is None
+            if used_fallback:
+                parsed_date = parse_fuzzy_date(file_date)
+
+            if len(self._parsed_dates) >= self.max_cached_dates:
+                self._parsed_dates.clear()
+            self._parsed_dates[file_date] = (parsed_date, used_fallback)
+
+        if used_fallback:
+            self.fallback_count += 1
+        return parsed_date
+
+    def infer_format(self, sample: list[str]) -> None:
+        """
+        Infer the dominant format of the dates from a sample. A format is
+        only used if it matches at least half of the sample.
+
+        :param sample: Distinct date strings of the column or folder
+        :return: None
+        """
+        self._format_inferred = True
+        best_format, best_count = None, 0
+        for date_format, parse in self.date_formats.items():
+            count = sum(parse(date) is not None for date in sample)
+            if count > best_count:
+                best_format, best_count = date_format, count
+        if best_count * 2 >= len(sample):
+            self.date_format = best_format
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
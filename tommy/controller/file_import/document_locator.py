@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class DocumentLocator:
+    """
+    Represents where the text of a document is stored, so the text of a
+    single document can be loaded without importing the whole corpus
+    again. Files that contain multiple documents, such as CSV and JSON
+    Lines files, also store the number of the document in the file and,
+    if known, the byte offset at which the document starts.
+    """
+    path: str
+    row: Optional[int] = None
+    offset: Optional[int] = None
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_body import RawBody
+
+
+class DocumentStore:
+    """
+    Gives random access to the text of the documents in the corpus. Every
+    document is loaded on its own using the locator in its metadata, so
+    showing a single document does not require importing the whole input
+    folder again. The documents that were loaded last are kept in memory.
+    """
+
+    def __init__(self, importer: GenericFileImporter,
+                 cache_size: int = 16) -> None:
+        """
+        Initialize the document store.
+
+        :param importer: The importer that loads the text of the documents
+        :param cache_size: The number of documents that is kept in memory
+        """
+        self.importer = importer
+        self.cache_size = cache_size
+        self._bodies: OrderedDict[DocumentLocator, RawBody] = OrderedDict()
+
+    def get_body(self, metadata: Metadata) -> RawBody:
+        """
+        Load the text of a single document.
+
+        :param metadata: The metadata of the document
+        :raises ValueError: if the location of the document is not known
+        :return: The text of the document
+        """
+        locator = metadata.locator
+        if locator is None:
+            raise ValueError(f"De locatie van document {metadata.name} is "
+                             f"onbekend")
+
+        body = self._bodies.get(locator)
+        if body is not None:
+            self._bodies.move_to_end(locator)
+            return body
+
+        body = self.importer.load_body(locator)
+        self._bodies[locator] = body
+        if len(self._bodies) > self.cache_size:
+            self._bodies.popitem(last=False)
+        return body
+
+    def clear(self) -> None:
+        """
+        Forget the documents that are kept in memory, for example because
+        the files in the input folder may have changed.
+
+        :return: None
+        """
+        self._bodies.clear()
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -1,71 +1,204 @@
 import os
+import posixpath
+import zipfile
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Generator
-
-import mammoth
+from typing import Generator, Optional
+from xml.etree import ElementTree
 
+from tommy.controller.file_import import archive_reader
 from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+from tommy.controller.file_import.document_locator import DocumentLocator
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
 
 
+_namespaces = {
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main": "w",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main": "w",
+    "http://schemas.openxmlformats.org/markup-compatibility/2006": "mc",
+    "urn:schemas-microsoft-com:vml": "v",
+}
+
+# The elements whose text is part of the document, as read by mammoth. The
+# text inside any other element, such as deleted text, field instructions
+# and the properties of paragraphs, is skipped.
+_text_containers = {
+    "w:document", "w:body", "w:p", "w:r", "w:tbl", "w:tr", "w:tc", "w:ins",
+    "w:object", "w:smartTag", "w:hyperlink", "w:sdt", "w:sdtContent",
+    "w:pict", "w:txbxContent", "v:group", "v:rect", "v:roundrect",
+    "v:shape", "v:textbox", "mc:AlternateContent", "mc:Fallback",
+}
+
+# The elements of a run that represent a character instead of text
+_special_characters = {
+    "w:tab": "\t",
+    "w:noBreakHyphen": "\u2011",
+    "w:softHyphen": "\u00ad",
+}
+
+_office_document_relationship = ("http://schemas.openxmlformats.org/"
+                                 "officeDocument/2006/relationships/"
+                                 "officeDocument")
+
+
+def _element_name(tag: str) -> str:
+    """Convert the tag of an element to its prefixed name, e.g. 'w:p'"""
+    if tag.startswith("{"):
+        namespace, local_name = tag[1:].split("}", 1)
+        return f"{_namespaces.get(namespace, namespace)}:{local_name}"
+    return tag
+
+
+def _main_document_path(archive: zipfile.ZipFile) -> str:
+    """
+    Find the path of the main document part in a Word file.
+
+    :param archive: The opened Word file
+    :return: The path of the main document inside the archive
+    """
+    try:
+        relationships = ElementTree.fromstring(archive.read("_rels/.rels"))
+    except (KeyError, ElementTree.ParseError):
+        return "word/document.xml"
+    for relationship in relationships:
+        if relationship.get("Type") == _office_document_relationship:
+            return posixpath.normpath(
+                relationship.get("Target", "").lstrip("/"))
+    return "word/document.xml"
+
+
+@dataclass
+class _ParagraphText:
+    """
+    The text of a paragraph that is being read. Like mammoth, the text of
+    the text boxes in pictures is placed after the paragraph.
+    """
+    parts: list[str] = field(default_factory=list)
+    trailing_parts: list[str] = field(default_factory=list)
+    picture_depth: int = 0
+
+    def text(self) -> str:
+        """Join the text of the paragraph, followed by an empty line"""
+        return "".join(self.parts) + "\n\n" + "".join(self.trailing_parts)
+
+
+def read_paragraphs(file: archive_reader.FileSource) -> (
+        Generator[str, None, None]):
+    """
+    Stream the text of the paragraphs of a Word file. The main document is
+    parsed incrementally and every paragraph is discarded as soon as its
+    text is yielded, so the document is never fully held in memory. The
+    text is the same as the raw text extracted by mammoth: every paragraph
+    is followed by an empty line.
+
+    :param file: The string path to the Word file, or the member of an
+        archive.
+    :return: A generator yielding the text of every paragraph.
+    """
+    with zipfile.ZipFile(archive_reader.open_file(file)) as archive:
+        with archive.open(_main_document_path(archive)) as document:
+            # Whether the text of every open element is part of the document
+            readable = [True]
+            # The open paragraphs, which can be nested in text boxes
+            paragraphs: list[_ParagraphText] = []
+            body = None
+            for event, element in ElementTree.iterparse(
+                    document, events=("start", "end")):
+                name = _element_name(element.tag)
+                if event == "start":
+                    is_readable = readable[-1] and name in _text_containers
+                    readable.append(is_readable)
+                    if is_readable and name == "w:p":
+                        paragraphs.append(_ParagraphText())
+                    elif is_readable and name == "w:pict" and paragraphs:
+                        paragraphs[-1].picture_depth += 1
+                    elif name == "w:body":
+                        body = element
+                    continue
+
+                is_readable = readable.pop()
+                if readable[-1] and paragraphs:
+                    if name == "w:t":
+                        paragraphs[-1].parts.append(element.text or "")
+                    elif name in _special_characters:
+                        paragraphs[-1].parts.append(_special_characters[name])
+                if is_readable and name == "w:pict" and paragraphs:
+                    paragraphs[-1].picture_depth -= 1
+                elif is_readable and name == "w:p":
+                    text = paragraphs.pop().text()
+                    if not paragraphs:
+                        yield text
+                    elif paragraphs[-1].picture_depth > 0:
+                        paragraphs[-1].trailing_parts.append(text)
+                    else:
+                        paragraphs[-1].parts.append(text)
+                if len(readable) == 3 and body is not None:
+                    # A child of the body has been read completely
+                    body.clear()
+
+
 class DocxFileImporter(file_importer_base.FileImporterBase):
     """
     Handles importing of Word files
     """
 
-    def __init__(self) -> None:
+    file_extension = ".docx"
+    magic_bytes = b"PK\x03\x04"
+    importer_version = 2
+
+    def __init__(self,
+                 text_cache: Optional[ExtractedTextCache] = None) -> None:
         """
         Initializes a new instance of the class.
-        """
-        pass
 
-    def compatible_file(self, path: str) -> bool:
+        :param text_cache: The cache of extracted text to consult before
+            parsing a file, or None to always parse the file
         """
-        A Word file is compatible with this parser if and only if
-        it can be opened and read without errors.
+        self.text_cache = text_cache
 
-        :param path: The string path to the Word file to be checked for
-                     compatibility.
-
-        :return: bool: True if the file is compatible, False otherwise.
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
         """
+        Loads a Word file and yields a File object.
 
-        if not path.endswith('.docx'):
-            return False
-
-        with open(path, "rb") as docx_file:
-            mammoth.extract_raw_text(docx_file)
-        return True
+        :param file: The string path to the Word file, or the member of an
+            archive.
+        :return: Generator[RawFile, None, None]: A generator yielding File objects.
+        """
+        extracted = self.extract_cached(file, self.extract_text)
+        yield self.generate_file(extracted["text"], file)
 
-    def load_file(self, path: str) -> Generator[RawFile, None, None]:
+    @staticmethod
+    def extract_text(file: archive_reader.FileSource) -> dict:
         """
-        Loads a Word file and yields a File object.
+        Extracts the raw text from a Word file.
 
-        :param path: The string path to the Word file.
-        :return: Generator[RawFile, None, None]: A generator yielding File objects.
+        :param file: The string path to the Word file, or the member of an
+            archive.
+        :return: A dictionary containing the text of the Word file.
         """
-        with open(path, "rb") as docx_file:
-            result = mammoth.extract_raw_text(docx_file)
-            text = result.value
-            yield self.generate_file(text, path)
+        return {"text": "".join(read_paragraphs(file))}
 
     @staticmethod
-    def generate_file(text: str, path) -> RawFile:
+    def generate_file(text: str, path: archive_reader.FileSource) -> RawFile:
         """
         Generates a File object from a Word file.
 
         :param text: A string representing the text of the Word file.
-        :param path: The string path to the Word file.
+        :param path: The string path to the Word file, or the member of an
+            archive.
         :return: A RawFile object generated from the Word file
         containing metadata and the raw text of the file.
         """
-
-        alt_title = os.path.basename(path).replace('.docx', '')
+        file_path = archive_reader.get_path(path)
+        alt_title = os.path.basename(file_path).replace('.docx', '')
 
         try:
-            mod_time = os.path.getmtime(path)
+            mod_time = archive_reader.get_modification_time(path)
             file_date = datetime.fromtimestamp(mod_time)
         except Exception:
             # If unable to get the modification time, don't set a date
@@ -76,11 +209,13 @@ class DocxFileImporter(file_importer_base.FileImporterBase):
                               title=alt_title,
                               date=file_date,
                               url=None,
-                              path=path,
+                              path=file_path,
                               format="docx",
                               length=len(text.split(" ")),
                               name=alt_title,
-                              size=os.stat(path).st_size),
+                              size=archive_reader.get_size(path),
+                              locator=DocumentLocator(
+                                  os.path.abspath(file_path))),
             body=RawBody(body=text))
 
 
@@ -0,0 +1,229 @@
+import hashlib
+import re
+import zlib
+from collections.abc import Generator, Iterable
+from typing import Optional
+
+import numpy as np
+
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_file import RawFile
+
+
+class DuplicateFilter:
+    """
+    Removes duplicate documents from the corpus before they are
+    preprocessed. Exact duplicates are found by the hash of their text, and
+    near-duplicates, such as syndicated copies of a news article with a
+    different byline, by MinHash signatures of their word shingles that are
+    looked up with locality-sensitive hashing. The first document of a set
+    of duplicates is kept.
+    """
+
+    # The largest prime below 2^31, so the products of the hash functions
+    # fit in 64 bits
+    _prime = (1 << 31) - 1
+    _word_pattern = re.compile(r"\w+")
+
+    def __init__(self, threshold: Optional[float] = 0.9,
+                 shingle_size: int = 5, permutations: int = 128,
+                 seed: int = 1) -> None:
+        """
+        Initialize a duplicate filter without any documents.
+
+        :param threshold: The estimated Jaccard similarity of the word
+            shingles of two documents from which the later document is
+            removed as a near-duplicate, or None to only remove exact
+            duplicates
+        :param shingle_size: The number of consecutive words in a shingle
+        :param permutations: The number of hash functions in the MinHash
+            signature of a document
+        :param seed: The seed of the random hash functions
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.permutations = permutations
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, self._prime, permutations,
+                                     dtype=np.uint64)
+        self._b = generator.integers(0, self._prime, permutations,
+                                     dtype=np.uint64)
+        self.bands, self.rows = self._choose_bands(threshold or 1.0,
+                                                   permutations)
+
+        # The documents that were kept, by the hash of their text
+        self._hashes: dict[bytes, Metadata] = {}
+        # The signatures of the documents that were kept, and the document
+        # of each signature in every bucket of every band
+        self._signatures: list[np.ndarray] = []
+        self._kept: list[Metadata] = []
+        self._buckets: list[dict[bytes, list[int]]] = [
+            {} for _ in range(self.bands)]
+        # The metadata of the documents that were removed
+        self.removed: list[Metadata] = []
+
+    def filter(self, files: Iterable[RawFile]) -> (
+            Generator[RawFile, None, None]):
+        """
+        Yield the files that are not a duplicate of a file that came before
+        them. The metadata of a removed file gets a description of the
+        document it duplicates and is added to the removed files.
+
+        :param files: The files to filter
+        :return: A generator yielding the files that are kept
+        """
+        for file in files:
+            original = self.find_original(file.body.body)
+            if original is None:
+                self.add(file.body.body, file.metadata)
+                yield file
+            else:
+                file.metadata.duplicate_of = self.describe_original(
+                    original)
+                self.removed.append(file.metadata)
+
+    def find_original(self, text: str) -> Optional[Metadata]:
+        """
+        Find a document that was kept of which a text is a duplicate.
+
+        :param text: The text of the document
+        :return: The metadata of the document that the text duplicates, or
+            None if the text is not a duplicate
+        """
+        original = self._hashes.get(self._content_hash(text))
+        if original is not None or self.threshold is None:
+            return original
+
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            candidates.update(buckets.get(self._band_key(signature, band),
+                                          ()))
+        # The candidates are checked in the order in which they were added
+        for index in sorted(candidates):
+            similarity = np.mean(self._signatures[index] == signature)
+            if similarity >= self.threshold:
+                return self._kept[index]
+        return None
+
+    def add(self, text: str, metadata: Metadata) -> None:
+        """
+        Add a document that is kept, so later copies of it are removed.
+
+        :param text: The text of the document
+        :param metadata: The metadata of the document
+        :return: None
+        """
+        self._hashes.setdefault(self._content_hash(text), metadata)
+        if self.threshold is None:
+            return
+
+        signature = self.signature(text)
+        if signature is None:
+            return
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._kept.append(metadata)
+        for band, buckets in enumerate(self._buckets):
+            buckets.setdefault(self._band_key(signature, band),
+                               []).append(index)
+
+    @staticmethod
+    def describe_original(metadata: Metadata) -> str:
+        """
+        Describe a document that was kept, so the user can find it among
+        the imported files. Documents from files that contain multiple
+        documents are described by their title, their file and their
+        number in the file, or their byte offset if it has no number.
+
+        :param metadata: The metadata of the document
+        :return: The description of the document
+        """
+        title = metadata.title or metadata.name
+        locator = metadata.locator
+        if locator is None or (locator.row is None
+                               and locator.offset is None):
+            return title
+        if locator.row is not None:
+            position = f"document {locator.row}"
+        else:
+            position = f"byte {locator.offset}"
+        return f"{title} ({metadata.name}, {position})"
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of the word shingles of a text. The
+        words are compared case-insensitively and without punctuation.
+
+        :param text: The text to compute the signature of
+        :return: The minimum of every hash function over the shingles, or
+            None if the text contains no words
+        """
+        words = self._word_pattern.findall(text.lower())
+        if not words:
+            return None
+        size = min(self.shingle_size, len(words))
+        shingles = {zlib.crc32(" ".join(words[index:index + size]).encode())
+                    for index in range(len(words) - size + 1)}
+        hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+        return ((np.outer(self._a, hashes) + self._b[:, np.newaxis])
+                % self._prime).min(axis=1)
+
+    def _band_key(self, signature: np.ndarray, band: int) -> bytes:
+        """Get the bucket of a signature in a band"""
+        return signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    @staticmethod
+    def _content_hash(text: str) -> bytes:
+        """Hash the text of a document, ignoring surrounding whitespace"""
+        return hashlib.blake2b(text.strip().encode("utf-8"),
+                               digest_size=16).digest()
+
+    @staticmethod
+    def _choose_bands(threshold: float, permutations: int) -> (
+            tuple[int, int]):
+        """
+        Choose the number of bands and rows per band of the signatures so
+        that documents become candidates at about the threshold. Two
+        documents with a similarity s share a bucket in at least one band
+        with a probability of 1 - (1 - s^rows)^bands, which rises most
+        steeply around (1 / bands)^(1 / rows).
+
+        :param threshold: The similarity from which documents are
+            duplicates
+        :param permutations: The length of the signatures
+        :return: The number of bands and the number of rows per band
+        """
+        options = [(permutations // rows, rows)
+                   for rows in range(1, permutations + 1)
+                   if permutations % rows == 0]
+        # The threshold of the bands is kept a bit below the threshold, so
+        # few near-duplicates are missed
+        return min(options, key=lambda option: abs(
+            (1 / option[0]) ** (1 / option[1]) - 0.9 * threshold))
+
+
+def describe_removed_duplicates(removed_duplicates: int) -> list[str]:
+    """
+    Describe the number of documents that were removed from the corpus as
+    duplicates in a message that can be shown to the user.
+
+    :param removed_duplicates: The number of removed documents
+    :return: The message, or no message if no documents were removed
+    """
+    if removed_duplicates == 0:
+        return []
+    return [f"{removed_duplicates} document(en) hadden (bijna) dezelfde "
+            f"tekst als een eerder document en zijn niet gebruikt om het "
+            f"model te trainen. Bij de geïmporteerde bestanden staat van "
+            f"welk document ze een kopie zijn."]
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Optional
+
+from tommy.controller.file_import import archive_reader
+from tommy.support.application_settings import application_settings
+from tommy.support.blob_cache import BlobCache
+
+
+class ExtractedTextCache(BlobCache):
+    """
+    A persistent store of the text that importers extracted from files.
+    Every entry is a compressed blob, keyed by the path, modification time
+    and size of the file and the type and version of the importer, like the
+    metadata index, so a file only has to be parsed again when it or its
+    importer changes and the file is not read to look up its entry.
+
+    The entries that were used least recently are removed when the total
+    size of the entries exceeds the maximum size.
+    """
+
+    def __init__(self, folder: str, max_bytes: int) -> None:
+        """
+        Initialize the cache that stores its entries in the given folder.
+
+        :param folder: The folder to store the cached entries in
+        :param max_bytes: The maximum total size of the entries in bytes
+        """
+        super().__init__(os.path.join(folder, "extracted_text"), max_bytes)
+
+    @classmethod
+    def from_application_settings(cls) -> Optional[ExtractedTextCache]:
+        """
+        Create the cache in the cache folder of the application settings.
+
+        :return: The cache, or None if caching is disabled
+        """
+        if (application_settings.cache_folder is None
+                or application_settings.extracted_text_cache_size <= 0):
+            return None
+        return cls(application_settings.cache_folder,
+                   application_settings.extracted_text_cache_size)
+
+    @staticmethod
+    def key(file: archive_reader.FileSource, importer_name: str,
+            importer_version: int) -> str:
+        """
+        Compute the key of a file for an importer from the path,
+        modification time and size of the file.
+
+        :param file: The path of the file, or the member of an archive
+        :param importer_name: The name of the importer of the file
+        :param importer_version: The version of the importer
+        :return: The key of the file in the cache
+        """
+        path = os.path.abspath(archive_reader.get_path(file))
+        if isinstance(file, str) and os.path.isfile(file):
+            stat = os.stat(file)
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        else:
+            mtime_ns = round(archive_reader.get_modification_time(file)
+                             * 1_000_000_000)
+            size = archive_reader.get_size(file)
+        file_hash = hashlib.sha256(
+            f"{path}\0{mtime_ns}\0{size}".encode("utf-8", "surrogatepass"))
+        return f"{importer_name}-v{importer_version}-{file_hash.hexdigest()}"
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -1,90 +1,174 @@
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Generator, Optional
-
-from dateutil import parser
-from dateutil.parser import ParserError
-
+from typing import Callable, Generator, Optional
+
+from tommy.controller.file_import import archive_reader
+from tommy.controller.file_import.date_parser import (
+    DateParser, DutchParseInfo, dutch_parse_info, parse_fuzzy_date)
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
 
 
-class DutchParseInfo(parser.parserinfo):
-    """
-    Dutch date information to parse dates.
-    """
-
-    def __init__(self):
-        """
-        The initialization of the DutchParseInfo object.
-        """
-        self.MONTHS = [('January', 'Januari', 'Jan', 'Jan.'),
-                       ('February', 'Februari', 'Feb', 'Feb.', 'Febr',
-                        'Febr.'),
-                       ('March', 'Maart', 'Mrt', 'Mrt.', 'Mar', 'Mar.'),
-                       ('April', 'Apr', 'Apr.'),
-                       ('May', 'Mei'),
-                       ('June', 'Juni', 'Jun', 'Jun.'),
-                       ('July', 'Juli', 'Jul', 'Jul.'),
-                       ('August', 'Augustus', 'Aug', 'Aug.'),
-                       ('September', 'Sep', 'Sep.', 'Sept', 'Sept.'),
-                       ('October', 'Oktober', 'Okt', 'Okt.', 'Oct', 'Oct.'),
-                       ('November', 'Nov', 'Nov.'),
-                       ('December', 'Dec', 'Dec.')]
-
-        self.WEEKDAYS = [('Mon', 'Monday', 'Maandag', 'Ma', 'Ma.'),
-                         ('Tue', 'Tuesday', 'Dinsdag', 'Di', 'Di.'),
-                         ('Wed', 'Wednesday', 'Woensdag', 'Wo', 'Wo.',
-                          'Woe', 'Woe.'),
-                         ('Thu', 'Thursday', 'Donderdag', 'Do', 'Do.'),
-                         ('Fri', 'Friday', 'Vrijdag', 'Vr', 'Vr.', 'Vrij',
-                          'Vrij.'),
-                         ('Sat', 'Saturday', 'Zaterdag', 'Za', 'Za.', 'Zat',
-                          'Zat.'),
-                         ('Sun', 'Sunday', 'Zondag', 'Zo', 'Zo.')]
-
-        super().__init__(dayfirst=True)
-
-
 class FileImporterBase(ABC):
     """
     Abstract base class for file importers.
     """
 
-    dutch_parse_info = DutchParseInfo()
+    dutch_parse_info: DutchParseInfo = dutch_parse_info
+    # The extension of the files that can be imported by the importer
+    file_extension: str = None
+    # The bytes that files of this type start with, used to recognize
+    # files without an extension
+    magic_bytes: Optional[bytes] = None
+    # Increase this number whenever the importer starts extracting
+    # something different, so that cached extractions are not used anymore
+    importer_version: int = 1
+    # The cache of extracted text that is consulted before parsing a file
+    text_cache: Optional[ExtractedTextCache] = None
+    # The date parser of the file that was loaded last, for importers that
+    # parse the dates of many documents in a file together
+    date_parser: Optional[DateParser] = None
 
     @abstractmethod
-    def load_file(self, path: str) -> Generator[RawFile, None, None]:
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
         """
-        Abstract method to load a file.
+        Abstract method to load a file. Problems with the contents of the
+        file, such as corruption, are raised while loading the file.
 
-        :param path: The string path of the file.
+        :param file: The string path of the file, or the member of an
+            archive that is being read.
         :return: Generator[File, None, None]: A generator yielding File
         objects.
         """
         pass
 
-    @abstractmethod
-    def compatible_file(self, path: str) -> bool:
+    def load_body(self, locator: DocumentLocator) -> RawBody:
+        """
+        Load the text of a single document. By default the file is loaded
+        and the text of its first document is returned. Importers of files
+        containing multiple documents override this method to read only
+        the requested document.
+
+        :param locator: The locator of the document.
+        :raises ValueError: if the file does not contain the document.
+        :return: The text of the document.
         """
-        Abstract method to check if a file is compatible.
+        file = next(self.load_file(locator.path), None)
+        if file is None:
+            raise ValueError(f"Het document is niet gevonden in "
+                             f"{locator.path}")
+        return file.body
 
-        :param path: The path to the file.
+    def compatible_file(self, file: archive_reader.FileSource) -> bool:
+        """
+        Check if a file is compatible with this importer, without parsing
+        the file. A file is compatible if it has the extension of this
+        importer, or if it has no extension but starts with the magic bytes
+        of this file type.
+
+        :param file: The path to the file, or the member of an archive.
         :return: bool: True is compatible, False otherwise.
         """
-        pass
+        path = archive_reader.get_path(file)
+        if os.path.splitext(path)[1] != "":
+            return path.endswith(self.file_extension)
+        return (self.magic_bytes is not None
+                and self.read_magic_bytes(file).startswith(self.magic_bytes))
+
+    @staticmethod
+    def read_magic_bytes(file: archive_reader.FileSource,
+                         length: int = 8) -> bytes:
+        """
+        Read the first bytes of a file, which identify the file type.
+
+        :param file: The path to the file, or the member of an archive.
+        :param length: The number of bytes to read.
+        :return: The first bytes of the file.
+        """
+        with archive_reader.open_file(file) as opened_file:
+            return opened_file.read(length)
+
+    def cache_name(self) -> str:
+        """
+        Get the name under which the extractions of this importer are
+        cached. Importers with settings that change what is extracted
+        include those settings in the name.
+
+        :return: The name of the importer in the extracted text cache.
+        """
+        return self.file_extension.lstrip(".")
+
+    def index_key(self) -> str:
+        """
+        Get the key that identifies what this importer extracts from a
+        file, consisting of its name, version and the settings that change
+        the extracted metadata. Indexed metadata is only reused if the key
+        did not change.
+
+        :return: The key of the importer in the metadata index.
+        """
+        return (f"{type(self).__name__}-{self.cache_name()}"
+                f"-v{self.importer_version}")
+
+    def extract_cached(self, file: archive_reader.FileSource,
+                       extract: Callable[[archive_reader.FileSource], dict]
+                       ) -> dict:
+        """
+        Extract the contents of a file, or get them from the extracted text
+        cache if the same file was extracted by this importer before.
+
+        :param file: The path to the file, or the member of an archive.
+        :param extract: The function that parses the file and returns its
+            contents as a JSON serializable dictionary.
+        :return: The extracted contents of the file.
+        """
+        if self.text_cache is None:
+            return extract(file)
+
+        key = self.text_cache.key(file, self.cache_name(),
+                                  self.importer_version)
+        extracted = self.text_cache.get(key)
+        if extracted is None:
+            extracted = extract(file)
+            self.text_cache.put(key, extracted)
+        return extracted
+
+    def fallback_date_count(self) -> int:
+        """
+        Get the number of dates in the file that was loaded last that did
+        not have the format of the other dates of the file, and needed the
+        slow fuzzy parser.
+
+        :return: The number of dates that were parsed by the fuzzy parser.
+        """
+        if self.date_parser is None:
+            return 0
+        return self.date_parser.fallback_count
+
+    def unparsed_date_count(self) -> int:
+        """
+        Get the number of documents in the file that was loaded last that
+        were loaded without a date, because their date could not be parsed.
+        Importers that raise a warning about such dates count none.
+
+        :return: The number of dates that could not be parsed.
+        """
+        return 0
 
     def parse_date(self, file_date: str) -> Optional[datetime]:
         """
-        Parse the Dutch date string into a date object.
+        Parse the Dutch date string into a date object. To parse many dates
+        of the same column or folder, use a DateParser instead.
 
         :param file_date: The date string to parse.
         :return: date: The date object .
         """
-        try:
-            return parser.parse(file_date, parserinfo=self.dutch_parse_info,
-                                fuzzy=True)
-        except ParserError:
-            return None
+        return parse_fuzzy_date(file_date)
 
 
 """
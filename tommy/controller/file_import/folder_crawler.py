@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Callable, Generator, Iterable, Optional
+
+from tommy.controller.file_import.import_progress import CancelToken
+
+
+@dataclass
+class IgnorePattern:
+    """
+    A pattern in the style of gitignore that excludes files and folders
+    from the import, e.g. '*.jpg', 'bijlagen/' or '/concepten/**/*.txt'.
+    """
+    regex: re.Pattern
+    negated: bool
+    directories_only: bool
+
+    @classmethod
+    def parse(cls, pattern: str) -> Optional[IgnorePattern]:
+        """
+        Parse a line of a gitignore-style file.
+
+        :param pattern: The line containing the pattern
+        :return: The pattern, or None if the line is empty or a comment
+        """
+        pattern = pattern.rstrip()
+        if pattern == "" or pattern.startswith("#"):
+            return None
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        directories_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # Patterns containing a slash are relative to the input folder,
+        # other patterns match a file or folder at any depth
+        if "/" in pattern:
+            regex = _translate_pattern(pattern.lstrip("/"))
+        else:
+            regex = "(?:.*/)?" + _translate_pattern(pattern)
+        return cls(re.compile(regex + r"\Z", re.DOTALL), negated,
+                   directories_only)
+
+    def matches(self, relative_path: str, is_directory: bool) -> bool:
+        """
+        Check if the pattern matches a file or folder.
+
+        :param relative_path: The path relative to the input folder, with
+            forward slashes
+        :param is_directory: Whether the path is a folder
+        :return: True if the pattern matches the path
+        """
+        if self.directories_only and not is_directory:
+            return False
+        return self.regex.match(relative_path) is not None
+
+
+def _translate_pattern(pattern: str) -> str:
+    """
+    Translate the wildcards of a gitignore-style pattern to a regular
+    expression.
+
+    :param pattern: The pattern without leading and trailing slashes
+    :return: The regular expression matching the same paths
+    """
+    regex = ""
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+        elif pattern.startswith("**", index):
+            regex += ".*"
+            index += 2
+        elif pattern[index] == "*":
+            regex += "[^/]*"
+            index += 1
+        elif pattern[index] == "?":
+            regex += "[^/]"
+            index += 1
+        elif pattern[index] == "[" and "]" in pattern[index + 2:]:
+            end = pattern.index("]", index + 2)
+            characters = pattern[index + 1:end]
+            if characters.startswith("!"):
+                characters = "^" + characters[1:]
+            characters = characters.replace("\\", "\\\\")
+            regex += f"[{characters}]"
+            index = end + 1
+        elif pattern[index] == "\\" and index + 1 < len(pattern):
+            regex += re.escape(pattern[index + 1])
+            index += 2
+        else:
+            regex += re.escape(pattern[index])
+            index += 1
+    return regex
+
+
+@dataclass
+class CrawlStatistics:
+    """
+    The number of files and folders that were skipped while crawling an
+    input folder, so they can be reported at once instead of per file.
+    """
+    unsupported_files: int = 0
+    excluded_files: int = 0
+    excluded_folders: int = 0
+    folders_too_deep: int = 0
+    file_limit_reached: bool = False
+
+    def describe(self) -> list[str]:
+        """
+        Describe the skipped files in messages that can be shown to the
+        user.
+
+        :return: A message for every reason files were skipped
+        """
+        messages = []
+        if self.unsupported_files:
+            messages.append(f"{self.unsupported_files} bestand(en) "
+                            f"overgeslagen omdat het bestandstype niet "
+                            f"ondersteund wordt")
+        if self.excluded_files or self.excluded_folders:
+            messages.append(f"{self.excluded_files} bestand(en) en "
+                            f"{self.excluded_folders} map(pen) overgeslagen "
+                            f"door de uitsluitpatronen")
+        if self.folders_too_deep:
+            messages.append(f"{self.folders_too_deep} map(pen) overgeslagen "
+                            f"omdat ze dieper liggen dan de maximale diepte")
+        if self.file_limit_reached:
+            messages.append("Het maximale aantal bestanden is bereikt, de "
+                            "overige bestanden zijn niet ingeladen")
+        return messages
+
+
+class FolderCrawler:
+    """
+    Lists the files in an input folder that can be imported. Files are
+    filtered on their name before they are opened, and hidden files and
+    folders are skipped.
+    """
+
+    # The file in the input folder with additional exclude patterns
+    ignore_file_name = ".tommyignore"
+
+    def __init__(self, is_supported: Callable[[str], bool],
+                 exclude_patterns: Iterable[str] = (),
+                 max_depth: Optional[int] = None,
+                 max_files: Optional[int] = None) -> None:
+        """
+        Initialize the folder crawler.
+
+        :param is_supported: The function that checks if the name of a
+            file has a type that can be imported
+        :param exclude_patterns: The gitignore-style patterns of the files
+            and folders to skip
+        :param max_depth: The maximum depth of the folders that are
+            crawled, where 0 only lists the files in the input folder
+            itself, or None for no limit
+        :param max_files: The maximum number of files that is listed, or
+            None for no limit
+        """
+        self.is_supported = is_supported
+        self.exclude_patterns = [pattern for pattern
+                                 in map(IgnorePattern.parse, exclude_patterns)
+                                 if pattern is not None]
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.statistics = CrawlStatistics()
+
+    def crawl(self, folder: str,
+              cancel_token: Optional[CancelToken] = None) -> (
+            Generator[str, None, None]):
+        """
+        Yield the paths of all files in a folder and its subfolders that
+        can be imported. The files of a folder are yielded before the files
+        of its subfolders. The exclude patterns in the ignore file of the
+        folder are used in addition to the given patterns.
+
+        :param folder: The path of the input folder
+        :param cancel_token: The token that stops the crawl, if any
+        :return: A generator yielding the paths of the files
+        """
+        self.statistics = CrawlStatistics()
+        patterns = self.exclude_patterns + self._read_ignore_file(folder)
+        file_count = 0
+
+        folders = [(folder, "", 0)]
+        while folders:
+            path, relative_path, depth = folders.pop()
+            subfolders = []
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if cancel_token is not None and cancel_token.cancelled:
+                    return
+                if entry.name.startswith("."):
+                    continue
+                entry_path = f"{relative_path}{entry.name}"
+                try:
+                    is_directory = entry.is_dir()
+                    # Like os.walk, linked folders are not crawled
+                    if is_directory and entry.is_symlink():
+                        continue
+                except OSError:
+                    continue
+
+                if self._is_excluded(patterns, entry_path, is_directory):
+                    if is_directory:
+                        self.statistics.excluded_folders += 1
+                    else:
+                        self.statistics.excluded_files += 1
+                elif is_directory:
+                    if self.max_depth is not None and depth >= self.max_depth:
+                        self.statistics.folders_too_deep += 1
+                    else:
+                        subfolders.append((entry.path, f"{entry_path}/",
+                                           depth + 1))
+                elif not self.is_supported(entry.name):
+                    self.statistics.unsupported_files += 1
+                else:
+                    if (self.max_files is not None
+                            and file_count >= self.max_files):
+                        self.statistics.file_limit_reached = True
+                        return
+                    file_count += 1
+                    yield entry.path
+
+            # The subfolders are crawled in the order in which they were
+            # listed
+            folders.extend(reversed(subfolders))
+
+    def _read_ignore_file(self, folder: str) -> list[IgnorePattern]:
+        """Read the exclude patterns from the ignore file of a folder"""
+        try:
+            with open(os.path.join(folder, self.ignore_file_name), "r",
+                      encoding="utf-8") as file:
+                return [pattern for pattern in map(IgnorePattern.parse, file)
+                        if pattern is not None]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _is_excluded(patterns: list[IgnorePattern], relative_path: str,
+                     is_directory: bool) -> bool:
+        """Check if the last pattern matching a path excludes it"""
+        excluded = False
+        for pattern in patterns:
+            if pattern.matches(relative_path, is_directory):
+                excluded = not pattern.negated
+        return excluded
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
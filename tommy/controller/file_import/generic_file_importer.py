@@ -1,12 +1,21 @@
 import os
-from typing import Generator
+from typing import Generator, Optional
 
+from tommy.controller.file_import import archive_file_importer
+from tommy.controller.file_import import archive_reader
 from tommy.controller.file_import import csv_file_importer
 from tommy.controller.file_import import docx_file_importer
 from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import import jsonl_file_importer
 from tommy.controller.file_import import pdf_file_importer
+from tommy.controller.file_import import rtf_file_importer
 from tommy.controller.file_import import txt_file_importer
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
+from tommy.support.application_settings import application_settings
 
 
 class GenericFileImporter:
@@ -17,30 +26,152 @@ class GenericFileImporter:
 
     def __init__(self):
         """
-        Initialization of a new GenericFileImporter object.
+        Initialization of a new GenericFileImporter object. The importers
+        of Word, PDF and RTF files use the extracted text cache in the cache
+        folder of the application settings. The PDF importer uses the PDF
+        settings and the JSON Lines importer uses the field mapping of the
+        application settings. The members of archives are imported by the
+        importers for their file types.
         """
+        text_cache = ExtractedTextCache.from_application_settings()
         self.importers: (
             list)[file_importer_base.FileImporterBase] = [
-            docx_file_importer.DocxFileImporter(),
-            pdf_file_importer.PdfFileImporter(),
+            docx_file_importer.DocxFileImporter(text_cache),
+            pdf_file_importer.PdfFileImporter(
+                text_cache, application_settings.pdf_page_workers,
+                application_settings.pdf_max_pages),
+            rtf_file_importer.RtfFileImporter(text_cache),
             csv_file_importer.CsvFileImporter(),
+            jsonl_file_importer.JsonlFileImporter(
+                application_settings.jsonl_field_mapping),
             txt_file_importer.TxtFileImporter(),
         ]
+        self._importers_by_extension: (
+            dict)[str, file_importer_base.FileImporterBase] = {
+            importer.file_extension: importer for importer in self.importers}
+        self.archive_importer = archive_file_importer.ArchiveFileImporter(
+            self.get_importer)
 
     def import_file(self, path: str) -> Generator[RawFile, None, None]:
         """
-        Imports a file from the specified path using compatible importers.
+        Imports a file from the specified path using the importer for its
+        file type. Each file is parsed only once, by the load of the
+        importer, so problems with the file are raised while loading it.
 
         :param path: The string path of the file to import.
         :return Generator[File, None, None]: A generator yielding File objects.
         """
         path = os.path.normpath(path)
 
-        for importer in self.importers:
-            if importer.compatible_file(path):
-                return importer.load_file(path)
-        raise NotImplementedError("File does not have a compatible file "
-                                  "importer implementation. Path:", path)
+        importer = self.get_importer(path)
+        if importer is None:
+            raise NotImplementedError("File does not have a compatible file "
+                                      "importer implementation. Path:", path)
+        return importer.load_file(path)
+
+    def load_body(self, locator: DocumentLocator) -> RawBody:
+        """
+        Loads the text of a single document using the importer for the type
+        of the file it is stored in.
+
+        :param locator: The locator of the document.
+        :return: The text of the document.
+        """
+        importer = self.get_importer(locator.path)
+        if importer is None:
+            raise NotImplementedError("File does not have a compatible file "
+                                      "importer implementation. Path:",
+                                      locator.path)
+        return importer.load_body(locator)
+
+    def index_key(self, path: str) -> str:
+        """
+        Get the key of the importer of a file in the metadata index. The
+        members of an archive can be imported by every importer, so the
+        key of an archive consists of the keys of all importers.
+
+        :param path: The string path of the file.
+        :return: The key of the importer of the file, which is empty if
+            there is no compatible importer.
+        """
+        importer = self.get_importer(path)
+        if importer is None:
+            return ""
+        if importer is self.archive_importer:
+            return ";".join([importer.index_key()]
+                            + [member_importer.index_key()
+                               for member_importer in self.importers])
+        return importer.index_key()
+
+    def fallback_date_count(self, path: str) -> int:
+        """
+        Get the number of dates in a file that was just imported that
+        needed the slow fuzzy parser.
+
+        :param path: The string path of the file that was imported last.
+        :return: The number of dates that were parsed by the fuzzy parser.
+        """
+        importer = self.get_importer(os.path.normpath(path))
+        if importer is None:
+            return 0
+        return importer.fallback_date_count()
+
+    def unparsed_date_count(self, path: str) -> int:
+        """
+        Get the number of documents in a file that was just imported that
+        were loaded without a date, because their date could not be parsed.
+
+        :param path: The string path of the file that was imported last.
+        :return: The number of dates that could not be parsed.
+        """
+        importer = self.get_importer(os.path.normpath(path))
+        if importer is None:
+            return 0
+        return importer.unparsed_date_count()
+
+    def has_supported_extension(self, path: str) -> bool:
+        """
+        Check if a file might be imported based on its name only, without
+        opening the file. Files without an extension are recognized by
+        their first bytes, so they can only be rejected after opening them.
+
+        :param path: The string path of the file.
+        :return: True if the file has the extension of a supported file
+            type or archive, or no extension at all.
+        """
+        extension = os.path.splitext(path)[1]
+        return (extension == "" or extension in self._importers_by_extension
+                or archive_reader.is_archive(path))
+
+    def get_importer(self, file: archive_reader.FileSource) -> (
+            Optional[file_importer_base.FileImporterBase]):
+        """
+        Get the importer for a file based on its extension. The type of a
+        file without an extension is recognized by its first bytes. Zip and
+        tar archives are imported by the archive importer.
+
+        :param file: The string path of the file, or the member of an
+            archive.
+        :return: The importer for the file, or None if there is no
+            compatible importer.
+        """
+        path = archive_reader.get_path(file)
+        extension = os.path.splitext(path)[1]
+        if archive_reader.is_archive(path):
+            importer = self.archive_importer
+        elif extension != "":
+            importer = self._importers_by_extension.get(extension)
+        else:
+            magic_bytes = file_importer_base.FileImporterBase.read_magic_bytes(
+                file)
+            importer = next((importer for importer in self.importers
+                             if importer.magic_bytes is not None
+                             and magic_bytes.startswith(importer.magic_bytes)),
+                            None)
+
+        if importer is None or not importer.compatible_file(file):
+            return None
+        return importer
 
 
 """
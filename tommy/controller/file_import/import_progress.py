@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from tommy.controller.file_import import archive_reader
+from tommy.support.event_handler import EventHandler
+
+
+class CancelToken:
+    """
+    A token that is shared between the code starting an import and the
+    code doing the import, so the import can be stopped from another
+    thread or from the user interface.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a token that has not been cancelled"""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Request the import to stop. Files that are being imported are
+        finished, but no new files are started.
+
+        :return: None
+        """
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the import has been requested to stop"""
+        return self._event.is_set()
+
+
+def get_file_type(path: str) -> str:
+    """
+    Get the type of a file from its name, under which its throughput is
+    reported.
+
+    :param path: The path of the file
+    :return: The extension of the file without the dot, e.g. 'pdf' or
+        'tar.gz'
+    """
+    name = os.path.basename(path).lower()
+    for extension in archive_reader.archive_extensions:
+        if name.endswith(extension):
+            return extension.lstrip(".")
+    extension = os.path.splitext(name)[1].lstrip(".")
+    return extension or "onbekend"
+
+
+@dataclass
+class FileTypeProgress:
+    """The progress of importing the files of a single file type"""
+    files: int = 0
+    documents: int = 0
+    bytes: int = 0
+    # The time spent importing files of this type, summed over all workers
+    seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        """The number of documents imported per second of importing"""
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class ImportProgress:
+    """
+    The progress of importing the files of an input folder. The total
+    number of files is None while the folder is still being crawled.
+    """
+    files_found: int = 0
+    files_total: Optional[int] = None
+    files_done: int = 0
+    bytes_done: int = 0
+    documents_done: int = 0
+    # The time since the import started
+    seconds: float = 0.0
+    file_types: dict[str, FileTypeProgress] = field(default_factory=dict)
+    finished: bool = False
+    cancelled: bool = False
+
+    @property
+    def documents_per_second(self) -> float:
+        """The number of documents imported per second since the start"""
+        return self.documents_done / self.seconds if self.seconds > 0 else 0.0
+
+
+class ImportProgressTracker:
+    """
+    Keeps track of the progress of an import and publishes it. To keep the
+    overhead low, the progress is published at most once per interval,
+    except when the import finishes.
+    """
+
+    def __init__(self, progress_event: EventHandler[ImportProgress],
+                 cancel_token: CancelToken,
+                 publish_interval: float = 0.1) -> None:
+        """
+        Initialize the tracker of a new import.
+
+        :param progress_event: The event to publish the progress on
+        :param cancel_token: The token that stops the import
+        :param publish_interval: The minimum number of seconds between two
+            publications of the progress
+        """
+        self.progress_event = progress_event
+        self.cancel_token = cancel_token
+        self.publish_interval = publish_interval
+        self.progress = ImportProgress()
+        self._start_time = time.monotonic()
+        self._last_publish_time = self._start_time
+
+    def file_found(self) -> None:
+        """
+        Register a file that was found while crawling the input folder.
+
+        :return: None
+        """
+        self.progress.files_found += 1
+        self._publish()
+
+    def crawl_finished(self) -> None:
+        """
+        Register that all files to import have been found.
+
+        :return: None
+        """
+        self.progress.files_total = self.progress.files_found
+        self._publish(force=True)
+
+    def file_done(self, path: str, documents: int,
+                  seconds: Optional[float] = None) -> None:
+        """
+        Register a file that has been imported.
+
+        :param path: The path of the file
+        :param documents: The number of documents in the file
+        :param seconds: The time it took to import the file, or None if the
+            file was not imported because its metadata was already known
+        :return: None
+        """
+        try:
+            size = archive_reader.get_size(path)
+        except OSError:
+            size = 0
+        self.progress.files_done += 1
+        self.progress.bytes_done += size
+        self.progress.documents_done += documents
+
+        if seconds is not None:
+            file_type = self.progress.file_types.setdefault(
+                get_file_type(path), FileTypeProgress())
+            file_type.files += 1
+            file_type.documents += documents
+            file_type.bytes += size
+            file_type.seconds += seconds
+        self._publish()
+
+    def finish(self) -> None:
+        """
+        Register that the import has finished or has been cancelled.
+
+        :return: None
+        """
+        self.progress.finished = True
+        self.progress.cancelled = self.cancel_token.cancelled
+        self._publish(force=True)
+
+    def _publish(self, force: bool = False) -> None:
+        """Publish the progress if the publish interval has passed"""
+        now = time.monotonic()
+        if not force and now - self._last_publish_time < self.publish_interval:
+            return
+        self._last_publish_time = now
+        self.progress.seconds = now - self._start_time
+        self.progress_event.publish(self.progress)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
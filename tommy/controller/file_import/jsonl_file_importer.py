@@ -0,0 +1,258 @@
+import dataclasses
+import json
+import os.path
+from datetime import datetime
+from itertools import batched
+from typing import BinaryIO, Generator, Optional
+
+from tommy.controller.file_import import archive_reader
+from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.date_parser import DateParser
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_body import RawBody
+from tommy.controller.file_import.raw_file import RawFile
+
+
+class JsonlFileImporter(file_importer_base.FileImporterBase):
+    """
+    Handles importing of JSON Lines files, in which every line is a JSON
+    object describing one document. The lines are streamed in chunks, so
+    the memory usage does not depend on the size of the file.
+    """
+    mandatory_fields: list[str] = ['body']
+    # The fields of a document that can be read from a JSON object
+    document_fields: list[str] = ['body', 'title', 'date', 'author', 'url']
+    file_extension = ".jsonl"
+    # The number of lines of which the dates are parsed together
+    chunk_size: int = 1000
+
+    def __init__(self,
+                 field_mapping: Optional[dict[str, str]] = None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        :param field_mapping: The JSON keys that the fields of a document
+            are read from, for the fields whose key differs from their
+            name, e.g. {'body': 'content'}. Keys of nested objects are
+            separated by dots, e.g. {'author': 'meta.author'}.
+        """
+        self.field_mapping = {field: field for field in self.document_fields}
+        self.field_mapping.update(field_mapping or {})
+        # The date parser of the file that was loaded last, which reports
+        # how many dates needed the slow fuzzy parser
+        self.date_parser: Optional[DateParser] = None
+
+    def index_key(self) -> str:
+        """
+        Get the key of the importer in the metadata index, which includes
+        the field mapping because it changes the metadata of the documents.
+
+        :return: The key of the importer in the metadata index.
+        """
+        mapping = ",".join(f"{field}={key}" for field, key
+                           in sorted(self.field_mapping.items()))
+        return f"{super().index_key()}-{mapping}"
+
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
+        """
+        Loads a JSON Lines file and yields File objects. Empty lines are
+        skipped. Problems with single lines are raised after all other
+        lines are loaded.
+
+        :param file: The string path to the JSON Lines file, or the member
+            of an archive.
+        :return: File: A File object generated from each line of the file.
+        """
+        path = archive_reader.get_path(file)
+        relative_path = os.path.relpath(path)
+        alt_title = os.path.basename(path).replace('.jsonl', '')
+        # The metadata values that are the same for every line
+        file_metadata = Metadata(name=relative_path.split(".")[0],
+                                 size=archive_reader.get_size(file),
+                                 length=0,
+                                 format="jsonl",
+                                 title=alt_title,
+                                 path=relative_path,
+                                 locator=DocumentLocator(
+                                     os.path.abspath(path)))
+        self.date_parser = DateParser()
+
+        errors = []
+        with archive_reader.open_file(file) as jsonl_file:
+            for lines in batched(self.read_lines(jsonl_file),
+                                 self.chunk_size):
+                documents = []
+                for line_number, offset, line in lines:
+                    try:
+                        documents.append(
+                            (line_number, offset,
+                             self.read_fields(line, line_number)))
+                    except ValueError as e:
+                        errors.append(e)
+
+                # Parse the dates of all lines in the chunk at once
+                dates = self.date_parser.parse_dates(
+                    [fields['date'] for _, _, fields in documents])
+
+                for (line_number, offset, fields), file_date in zip(
+                        documents, dates):
+                    try:
+                        yield self.generate_file(fields, file_metadata,
+                                                 line_number, file_date,
+                                                 offset)
+                        if fields['date'] is not None and file_date is None:
+                            errors.append(
+                                SyntaxWarning(
+                                    f"De datum op regel {line_number} kon "
+                                    f"niet worden geïnterpreteerd: "
+                                    f"'{fields['date']}'. Dit document is "
+                                    f"zonder datum ingeladen."))
+                    except Exception as e:
+                        errors.append(e)
+
+        if errors:
+            if len(errors) == 1:
+                raise errors[0]
+            else:
+                raise ExceptionGroup("Er zijn meerdere fouten opgetreden "
+                                     "bij het laden van het bestand: ", errors)
+
+    def load_body(self, locator: DocumentLocator) -> RawBody:
+        """
+        Load the text of a single line of a JSON Lines file, by reading only
+        the line at the byte offset of the locator.
+
+        :param locator: The locator of the line.
+        :raises ValueError: if the line does not contain a JSON object.
+        :raises KeyError: if the line has no text.
+        :return: The text of the line.
+        """
+        with archive_reader.open_file(locator.path) as jsonl_file:
+            jsonl_file.seek(locator.offset)
+            line = self.decode_line(jsonl_file.readline(), locator.offset)
+        fields = self.read_fields(line, locator.row)
+        self.check_mandatory_fields(fields, locator.row)
+        return RawBody(body=fields['body'].strip())
+
+    @staticmethod
+    def read_lines(jsonl_file: BinaryIO) -> (
+            Generator[tuple[int, int, str], None, None]):
+        """
+        Read the non-empty lines of a JSON Lines file.
+
+        :param jsonl_file: The JSON Lines file, opened in binary mode.
+        :return: A generator yielding the number, the byte offset and the
+        text of every line that is not empty.
+        """
+        offset = 0
+        for line_number, line in enumerate(jsonl_file, start=1):
+            text = JsonlFileImporter.decode_line(line, offset)
+            if text.strip() != "":
+                yield line_number, offset, text
+            offset += len(line)
+
+    @staticmethod
+    def decode_line(line: bytes, offset: int) -> str:
+        """
+        Decode a line of a JSON Lines file as UTF-8. A byte order mark at
+        the start of the file is skipped.
+
+        :param line: The bytes of the line.
+        :param offset: The byte offset of the line in the file.
+        :return: The text of the line.
+        """
+        return line.decode("utf-8-sig" if offset == 0 else "utf-8")
+
+    def read_fields(self, line: str, line_number: int) -> (
+            dict[str, Optional[str]]):
+        """
+        Read the fields of a document from a line of a JSON Lines file.
+        Empty fields are read as None.
+
+        :param line: The line containing the JSON object of the document.
+        :param line_number: The number of the line in the file. Used for
+        error presentation to the user.
+        :raises ValueError: if the line does not contain a JSON object.
+        :return: The fields of the document, by name.
+        """
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Regel {line_number} bevat geen geldige JSON: "
+                             f"{e.msg}") from e
+        if not isinstance(record, dict):
+            raise ValueError(f"Regel {line_number} bevat geen JSON object")
+
+        fields = {}
+        for field, key in self.field_mapping.items():
+            value = record
+            for part in key.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            if value is not None and not isinstance(value, str):
+                value = str(value)
+            if value is None or value == "" or value.isspace():
+                value = None
+            fields[field] = value
+        return fields
+
+    def check_mandatory_fields(self, fields: dict[str, Optional[str]],
+                               line_number: int) -> None:
+        """
+        Check that a document has a value for every mandatory field.
+
+        :param fields: The fields of the document, by name.
+        :param line_number: The number of the line in the file. Used for
+        error presentation to the user.
+        :raises KeyError: if a mandatory field is missing.
+        :return: None
+        """
+        for field in self.mandatory_fields:
+            if fields.get(field) is None:
+                raise KeyError(f"Het veld '{self.field_mapping[field]}' is "
+                               f"verplicht, maar is niet gevonden op regel "
+                               f"{line_number}")
+
+    def generate_file(self, fields: dict[str, Optional[str]],
+                      file_metadata: Metadata, line_number: int,
+                      file_date: Optional[datetime],
+                      offset: Optional[int] = None) -> RawFile:
+        """
+        Generates a File object from the fields of a document of which the
+        date has already been parsed.
+
+        :param fields: The fields of the document, by name.
+        :param file_metadata: The metadata values of the JSON Lines file.
+        :param line_number: The number of the line in the file. Used for
+        error presentation to the user.
+        :param file_date: The parsed date of the document, if any.
+        :param offset: The byte offset of the line in the file, if known.
+        :return: A RawFile object generated from the document containing
+        metadata and the raw text of the document.
+        """
+        self.check_mandatory_fields(fields, line_number)
+
+        body: str = fields['body']
+        title = fields['title']
+        return RawFile(
+            metadata=dataclasses.replace(
+                file_metadata,
+                author=fields['author'],
+                title=file_metadata.title if title is None else title,
+                date=file_date,
+                url=fields['url'],
+                # Equal to the number of parts when splitting the body on
+                # spaces
+                length=body.count(" ") + 1,
+                locator=dataclasses.replace(file_metadata.locator,
+                                            row=line_number, offset=offset)),
+            body=RawBody(body=body.strip()))
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from tommy.controller.file_import.document_locator import DocumentLocator
+
 
 @dataclass
 class Metadata:
@@ -16,6 +18,11 @@ class Metadata:
     date: datetime = None
     url: str = None
     path: str = None
+    # A description of the document that this document is a duplicate of,
+    # if it was removed from the corpus as a duplicate
+    duplicate_of: str = None
+    # Where the text of the document is stored
+    locator: DocumentLocator = None
 
 
 """
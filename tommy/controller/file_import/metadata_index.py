@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Optional
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.metadata import Metadata
+
+# Increase this number whenever the importers start producing different
+# metadata, so that indices written by older versions are ignored
+INDEX_VERSION = 3
+
+
+class MetadataIndex:
+    """
+    An on-disk index of the metadata of all files in an input folder. The
+    index is stored in the cache folder, in a file named after the path of
+    the input folder, so nothing is written into the input folder. Every
+    entry is keyed by the path of the file relative to the input folder,
+    and is only valid for the same modification time, size and importer
+    of the file, so only the files that changed since the index was
+    written, or whose importer or import settings changed, have to be
+    imported again.
+    """
+
+    # The subfolder of the cache folder that contains the indices
+    subfolder_name = "metadata_index"
+
+    def __init__(self, folder: str, index_folder: Optional[str]) -> None:
+        """
+        Initialize an empty metadata index for the given input folder.
+
+        :param folder: The input folder the index belongs to
+        :param index_folder: The folder the index is stored in, or None if
+            the index is not stored
+        """
+        self.folder = folder
+        self.index_folder = index_folder
+        self._entries: dict[str, tuple[int, int, str, list[Metadata]]] = {}
+        self._new_entries: dict[
+            str, tuple[int, int, str, list[Metadata]]] = {}
+
+    @property
+    def index_path(self) -> Optional[str]:
+        """
+        The path of the file the index is stored in, which is named after
+        the hash of the absolute path of the input folder
+        """
+        if self.index_folder is None:
+            return None
+        folder_hash = hashlib.sha256(
+            os.path.abspath(self.folder).encode("utf-8")).hexdigest()
+        return os.path.join(self.index_folder, self.subfolder_name,
+                            f"{folder_hash}.json")
+
+    @classmethod
+    def load(cls, folder: str, index_folder: Optional[str]) -> MetadataIndex:
+        """
+        Load the metadata index of the given input folder. If there is no
+        valid index, an empty index is returned.
+
+        :param folder: The input folder to load the index of
+        :param index_folder: The folder the indices are stored in, usually
+            the cache folder, or None to not store the index at all
+        :return: The metadata index of the folder
+        """
+        index = cls(folder, index_folder)
+        if index.index_path is None:
+            return index
+        try:
+            with open(index.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if (data.get("version") != INDEX_VERSION
+                    or data.get("folder") != os.path.abspath(folder)):
+                return index
+            for key, entry in data["files"].items():
+                index._entries[key] = (
+                    entry["mtime"], entry["size"], entry["importer"],
+                    [index._metadata_from_dict(metadata)
+                     for metadata in entry["metadata"]])
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing or damaged index is simply rebuilt
+            index._entries.clear()
+        return index
+
+    def lookup(self, path: str, importer_key: str
+               ) -> Optional[list[Metadata]]:
+        """
+        Get the metadata of a file if neither the file nor its importer
+        changed since it was indexed. The entry is kept when the index is
+        saved again.
+
+        :param path: The path of the file
+        :param importer_key: The name, version and settings of the importer
+            of the file
+        :return: The metadata of the file, or None if the file is not in
+            the index or has changed
+        """
+        key = self._key(path)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        mtime, size, indexed_importer_key, metadata = entry
+        if ((mtime, size, indexed_importer_key)
+                != (stat.st_mtime_ns, stat.st_size, importer_key)):
+            return None
+        self._new_entries[key] = entry
+        return metadata
+
+    def store(self, path: str, importer_key: str,
+              metadata: list[Metadata]) -> None:
+        """
+        Add the metadata of a file to the index.
+
+        :param path: The path of the file
+        :param importer_key: The name, version and settings of the importer
+            of the file
+        :param metadata: The metadata of all documents in the file
+        :return: None
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        self._new_entries[self._key(path)] = (
+            stat.st_mtime_ns, stat.st_size, importer_key, metadata)
+
+    def save(self, prune: bool = True) -> None:
+        """
+        Write the index to disk. Only the files that were looked up or
+        stored since the index was loaded are kept, so files that were
+        removed from the folder disappear from the index. If the index
+        folder is not writable the index is not saved.
+
+        :param prune: Whether to remove the files that were not looked up
+            or stored, which should only be done if the whole folder was
+            visited
+        :return: None
+        """
+        if not prune:
+            self._new_entries = self._entries | self._new_entries
+        if self.index_path is None:
+            self._entries = dict(self._new_entries)
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "folder": os.path.abspath(self.folder),
+            "files": {key: {"mtime": mtime,
+                            "size": size,
+                            "importer": importer_key,
+                            "metadata": [self._metadata_to_dict(metadata)
+                                         for metadata in metadata_list]}
+                      for key, (mtime, size, importer_key, metadata_list)
+                      in self._new_entries.items()}
+        }
+        temporary_path = self.index_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temporary_path, self.index_path)
+        except OSError:
+            return
+        self._entries = dict(self._new_entries)
+
+    def _key(self, path: str) -> str:
+        """Get the key of a file, which is its path relative to the folder"""
+        return os.path.relpath(path, self.folder).replace("\\", "/")
+
+    def _metadata_to_dict(self, metadata: Metadata) -> dict:
+        """
+        Convert metadata to a dictionary that can be stored as JSON. The
+        path of the locator is stored relative to the input folder.
+        """
+        if metadata.locator is not None:
+            metadata = replace(metadata, locator=replace(
+                metadata.locator, path=self._key(metadata.locator.path)))
+        metadata_dict = asdict(metadata)
+        if metadata.date is not None:
+            metadata_dict["date"] = metadata.date.isoformat()
+        return metadata_dict
+
+    def _metadata_from_dict(self, metadata_dict: dict) -> Metadata:
+        """Convert a dictionary read from JSON back to metadata"""
+        if metadata_dict["date"] is not None:
+            metadata_dict["date"] = datetime.fromisoformat(
+                metadata_dict["date"])
+        if metadata_dict["locator"] is not None:
+            locator = DocumentLocator(**metadata_dict["locator"])
+            metadata_dict["locator"] = replace(
+                locator, path=os.path.abspath(
+                    os.path.join(self.folder, locator.path)))
+        return Metadata(**metadata_dict)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, tzinfo
+from typing import Optional, overload
+
+import numpy as np
+
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.metadata import Metadata
+
+
+class StringColumn:
+    """
+    A column of strings that stores every distinct string once. Every row
+    stores the code of its string, where code 0 is None.
+    """
+
+    def __init__(self, codes: np.ndarray, categories: list[Optional[str]]
+                 ) -> None:
+        """
+        Initialize a column from the codes of its rows.
+
+        :param codes: The code of every row
+        :param categories: The distinct strings, by code, starting with None
+        """
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[str]]) -> StringColumn:
+        """
+        Create a column from the strings of its rows.
+
+        :param values: The string of every row, or None
+        :return: The column of the strings
+        """
+        codes_by_value: dict[Optional[str], int] = {None: 0}
+        codes = np.fromiter(
+            (codes_by_value.setdefault(value, len(codes_by_value))
+             for value in values), dtype=np.int32)
+        return cls(codes, list(codes_by_value))
+
+    @classmethod
+    def concatenate(cls, columns: Sequence[StringColumn]) -> StringColumn:
+        """
+        Join columns into one column, merging their distinct strings.
+
+        :param columns: The columns to join, in order
+        :return: The column with the rows of all columns
+        """
+        codes_by_value: dict[Optional[str], int] = {None: 0}
+        parts = []
+        for column in columns:
+            mapping = np.fromiter(
+                (codes_by_value.setdefault(value, len(codes_by_value))
+                 for value in column.categories),
+                dtype=np.int32, count=len(column.categories))
+            parts.append(mapping[column.codes])
+        codes = (np.concatenate(parts) if parts
+                 else np.zeros(0, dtype=np.int32))
+        return cls(codes, list(codes_by_value))
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        """Get the string of a row"""
+        return self.categories[self.codes[row]]
+
+    def take(self, rows: np.ndarray) -> StringColumn:
+        """Get a column containing only the given rows"""
+        return StringColumn(self.codes[rows], self.categories)
+
+    def to_array(self) -> np.ndarray:
+        """Get the strings of all rows as an array of objects"""
+        return np.array(self.categories, dtype=object)[self.codes]
+
+
+class MetadataTable(Sequence[Metadata]):
+    """
+    Stores the metadata of all documents in the corpus column by column.
+    Numbers and dates are stored in NumPy arrays and strings in columns
+    that store every distinct string once, which takes far less memory than
+    a Metadata object per document. Whole columns can be read at once, and
+    every row can still be read as a Metadata object. Rows of documents
+    without metadata are read as None, and are empty in every column.
+    """
+
+    string_fields = ("name", "format", "author", "title", "url", "path",
+                     "duplicate_of")
+    number_fields = ("size", "length")
+
+    def __init__(self, strings: dict[str, StringColumn],
+                 numbers: dict[str, np.ndarray], dates: np.ndarray,
+                 timezones: dict[int, Optional[tzinfo]],
+                 locator_paths: StringColumn,
+                 locator_rows: np.ndarray,
+                 locator_offsets: np.ndarray,
+                 missing: Optional[np.ndarray] = None) -> None:
+        """
+        Initialize a table from its columns. Use from_metadata to create a
+        table from Metadata objects.
+
+        :param strings: The column of every string field
+        :param numbers: The column of every number field
+        :param dates: The dates of the rows as datetime64 without time
+            zone, NaT where there is no date
+        :param timezones: The time zone of the rows of which the date has a
+            time zone, or None for the rows of which the date is a day
+            without a time
+        :param locator_paths: The path of the locator of every row
+        :param locator_rows: The row number of the locator of every row,
+            -1 if there is no locator or it has no row number
+        :param locator_offsets: The byte offset of the locator of every
+            row, -1 if there is no locator or it has no offset
+        :param missing: Whether every row is a document without metadata,
+            or None if all documents have metadata
+        """
+        self._strings = strings
+        self._numbers = numbers
+        self._dates = dates
+        self._timezones = timezones
+        self._locator_paths = locator_paths
+        self._locator_rows = locator_rows
+        self._locator_offsets = locator_offsets
+        self._missing = (np.zeros(len(dates), dtype=bool) if missing is None
+                         else missing)
+
+    @classmethod
+    def from_metadata(cls, metadata: Iterable[Metadata]) -> MetadataTable:
+        """
+        Create a table from the metadata of documents.
+
+        :param metadata: The metadata of every document, in order
+        :return: The table containing the metadata
+        """
+        if isinstance(metadata, MetadataTable):
+            return metadata
+        metadata = list(metadata)
+        missing = np.fromiter((document is None for document in metadata),
+                              dtype=bool, count=len(metadata))
+        if missing.any():
+            # Documents without metadata are stored as empty rows
+            empty = Metadata(name=None, size=0, length=0, format=None)
+            metadata = [empty if document is None else document
+                        for document in metadata]
+
+        dates = np.full(len(metadata), np.datetime64("NaT"),
+                        dtype="datetime64[us]")
+        timezones = {}
+        for row, document in enumerate(metadata):
+            if isinstance(document.date, datetime):
+                if document.date.tzinfo is not None:
+                    timezones[row] = document.date.tzinfo
+                dates[row] = np.datetime64(
+                    document.date.replace(tzinfo=None), "us")
+            elif document.date is not None:
+                timezones[row] = None
+                dates[row] = np.datetime64(document.date, "us")
+
+        locators = [document.locator for document in metadata]
+        return cls(
+            strings={field: StringColumn.from_values(
+                getattr(document, field) for document in metadata)
+                for field in cls.string_fields},
+            numbers={field: np.fromiter(
+                (getattr(document, field) for document in metadata),
+                dtype=np.int64, count=len(metadata))
+                for field in cls.number_fields},
+            dates=dates,
+            timezones=timezones,
+            locator_paths=StringColumn.from_values(
+                None if locator is None else locator.path
+                for locator in locators),
+            locator_rows=cls._optional_numbers(
+                None if locator is None else locator.row
+                for locator in locators),
+            locator_offsets=cls._optional_numbers(
+                None if locator is None else locator.offset
+                for locator in locators),
+            missing=missing)
+
+    @classmethod
+    def concatenate(cls, tables: Sequence[MetadataTable]) -> MetadataTable:
+        """
+        Join tables into one table.
+
+        :param tables: The tables to join, in order
+        :return: The table with the rows of all tables
+        """
+        if not tables:
+            return cls.from_metadata([])
+        timezones = {}
+        start = 0
+        for table in tables:
+            timezones.update({start + row: timezone for row, timezone
+                              in table._timezones.items()})
+            start += len(table)
+        return cls(
+            strings={field: StringColumn.concatenate(
+                [table._strings[field] for table in tables])
+                for field in cls.string_fields},
+            numbers={field: np.concatenate(
+                [table._numbers[field] for table in tables])
+                for field in cls.number_fields},
+            dates=np.concatenate([table._dates for table in tables]),
+            timezones=timezones,
+            locator_paths=StringColumn.concatenate(
+                [table._locator_paths for table in tables]),
+            locator_rows=np.concatenate(
+                [table._locator_rows for table in tables]),
+            locator_offsets=np.concatenate(
+                [table._locator_offsets for table in tables]),
+            missing=np.concatenate([table._missing for table in tables]))
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Get the values of a field for all rows at once. Strings are
+        returned as an array of objects, numbers as an array of integers
+        and dates as an array of datetime64 values without time zone, with
+        NaT for documents without a date.
+
+        :param field: The name of the field of Metadata
+        :return: The value of the field for every row
+        """
+        if field in self._strings:
+            return self._strings[field].to_array()
+        if field in self._numbers:
+            return self._numbers[field]
+        if field == "date":
+            return self._dates
+        raise KeyError(f"Metadata has no column '{field}'")
+
+    def categories(self, field: str) -> tuple[np.ndarray, list[str]]:
+        """
+        Get the values of a string field as codes, which is faster than
+        comparing the strings themselves.
+
+        :param field: The name of the string field of Metadata
+        :return: The code of every row and the string of every code, where
+            code 0 is None
+        """
+        column = self._strings[field]
+        return column.codes, column.categories
+
+    def take(self, rows: Sequence[int] | np.ndarray) -> MetadataTable:
+        """
+        Get a table containing only the given rows.
+
+        :param rows: The numbers of the rows, in the order of the new table
+        :return: The table with the given rows
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        new_rows = {old_row: new_row for new_row, old_row
+                    in enumerate(rows.tolist())}
+        return MetadataTable(
+            strings={field: column.take(rows)
+                     for field, column in self._strings.items()},
+            numbers={field: column[rows]
+                     for field, column in self._numbers.items()},
+            dates=self._dates[rows],
+            timezones={new_rows[row]: timezone for row, timezone
+                       in self._timezones.items() if row in new_rows},
+            locator_paths=self._locator_paths.take(rows),
+            locator_rows=self._locator_rows[rows],
+            locator_offsets=self._locator_offsets[rows],
+            missing=self._missing[rows])
+
+    def __len__(self) -> int:
+        """The number of documents in the table"""
+        return len(self._dates)
+
+    @overload
+    def __getitem__(self, row: int) -> Optional[Metadata]:
+        ...
+
+    @overload
+    def __getitem__(self, row: slice) -> MetadataTable:
+        ...
+
+    def __getitem__(self, row):
+        """
+        Get the metadata of a row as a Metadata object, or a table with a
+        slice of the rows. Changing the Metadata object does not change the
+        table.
+
+        :param row: The number of the row, or a slice of rows
+        :return: The metadata of the row, or None if the document of the
+            row has no metadata, or the table with the rows
+        """
+        if isinstance(row, slice):
+            return self.take(np.arange(len(self))[row])
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("MetadataTable index out of range")
+        if self._missing[row]:
+            return None
+
+        fields = {field: column[row]
+                  for field, column in self._strings.items()}
+        fields.update({field: int(column[row])
+                       for field, column in self._numbers.items()})
+        return Metadata(date=self._get_date(row),
+                        locator=self._get_locator(row), **fields)
+
+    def __iter__(self):
+        """Iterate over the metadata of every row"""
+        return (self[row] for row in range(len(self)))
+
+    def _get_date(self, row: int) -> Optional[datetime | date]:
+        """Get the date of a row as it was stored"""
+        value = self._dates[row]
+        if np.isnat(value):
+            return None
+        value = value.astype(datetime)
+        if row not in self._timezones:
+            return value
+        timezone = self._timezones[row]
+        return value.date() if timezone is None else value.replace(
+            tzinfo=timezone)
+
+    def _get_locator(self, row: int) -> Optional[DocumentLocator]:
+        """Get the locator of a row"""
+        path = self._locator_paths[row]
+        if path is None:
+            return None
+        locator_row = int(self._locator_rows[row])
+        offset = int(self._locator_offsets[row])
+        return DocumentLocator(path,
+                               row=None if locator_row < 0 else locator_row,
+                               offset=None if offset < 0 else offset)
+
+    @staticmethod
+    def _optional_numbers(values: Iterable[Optional[int]]) -> np.ndarray:
+        """Store numbers that may be None in an array, with -1 for None"""
+        return np.fromiter((-1 if value is None else value
+                            for value in values), dtype=np.int64)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
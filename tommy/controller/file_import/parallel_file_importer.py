@@ -0,0 +1,212 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Generator, Iterable, Optional
+
+from tommy.controller.file_import.generic_file_importer import (
+    GenericFileImporter)
+from tommy.controller.file_import.import_progress import CancelToken
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_file import RawFile
+
+# Every worker process keeps its own importer, so the importers do not have
+# to be sent to the workers for every file
+_worker_file_importer: GenericFileImporter = None
+
+
+@dataclass
+class ImportResult:
+    """
+    The outcome of importing a single file: all files (or only their
+    metadata) that could be read, the time the import took, the number of
+    dates that needed the fuzzy parser or could not be parsed and, if
+    something went wrong, a description of the problem
+    """
+    path: str
+    files: list[RawFile] = field(default_factory=list)
+    metadata: list[Metadata] = field(default_factory=list)
+    error: Optional[str] = None
+    seconds: float = 0.0
+    fallback_dates: int = 0
+    unparsed_dates: int = 0
+
+
+def describe_import_error(path: str, error: Exception) -> str:
+    """
+    Describe an error that occurred while importing a file in a message
+    that can be shown to the user.
+
+    :param path: The path of the file that could not be (fully) imported
+    :param error: The error that occurred during the import
+    :return: The description of the error
+    """
+    file = os.path.basename(path)
+    match error:
+        case NotImplementedError():
+            return (f"{file} bestaat uit een niet ondersteund file format. "
+                    f"pad: {path}")
+        case UnicodeDecodeError():
+            return (f"Dit bestand kon niet worden gedecodeerd: {file}. "
+                    f"Probleem: {error}")
+        case Warning():
+            return f"Waarschuwing bij bestand '{file}': {error}"
+        case ExceptionGroup():
+            error_lines = "\n".join(str(sub_error)
+                                    for sub_error in error.exceptions)
+            return (f"Er zijn meerdere fouten opgetreden bij het laden van "
+                    f"dit bestand: {file}. Problemen:\n{error_lines}")
+        case _:
+            return (f"Er is een probleem opgetreden bij het laden van dit "
+                    f"bestand:  {file}. Probleem: {error}")
+
+
+def describe_fallback_dates(fallback_dates: int) -> list[str]:
+    """
+    Describe the number of dates that did not have the format of the other
+    dates of their file in a message that can be shown to the user.
+
+    :param fallback_dates: The number of dates that needed the fuzzy parser
+    :return: The message, or no message if all dates had the format of
+        their file
+    """
+    if fallback_dates == 0:
+        return []
+    return [f"{fallback_dates} datum(s) hadden een ander formaat dan de "
+            f"overige datums in hun bestand en zijn met de langzamere "
+            f"flexibele methode geïnterpreteerd"]
+
+
+def describe_unparsed_dates(unparsed_dates: int) -> list[str]:
+    """
+    Describe the number of documents that were imported without a date,
+    because their date could not be parsed, in a message that can be shown
+    to the user.
+
+    :param unparsed_dates: The number of dates that could not be parsed
+    :return: The message, or no message if all dates could be parsed
+    """
+    if unparsed_dates == 0:
+        return []
+    return [f"De datum van {unparsed_dates} document(en) kon niet worden "
+            f"geïnterpreteerd. Deze documenten zijn zonder datum ingeladen."]
+
+
+def import_file_safely(path: str, metadata_only: bool = False) -> (
+        ImportResult):
+    """
+    Import all files from the given path without raising errors. Files
+    that were read before an error occurred are still part of the result.
+
+    :param path: The path of the file to import
+    :param metadata_only: Only keep the metadata of the files, so the
+        bodies do not have to be kept in memory or sent between processes
+    :return: The imported files and the description of the error, if any
+    """
+    global _worker_file_importer
+    if _worker_file_importer is None:
+        _worker_file_importer = GenericFileImporter()
+
+    result = ImportResult(path)
+    start_time = time.perf_counter()
+    try:
+        for file in _worker_file_importer.import_file(path):
+            if metadata_only:
+                result.metadata.append(file.metadata)
+            else:
+                result.files.append(file)
+    except Exception as e:
+        result.error = describe_import_error(path, e)
+    result.fallback_dates = _worker_file_importer.fallback_date_count(path)
+    result.unparsed_dates = _worker_file_importer.unparsed_date_count(path)
+    result.seconds = time.perf_counter() - start_time
+    return result
+
+
+def import_files_safely(paths: tuple[str, ...],
+                        metadata_only: bool = False) -> list[ImportResult]:
+    """
+    Import a batch of files without raising errors, so a worker process
+    can import multiple files per task.
+
+    :param paths: The paths of the files to import
+    :param metadata_only: Only keep the metadata of the files
+    :return: The result of every file, in the order of the given paths
+    """
+    return [import_file_safely(path, metadata_only) for path in paths]
+
+
+class ParallelFileImporter:
+    """
+    Imports files using a pool of worker processes, so the text of
+    multiple files can be extracted at the same time. Only a few batches
+    of files per worker are sent to the pool at once, so the paths can be
+    produced while the files are imported and the import can be stopped
+    without waiting for all files.
+    """
+
+    def __init__(self, workers: int, chunk_size: int = 8,
+                 batches_per_worker: int = 2) -> None:
+        """
+        Initialize the parallel file importer.
+
+        :param workers: The number of worker processes to use
+        :param chunk_size: The number of files that is sent to a worker
+            process at once
+        :param batches_per_worker: The number of batches of files per
+            worker that is waiting to be imported at any time
+        """
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.batches_per_worker = batches_per_worker
+
+    def import_files(self, paths: Iterable[str],
+                     metadata_only: bool = False,
+                     cancel_token: Optional[CancelToken] = None) -> (
+            Generator[ImportResult, None, None]):
+        """
+        Import all given files in parallel. The results are yielded in the
+        same order as the given paths, regardless of which worker finishes
+        first. When the import is cancelled, the files that are being
+        imported are finished but no other files are imported.
+
+        :param paths: The paths of the files to import
+        :param metadata_only: Only return the metadata of the files
+        :param cancel_token: The token that stops the import, if any
+        :return: A generator yielding an ImportResult for every imported
+            path
+        """
+        batches = batched(paths, self.chunk_size)
+        max_pending = self.workers * self.batches_per_worker
+        pending: deque[Future] = deque()
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+                if cancel_token is not None and cancel_token.cancelled:
+                    # Batches that have not been started are dropped
+                    for future in pending:
+                        future.cancel()
+                else:
+                    while len(pending) < max_pending:
+                        batch = next(batches, None)
+                        if batch is None:
+                            break
+                        pending.append(executor.submit(
+                            import_files_safely, batch, metadata_only))
+                if not pending:
+                    break
+                future = pending.popleft()
+                if not future.cancelled():
+                    yield from future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
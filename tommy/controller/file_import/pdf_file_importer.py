@@ -1,77 +1,163 @@
 import os.path
-from os import stat
-from typing import Generator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Generator, Optional
 
 from pypdf import PdfReader, DocumentInformation
+from pypdf.generic import NameObject, TextStringObject
 
+from tommy.controller.file_import import archive_reader
 from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+from tommy.controller.file_import.document_locator import DocumentLocator
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
 
 
+def extract_page_range(path: str, start: int, stop: int) -> str:
+    """
+    Extract the text of a range of pages of a PDF file. This is done in a
+    separate process, so the file is opened again.
+
+    :param path: The string path to the PDF file.
+    :param start: The index of the first page to extract.
+    :param stop: The index after the last page to extract.
+    :return: The text of the pages in the range.
+    """
+    with archive_reader.open_file(path) as file:
+        pdf = PdfReader(file)
+        return "".join(pdf.pages[index].extract_text()
+                       for index in range(start, stop))
+
+
 class PdfFileImporter(file_importer_base.FileImporterBase):
     """
     Handles importing of PDF files
     """
 
-    def __init__(self) -> None:
+    file_extension = ".pdf"
+    magic_bytes = b"%PDF-"
+
+    # The entries of the document information that are used for the metadata
+    document_information_keys = ["/Author", "/Title", "/CreationDate"]
+    # The number of pages that a page worker extracts at once
+    pages_per_task: int = 50
+
+    def __init__(self,
+                 text_cache: Optional[ExtractedTextCache] = None,
+                 page_workers: int = 1,
+                 max_pages: Optional[int] = None) -> None:
         """
         Initializes a new instance of the class.
-        """
-        pass
 
-    def compatible_file(self, path: str) -> bool:
+        :param text_cache: The cache of extracted text to consult before
+            parsing a file, or None to always parse the file
+        :param page_workers: The number of processes that extract the pages
+            of a long PDF file in parallel
+        :param max_pages: The maximum number of pages that is read from a
+            PDF file, or None to read all pages
         """
-        A PDF file is compatible with this parser if and only if
-        the file extension is .pdf and the file is not corrupted.
+        self.text_cache = text_cache
+        self.page_workers = page_workers
+        self.max_pages = max_pages
 
-        :param path: The string path to the PDF file to be checked for
-                     compatibility.
-        :return: bool: True if the file is compatible, False otherwise.
+    def cache_name(self) -> str:
         """
-        if not path.endswith('.pdf'):
-            return False
+        Get the name under which the extractions of this importer are
+        cached, which depends on the maximum number of pages.
 
-        with open(path, 'rb') as file:
-            PdfReader(file)
-        return True
+        :return: The name of the importer in the extracted text cache.
+        """
+        if self.max_pages is None:
+            return super().cache_name()
+        return f"{super().cache_name()}-max{self.max_pages}"
 
-    def load_file(self, path: str) -> Generator[RawFile, None, None]:
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
         """
         Loads a PDF file and yields File objects.
 
-        :param path: The string path to the PDF file.
+        :param file: The string path to the PDF file, or the member of an
+            archive.
         :return: File: A File object generated from each page of the PDF.
         """
         try:
-            with open(path, 'rb') as file:
-                pdf = PdfReader(file)
-                metadata = pdf.metadata
-
-                # Bundle all pages together into one document
-                text = ''
-                for page in pdf.pages:
-                    text += page.extract_text()
+            extracted = self.extract_cached(file, self.extract_text)
         except Exception as e:
-            raise Exception(f"kon niet correct gelezen worden: {e}")
+            raise Exception(f"kon niet correct gelezen worden: {e}") from e
 
-        yield self.generate_file(text, path, metadata)
+        metadata = DocumentInformation()
+        for key, value in extracted["information"].items():
+            metadata[NameObject(key)] = TextStringObject(value)
+
+        yield self.generate_file(extracted["text"], file, metadata)
+
+    def extract_text(self, file: archive_reader.FileSource) -> dict:
+        """
+        Extracts the text and the document information from a PDF file.
+        Long files are split into ranges of pages that are extracted in
+        parallel when more than one page worker is used. The page workers
+        open the file again, from the archive if it is inside one.
+
+        :param file: The string path to the PDF file, or the member of an
+            archive.
+        :return: A dictionary containing the text of all pages and the
+            document information entries used for the metadata.
+        """
+        with archive_reader.open_file(file) as pdf_file:
+            pdf = PdfReader(pdf_file)
+            information = pdf.metadata or {}
+            n_pages = len(pdf.pages)
+            if self.max_pages is not None:
+                n_pages = min(n_pages, self.max_pages)
+
+            if self.page_workers > 1 and n_pages > self.pages_per_task:
+                page_texts = self._extract_pages_in_parallel(
+                    archive_reader.get_path(file), n_pages)
+            else:
+                page_texts = [pdf.pages[index].extract_text()
+                              for index in range(n_pages)]
+
+            # Bundle all pages together into one document
+            return {"text": "".join(page_texts),
+                    "information": {key: str(information[key])
+                                    for key in self.document_information_keys
+                                    if key in information}}
+
+    def _extract_pages_in_parallel(self, path: str, n_pages: int) -> (
+            list[str]):
+        """
+        Extract the text of the first pages of a PDF file using a pool of
+        processes, each reading its own range of pages.
+
+        :param path: The string path to the PDF file.
+        :param n_pages: The number of pages to extract.
+        :return: The text of every range of pages, in order.
+        """
+        starts = range(0, n_pages, self.pages_per_task)
+        stops = [min(start + self.pages_per_task, n_pages)
+                 for start in starts]
+        with ProcessPoolExecutor(max_workers=self.page_workers) as executor:
+            return list(executor.map(extract_page_range,
+                                     repeat(path), starts, stops))
 
     @staticmethod
-    def generate_file(file: str, path: str, metadata: DocumentInformation) -> (
-            RawFile):
+    def generate_file(file: str, path: archive_reader.FileSource,
+                      metadata: DocumentInformation) -> RawFile:
         """
         Generates a File object from a PDF page.
 
         :param file: A string representing a page of PDF data.
-        :param path: The string path to the PDF file.
+        :param path: The string path to the PDF file, or the member of an
+            archive.
         :param metadata: The metadata of the PDF file.
         :return: A RawFile object generated from the PDF page
         containing metadata and the raw text of the file.
         """
-
-        alt_title = os.path.basename(path).replace('.pdf', '')
+        file_path = archive_reader.get_path(path)
+        alt_title = os.path.basename(file_path).replace('.pdf', '')
 
         try:
             date = metadata.creation_date
@@ -83,11 +169,13 @@ class PdfFileImporter(file_importer_base.FileImporterBase):
             metadata=Metadata(author=metadata.get('/Author', None),
                               title=metadata.get('/Title', alt_title),
                               date=date,
-                              path=os.path.relpath(path),
+                              path=os.path.relpath(file_path),
                               format="pdf",
                               length=len(file.split(" ")),
                               name=alt_title,
-                              size=stat(path).st_size),
+                              size=archive_reader.get_size(path),
+                              locator=DocumentLocator(
+                                  os.path.abspath(file_path))),
             body=RawBody(body=file))
 
 
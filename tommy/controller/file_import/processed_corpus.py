@@ -1,20 +1,229 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional
+
+import numpy as np
+from gensim.corpora import Dictionary
+
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.metadata_table import MetadataTable
+from tommy.controller.file_import.processed_body import ProcessedBody
 from tommy.controller.file_import.processed_file import ProcessedFile
 
 
-@dataclass
 class ProcessedCorpus:
     """
-    The ProcessedCorpus class is an iterable of ProcessedFile objects
+    The ProcessedCorpus class is an iterable of ProcessedFile objects. The
+    tokens of all documents are stored in the style of a compressed sparse
+    row matrix: every distinct token is stored once in the vocabulary, and
+    the documents are a single array of token ids with the offset at which
+    every document starts. This takes far less memory than a list of
+    strings per document, and bags of words can be computed without
+    hashing the strings again.
+
+    The ids of the tokens are assigned in the same order as a gensim
+    Dictionary assigns them when it is built from the documents, so models
+    trained on the corpus do not depend on how it was stored. The metadata
+    of the documents is stored in a MetadataTable.
     """
-    documents: list[ProcessedFile] = None
 
-    def __iter__(self):
+    def __init__(self, documents: Iterable[ProcessedFile] = None) -> None:
+        """
+        Initialize the corpus from the processed files.
+
+        :param documents: The processed files, in order
+        """
+        self.documents = documents
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[ProcessedFile]
+                       ) -> ProcessedCorpus:
+        """
+        Create a corpus from processed files.
+
+        :param documents: The processed files, in order
+        :return: The corpus containing the files, which is the given corpus
+            itself if the files already are a corpus
+        """
+        if isinstance(documents, ProcessedCorpus):
+            return documents
+        return cls(documents)
+
+    @classmethod
+    def from_token_ids(cls, metadata: Iterable[Metadata] | MetadataTable,
+                       vocabulary: list[str], tokens: np.ndarray,
+                       offsets: np.ndarray) -> ProcessedCorpus:
+        """
+        Create a corpus from token ids in any order. Tokens of the
+        vocabulary that are not used are removed and the ids are assigned
+        again in the order of a gensim Dictionary.
+
+        :param metadata: The metadata of every document
+        :param vocabulary: The token of every id
+        :param tokens: The token ids of all documents, one after the other
+        :param offsets: The index in the tokens at which every document
+            starts, followed by the number of tokens
+        :return: The corpus with the documents
+        """
+        # The tokens keep their integer type, so the token ids of a large
+        # corpus are not copied to a wider type
+        tokens = np.asarray(tokens)
+        offsets = np.asarray(offsets, dtype=np.int64)
+
+        # A gensim Dictionary gives the new tokens of every document the
+        # next ids, in alphabetical order
+        used_ids, first_indices = np.unique(tokens, return_index=True)
+        first_documents = (np.searchsorted(offsets, first_indices,
+                                           side="right") - 1).tolist()
+        order = sorted(range(len(used_ids)), key=lambda index: (
+            first_documents[index], vocabulary[used_ids[index]]))
+
+        new_ids = np.zeros(len(vocabulary), dtype=np.int32)
+        new_ids[used_ids[order]] = np.arange(len(order), dtype=np.int32)
+
+        corpus = cls.__new__(cls)
+        corpus.metadata = MetadataTable.from_metadata(metadata)
+        corpus.vocabulary = [vocabulary[used_ids[index]] for index in order]
+        corpus.tokens = new_ids[tokens]
+        corpus.offsets = offsets
+        return corpus
+
+    @property
+    def documents(self) -> list[ProcessedFile]:
+        """The processed files of the corpus, with their tokens as strings"""
+        return list(self)
+
+    @documents.setter
+    def documents(self, documents: Optional[Iterable[ProcessedFile]]
+                  ) -> None:
+        """
+        Replace the documents of the corpus by the given files. The token
+        ids of every file are stored in a small array, so the ids of the
+        whole corpus are never held in a list of Python integers.
+        """
+        token_ids: dict[str, int] = {}
+        metadata = []
+        chunks = []
+        for document in documents or ():
+            metadata.append(document.metadata)
+            tokens = document.body.body
+            chunks.append(np.fromiter(
+                (token_ids.setdefault(token, len(token_ids))
+                 for token in tokens), dtype=np.int32, count=len(tokens)))
+
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        tokens = (np.concatenate(chunks) if chunks
+                  else np.zeros(0, dtype=np.int32))
+        del chunks
+        corpus = ProcessedCorpus.from_token_ids(
+            metadata, list(token_ids), tokens, offsets)
+        self.metadata = corpus.metadata
+        self.vocabulary = corpus.vocabulary
+        self.tokens = corpus.tokens
+        self.offsets = corpus.offsets
+
+    def __len__(self) -> int:
+        """The number of documents in the corpus"""
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[ProcessedFile]:
         """
         :return: an iterator of ProcessedFile objects
         """
-        return iter(self.documents)
+        vocabulary = np.array(self.vocabulary, dtype=object)
+        for document, metadata in enumerate(self.metadata):
+            yield ProcessedFile(metadata, ProcessedBody(
+                vocabulary[self.get_token_ids(document)].tolist()))
+
+    def get_token_ids(self, document: int) -> np.ndarray:
+        """
+        Get the ids of the tokens of a document.
+
+        :param document: The index of the document
+        :return: The id of every token of the document, in order
+        """
+        return self.tokens[self.offsets[document]:self.offsets[document + 1]]
+
+    def take(self, documents: Sequence[int] | np.ndarray) -> ProcessedCorpus:
+        """
+        Get a corpus containing only the given documents.
+
+        :param documents: The indices of the documents, in the order of the
+            new corpus
+        :return: The corpus with the given documents
+        """
+        documents = np.asarray(documents, dtype=np.int64)
+        starts = self.offsets[documents]
+        lengths = self.offsets[documents + 1] - starts
+        offsets = np.zeros(len(documents) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # The index of every token of the new corpus in the old corpus
+        indices = (np.arange(offsets[-1], dtype=np.int64)
+                   - np.repeat(offsets[:-1] - starts, lengths))
+        return ProcessedCorpus.from_token_ids(
+            self.metadata.take(documents), self.vocabulary,
+            self.tokens[indices], offsets)
+
+    def bags_of_words(self, token2id: Optional[dict[str, int]] = None
+                      ) -> list[list[tuple[int, int]]]:
+        """
+        Count the tokens of every document, like the doc2bow method of a
+        gensim Dictionary.
+
+        :param token2id: The ids of the tokens in another dictionary, or None
+            to use the ids of the vocabulary of the corpus. Tokens that are
+            not in the dictionary are left out.
+        :return: The (token id, count) pairs of every document, sorted by
+            token id
+        """
+        tokens = self.tokens.astype(np.int64)
+        documents = np.repeat(np.arange(len(self), dtype=np.int64),
+                              np.diff(self.offsets))
+        if token2id is not None:
+            # Every distinct token is looked up once instead of every token
+            new_ids = np.fromiter(
+                (token2id.get(token, -1) for token in self.vocabulary),
+                dtype=np.int64, count=len(self.vocabulary))
+            tokens = new_ids[tokens]
+            known = tokens >= 0
+            tokens = tokens[known]
+            documents = documents[known]
+
+        width = int(tokens.max()) + 1 if len(tokens) else 1
+        pairs, counts = np.unique(documents * width + tokens,
+                                  return_counts=True)
+        bounds = np.searchsorted(pairs // width,
+                                 np.arange(len(self) + 1)).tolist()
+        ids = (pairs % width).tolist()
+        counts = counts.tolist()
+        return [list(zip(ids[start:end], counts[start:end]))
+                for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def to_dictionary(self) -> Dictionary:
+        """
+        Create the gensim Dictionary of the corpus, which has the same ids
+        as the vocabulary of the corpus.
+
+        :return: The dictionary with the ids and frequencies of all tokens
+        """
+        size = len(self.vocabulary)
+        documents = np.repeat(np.arange(len(self), dtype=np.int64),
+                              np.diff(self.offsets))
+        pairs = np.unique(documents * size + self.tokens)
+        document_frequencies = np.bincount(pairs % size, minlength=size)
+        collection_frequencies = np.bincount(self.tokens, minlength=size)
+
+        dictionary = Dictionary()
+        dictionary.token2id = {token: token_id for token_id, token
+                               in enumerate(self.vocabulary)}
+        dictionary.dfs = dict(enumerate(document_frequencies.tolist()))
+        dictionary.cfs = dict(enumerate(collection_frequencies.tolist()))
+        dictionary.num_docs = len(self)
+        dictionary.num_pos = len(self.tokens)
+        dictionary.num_nnz = len(pairs)
+        return dictionary
 
 
 """
@@ -0,0 +1,158 @@
+import os
+from datetime import datetime
+from typing import Generator, Optional
+
+from striprtf.striprtf import rtf_to_text
+
+from tommy.controller.file_import import archive_reader
+from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.extracted_text_cache import (
+    ExtractedTextCache)
+from tommy.controller.file_import.document_locator import DocumentLocator
+from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.raw_body import RawBody
+from tommy.controller.file_import.raw_file import RawFile
+
+
+class RtfFileImporter(file_importer_base.FileImporterBase):
+    """
+    Handles importing of RTF files with the layout of news articles
+    exported from LexisNexis: the title on the first lines, the date two
+    lines below the title and the text of the article between the 'Body'
+    line and the 'Graphic' or 'Classification' line.
+    """
+
+    file_extension = ".rtf"
+    magic_bytes = b"{\\rtf"
+
+    # The lines that end the text of an article, in order of preference
+    body_end_sections = ['Graphic', 'Classification']
+
+    def __init__(self,
+                 text_cache: Optional[ExtractedTextCache] = None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        :param text_cache: The cache of extracted text to consult before
+            parsing a file, or None to always parse the file
+        """
+        self.text_cache = text_cache
+        # Whether the date of the file that was loaded last could not be
+        # parsed
+        self._unparsed_date_count = 0
+
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
+        """
+        Loads an RTF file and yields a File object. An article of which the
+        date cannot be parsed is yielded without a date, and counted in
+        unparsed_date_count.
+
+        :param file: The string path to the RTF file, or the member of an
+            archive.
+        :return: Generator[RawFile, None, None]: A generator yielding File
+        objects.
+        """
+        self._unparsed_date_count = 0
+        extracted = self.extract_cached(file, self.extract_article)
+        file_date = self.parse_date(extracted["date"])
+        if file_date is None:
+            self._unparsed_date_count = 1
+        yield self.generate_file(extracted, file, file_date)
+
+    def unparsed_date_count(self) -> int:
+        """
+        Get whether the date of the article that was loaded last could not
+        be parsed.
+
+        :return: 1 if the article was loaded without a date, 0 otherwise.
+        """
+        return self._unparsed_date_count
+
+    def extract_article(self, file: archive_reader.FileSource) -> dict:
+        """
+        Extracts the title, date and text of the article in an RTF file.
+
+        :param file: The string path to the RTF file, or the member of an
+            archive.
+        :raises ValueError: if the file does not contain enough lines to
+            find the date of the article.
+        :return: A dictionary containing the title, the unparsed date and
+            the text of the article.
+        """
+        with archive_reader.open_file(file) as rtf_file:
+            rtf_content = rtf_file.read().decode('utf-8', errors='ignore')
+        lines = rtf_to_text(rtf_content).split('\n')
+
+        # The title is on the first non-empty line, and continues on the
+        # next line if that line starts with a space
+        title_index = next((index for index, line in enumerate(lines)
+                            if line.strip()), None)
+        if title_index is None:
+            raise ValueError("Het bestand bevat geen tekst")
+        title = lines[title_index].strip()
+        title_end_index = title_index
+        if (title_index + 1 < len(lines)
+                and lines[title_index + 1].startswith(' ')):
+            title += ' ' + lines[title_index + 1].strip()
+            title_end_index = title_index + 1
+
+        # The date is on the second line after the title
+        if len(lines) < title_end_index + 3:
+            raise ValueError("Het bestand bevat niet genoeg regels om de "
+                             "datum van het artikel te vinden")
+        date = lines[title_end_index + 2].lstrip(',').strip('"')
+
+        # The text of the article is between the 'Body' line and the
+        # first section after the article
+        start_index = lines.index('Body') + 1 if 'Body' in lines else 0
+        end_index = len(lines)
+        for section in self.body_end_sections:
+            if section in lines:
+                end_index = lines.index(section)
+                break
+        body = ' '.join(line for line in lines[start_index:end_index]
+                        if line != '')
+
+        return {"title": title.strip('"').strip("'"), "date": date,
+                "body": body}
+
+    @staticmethod
+    def generate_file(article: dict, path: archive_reader.FileSource,
+                      file_date: Optional[datetime]) -> RawFile:
+        """
+        Generates a File object from the article in an RTF file.
+
+        :param article: A dictionary containing the title and the text of
+            the article.
+        :param path: The string path to the RTF file, or the member of an
+            archive.
+        :param file_date: The parsed date of the article, if any.
+        :return: A RawFile object generated from the RTF file
+        containing metadata and the raw text of the file.
+        """
+        file_path = archive_reader.get_path(path)
+        alt_title = os.path.basename(file_path).replace('.rtf', '')
+        body = article["body"]
+
+        return RawFile(
+            metadata=Metadata(author=None,
+                              title=article["title"] or alt_title,
+                              date=file_date,
+                              url=None,
+                              path=file_path,
+                              format="rtf",
+                              length=len(body.split(" ")),
+                              name=alt_title,
+                              size=archive_reader.get_size(path),
+                              locator=DocumentLocator(
+                                  os.path.abspath(file_path))),
+            body=RawBody(body=body))
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional
+
+import numpy as np
+from gensim.corpora import Dictionary, MmCorpus
+
+from tommy.controller.file_import.metadata_table import MetadataTable
+from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
+from tommy.controller.file_import.processed_file import ProcessedFile
+
+
+class StreamedCorpus(ProcessedCorpus):
+    """
+    A processed corpus that is stored on disk as bags of words in the Matrix
+    Market format of gensim, so the memory it takes does not grow with the
+    number of tokens in the corpus. The bags of words are written in a
+    single pass over the processed files and are read back as a stream
+    when a model is trained. Only the metadata of the documents and the
+    dictionary of the tokens are kept in memory.
+
+    The order of the tokens within a document is not stored, so the
+    documents of the corpus contain their tokens ordered by id. The files
+    of the corpus are removed when the corpus is no longer used.
+    """
+
+    def __init__(self, folder: tempfile.TemporaryDirectory,
+                 metadata: MetadataTable, dictionary: Dictionary,
+                 rows: Optional[np.ndarray] = None) -> None:
+        """
+        Initialize a corpus from its files. Use from_documents to write the
+        files of a corpus.
+
+        :param folder: The temporary folder that contains the bags of words
+        :param metadata: The metadata of every document of the corpus
+        :param dictionary: The dictionary of the ids of the tokens
+        :param rows: The numbers of the documents in the files that are in
+            the corpus, or None if all documents are in the corpus
+        """
+        self._folder = folder
+        self._bags = MmCorpus(self._get_path(folder))
+        self._rows = rows
+        self.metadata = metadata
+        self.dictionary = dictionary
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[ProcessedFile]
+                       ) -> StreamedCorpus:
+        """
+        Write processed files to disk as bags of words. The files are read
+        one by one and the ids of their tokens are assigned as they are
+        read, so the files can be produced while the corpus is written.
+
+        :param documents: The processed files, in order
+        :return: The corpus containing the files, which is the given corpus
+            itself if the files already are a streamed corpus
+        """
+        if isinstance(documents, StreamedCorpus):
+            return documents
+
+        folder = tempfile.TemporaryDirectory(prefix="tommy-corpus-")
+        metadata = []
+        dictionary = Dictionary()
+
+        def bags_of_words():
+            for document in documents:
+                metadata.append(document.metadata)
+                yield dictionary.doc2bow(document.body.body,
+                                         allow_update=True)
+
+        MmCorpus.serialize(cls._get_path(folder), bags_of_words())
+        return cls(folder, MetadataTable.from_metadata(metadata), dictionary)
+
+    @property
+    def vocabulary(self) -> list[str]:
+        """The token of every id"""
+        return [self.dictionary[token_id]
+                for token_id in range(len(self.dictionary))]
+
+    def __len__(self) -> int:
+        """The number of documents in the corpus"""
+        return len(self.metadata)
+
+    def __iter__(self) -> Iterator[ProcessedFile]:
+        """
+        :return: an iterator of ProcessedFile objects, with the tokens of
+            every document ordered by id
+        """
+        for metadata, bag_of_words in zip(self.metadata, self._get_bags()):
+            yield ProcessedFile(metadata, ProcessedBody(
+                [self.dictionary[token_id]
+                 for token_id, count in bag_of_words
+                 for _ in range(int(count))]))
+
+    def get_token_ids(self, document: int) -> np.ndarray:
+        """
+        Get the ids of the tokens of a document.
+
+        :param document: The index of the document
+        :return: The id of every token of the document, ordered by id
+        """
+        row = document if self._rows is None else self._rows[document]
+        bag_of_words = np.array(self._bags[row],
+                                dtype=np.int64).reshape(-1, 2)
+        return np.repeat(bag_of_words[:, 0], bag_of_words[:, 1])
+
+    def take(self, documents: Sequence[int] | np.ndarray) -> StreamedCorpus:
+        """
+        Get a corpus containing only the given documents, which reads the
+        same files.
+
+        :param documents: The indices of the documents, in the order of the
+            new corpus
+        :return: The corpus with the given documents
+        """
+        documents = np.asarray(documents, dtype=np.int64)
+        rows = documents if self._rows is None else self._rows[documents]
+        return StreamedCorpus(self._folder, self.metadata.take(documents),
+                              self.dictionary, rows)
+
+    def bags_of_words(self, token2id: Optional[dict[str, int]] = None
+                      ) -> Iterable[list[tuple[int, float]]]:
+        """
+        Read the bags of words of the documents from disk as a stream.
+
+        :param token2id: The ids of the tokens in another dictionary, or None
+            to use the ids of the dictionary of the corpus. Tokens that are
+            not in the dictionary are left out.
+        :return: The (token id, count) pairs of every document, sorted by
+            token id. Without another dictionary the bags of words can be
+            read more than once, which models that train in several passes
+            need.
+        """
+        bags = self._get_bags()
+        if token2id is None or token2id == self.dictionary.token2id:
+            return bags
+        new_ids = {token_id: token2id[token] for token, token_id
+                   in self.dictionary.token2id.items() if token in token2id}
+        return (sorted((new_ids[token_id], count)
+                       for token_id, count in bag_of_words
+                       if token_id in new_ids)
+                for bag_of_words in bags)
+
+    def to_dictionary(self) -> Dictionary:
+        """
+        Get the gensim Dictionary of the corpus, which was built while the
+        corpus was written.
+
+        :return: The dictionary with the ids and frequencies of all tokens
+        """
+        return self.dictionary
+
+    def _get_bags(self) -> Iterable[list[tuple[int, float]]]:
+        """Get the bags of words of the documents in the corpus"""
+        if self._rows is None:
+            return self._bags
+        return self._bags[self._rows]
+
+    @staticmethod
+    def _get_path(folder: tempfile.TemporaryDirectory) -> str:
+        """Get the path of the bags of words in the folder of a corpus"""
+        return os.path.join(folder.name, "corpus.mm")
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
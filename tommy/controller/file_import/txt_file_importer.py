@@ -2,7 +2,9 @@ import os
 from datetime import datetime
 from typing import Generator
 
+from tommy.controller.file_import import archive_reader
 from tommy.controller.file_import import file_importer_base
+from tommy.controller.file_import.document_locator import DocumentLocator
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.file_import.raw_body import RawBody
 from tommy.controller.file_import.raw_file import RawFile
@@ -13,55 +15,44 @@ class TxtFileImporter(file_importer_base.FileImporterBase):
     Handles importing of txt files
     """
 
+    file_extension = ".txt"
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
         """
         pass
 
-    def compatible_file(self, path: str) -> bool:
-        """
-        A txt file is compatible with this parser if and only if
-        it can be opened and read without errors.
-
-        :param path: The string path to the txt file to be checked for
-                     compatibility.
-
-        :return: bool: True if the file is compatible, False otherwise.
-        """
-
-        if not path.endswith('.txt'):
-            return False
-
-        return True
-
-    def load_file(self, path: str) -> Generator[RawFile, None, None]:
+    def load_file(self, file: archive_reader.FileSource) -> (
+            Generator[RawFile, None, None]):
         """
         Loads a txt file and yields a File object.
 
-        :param path: The string path to the txt file.
+        :param file: The string path to the txt file, or the member of an
+            archive.
         :return: Generator[RawFile, None, None]: A generator yielding
         File objects.
         """
-        with open(path, "r", encoding='utf-8-sig') as txtFile:
+        with archive_reader.open_text_file(file) as txtFile:
             text = txtFile.read()
-            yield self.generate_file(text, path)
+            yield self.generate_file(text, file)
 
     @staticmethod
-    def generate_file(text: str, path) -> RawFile:
+    def generate_file(text: str, path: archive_reader.FileSource) -> RawFile:
         """
         Generates a File object from a txt file.
 
         :param text: A string representing the text of the txt file.
-        :param path: The string path to the txt file.
+        :param path: The string path to the txt file, or the member of an
+            archive.
         :return: A RawFile object generated from the txt file
         containing metadata and the raw text of the file.
         """
-
-        alt_title = os.path.basename(path).replace('.txt', '')
+        file_path = archive_reader.get_path(path)
+        alt_title = os.path.basename(file_path).replace('.txt', '')
 
         try:
-            mod_time = os.path.getmtime(path)
+            mod_time = archive_reader.get_modification_time(path)
             file_date = datetime.fromtimestamp(mod_time)
         except Exception:
             # If unable to get the modification time, don't set a date
@@ -72,11 +63,13 @@ class TxtFileImporter(file_importer_base.FileImporterBase):
                               title=alt_title,
                               date=file_date,
                               url=None,
-                              path=path,
+                              path=file_path,
                               format="txt",
                               length=len(text.split(" ")),
                               name=alt_title,
-                              size=os.stat(path).st_size),
+                              size=archive_reader.get_size(path),
+                              locator=DocumentLocator(
+                                  os.path.abspath(file_path))),
             body=RawBody(body=text))
 
 
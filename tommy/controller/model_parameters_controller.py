@@ -1,5 +1,6 @@
 from tommy.model.model_parameters_model import ModelParametersModel
 from tommy.support.model_type import ModelType
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.event_handler import EventHandler
 
 
@@ -131,6 +132,18 @@ class ModelParametersController:
         """Return the maximum number of terms in the BERTopic matrix"""
         return self._model_parameters_model.bert_max_features
 
+    def set_preprocessing_profile(self,
+                                  profile: PreprocessingProfile) -> None:
+        """
+        Set the way the texts of the corpus are preprocessed
+        :param profile: the preprocessing profile to use
+        """
+        self._model_parameters_model.preprocessing_profile = profile
+
+    def get_preprocessing_profile(self) -> PreprocessingProfile:
+        """Return the way the texts of the corpus are preprocessed"""
+        return self._model_parameters_model.preprocessing_profile
+
     @property
     def params_model_changed_event(self) -> EventHandler[None]:
         """
@@ -0,0 +1,323 @@
+import gzip
+import importlib.metadata
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import nltk
+import nltk.data
+import spacy
+import spacy.util
+from spacy.lookups import Lookups, load_lookups
+
+from tommy.support.application_settings import application_settings
+from tommy.support.preprocessing_profile import PreprocessingProfile
+from tommy.support.supported_languages import SupportedLanguage
+
+type PipelineKey = tuple[SupportedLanguage, PreprocessingProfile]
+
+# The release of spacy-lookups-data that the lemma tables in the data folder
+# were taken from
+bundled_lemma_lookups_version = "1.0.5"
+
+
+@dataclass(frozen=True)
+class PipelineDefinition:
+    """The NLP models that preprocess the texts of a language"""
+    # The folder of the SpaCy pipeline in the pipeline download folder
+    folder_name: str
+    # The components of the SpaCy pipeline that are not loaded
+    exclude: tuple[str, ...]
+    # Whether tokens are filtered on their part of speech
+    enable_pos: bool
+    # The file of the NLTK punkt sentence tokenizer
+    sentence_tokenizer_name: str
+
+
+pipeline_definitions = {
+    SupportedLanguage.Dutch: PipelineDefinition(
+        "nl_core_news_sm-3.7.0", ("parser", "tagger", "attribute_ruler"),
+        True, "dutch.pickle"),
+    # tagger is taking over the role of the morphologizer (supposedly)
+    SupportedLanguage.English: PipelineDefinition(
+        "en_core_web_sm-3.7.1", ("parser",), False, "english.pickle"),
+}
+
+
+class PipelineRegistry:
+    """
+    Loads the SpaCy pipelines and NLTK sentence tokenizers of the supported
+    languages when they are first used, and keeps them in memory so
+    switching back to a language does not load its pipeline again. When the
+    loaded pipelines exceed the memory budget, the pipelines that were used
+    least recently are unloaded. A pipeline can be loaded in a background
+    thread before it is needed.
+
+    Every language has a pipeline per preprocessing profile. The pipeline
+    of the throughput profile only has the tokenizer of the SpaCy pipeline
+    and a lemmatizer that looks up the lemma of every word in a table, so
+    none of the trained components of the SpaCy pipeline are run. The lemma
+    tables of the supported languages are shipped in the data folder.
+    """
+
+    def __init__(self, memory_budget: int) -> None:
+        """
+        Initialize the registry without any loaded models.
+
+        :param memory_budget: The estimated number of bytes that the loaded
+            SpaCy pipelines may use together. The pipeline that was used
+            last is always kept.
+        """
+        self.memory_budget = memory_budget
+        self._pipelines: OrderedDict[PipelineKey, spacy.Language] = (
+            OrderedDict())
+        self._pipeline_sizes: dict[PipelineKey, int] = {}
+        self._sentence_tokenizers: dict[SupportedLanguage,
+                                        nltk.PunktSentenceTokenizer] = {}
+        # Models are loaded by one thread at a time, so a model that is
+        # being warmed up is not loaded a second time when it is needed
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def get_definition(language: SupportedLanguage) -> PipelineDefinition:
+        """
+        Get the models that preprocess the texts of a language.
+
+        :param language: The language of the texts
+        :raises ValueError: if the language cannot be preprocessed
+        :return: The definition of the models of the language
+        """
+        definition = pipeline_definitions.get(language)
+        if definition is None:
+            raise ValueError("Unsupported preprocessing language")
+        return definition
+
+    def get_pipeline(self, language: SupportedLanguage,
+                     profile: PreprocessingProfile = PreprocessingProfile.Full
+                     ) -> spacy.Language:
+        """
+        Get the SpaCy pipeline of a language, loading it if it is not in
+        memory.
+
+        :param language: The language of the pipeline
+        :param profile: The preprocessing profile of the pipeline
+        :return: The pipeline, including the component that merges entities
+            if the pipeline recognizes entities
+        """
+        key = (language, profile)
+        with self._lock:
+            nlp = self._pipelines.get(key)
+            if nlp is not None:
+                self._pipelines.move_to_end(key)
+                return nlp
+
+            definition = self.get_definition(language)
+            exclude = self._get_excluded_components(definition, profile)
+            nlp = spacy.load(self._get_pipeline_path(definition),
+                             exclude=list(exclude))
+            if profile == PreprocessingProfile.Throughput:
+                lemmatizer = nlp.add_pipe("lemmatizer",
+                                          config={"mode": "lookup"})
+                lemmatizer.initialize(
+                    lookups=self._load_lemma_lookups(nlp.lang))
+            else:
+                nlp.add_pipe("merge_entities")
+            self._pipelines[key] = nlp
+            self._pipeline_sizes[key] = self._estimate_size(definition,
+                                                            exclude)
+            self._unload_pipelines()
+            return nlp
+
+    def get_pipeline_id(self, language: SupportedLanguage,
+                        profile: PreprocessingProfile = (
+                            PreprocessingProfile.Full)) -> str:
+        """
+        Get the identity of the SpaCy pipeline of a language, without
+        loading the pipeline.
+
+        :param language: The language of the pipeline
+        :param profile: The preprocessing profile of the pipeline
+        :return: The language, SpaCy version and name and version of the
+            pipeline, and for the throughput profile the source of the
+            lemma tables
+        """
+        definition = self.get_definition(language)
+        meta = spacy.util.load_meta(os.path.join(
+            self._get_pipeline_path(definition), "meta.json"))
+        pipeline_id = (f"{language.name}-spacy{spacy.__version__}-"
+                       f"{meta['lang']}_{meta['name']}-{meta['version']}-"
+                       f"{','.join(definition.exclude)}")
+        if profile == PreprocessingProfile.Throughput:
+            if os.path.isfile(self._get_lemma_lookup_path(meta["lang"])):
+                lookups = f"lookups{bundled_lemma_lookups_version}"
+            else:
+                try:
+                    lookups = "lookups" + importlib.metadata.version(
+                        "spacy-lookups-data")
+                except importlib.metadata.PackageNotFoundError:
+                    lookups = "nolookups"
+            pipeline_id = f"{pipeline_id}-throughput-{lookups}"
+        return pipeline_id
+
+    def get_sentence_tokenizer(self, language: SupportedLanguage) -> (
+            nltk.PunktSentenceTokenizer):
+        """
+        Get the NLTK sentence tokenizer of a language, loading it if it is
+        not in memory.
+
+        :param language: The language of the tokenizer
+        :raises LookupError: if the tokenizer cannot be loaded
+        :return: The punkt sentence tokenizer
+        """
+        with self._lock:
+            tokenizer = self._sentence_tokenizers.get(language)
+            if tokenizer is None:
+                tokenizer = self._load_nltk_sent_tokenizer(
+                    self.get_definition(language).sentence_tokenizer_name)
+                self._sentence_tokenizers[language] = tokenizer
+            return tokenizer
+
+    def is_loaded(self, language: SupportedLanguage,
+                  profile: PreprocessingProfile = PreprocessingProfile.Full
+                  ) -> bool:
+        """
+        Check if the SpaCy pipeline of a language is in memory.
+
+        :param language: The language of the pipeline
+        :param profile: The preprocessing profile of the pipeline
+        :return: True if the pipeline does not have to be loaded
+        """
+        return (language, profile) in self._pipelines
+
+    def warm_up(self, language: SupportedLanguage,
+                profile: PreprocessingProfile = PreprocessingProfile.Full
+                ) -> threading.Thread:
+        """
+        Load the SpaCy pipeline of a language in a background thread, so it
+        is ready when it is first used.
+
+        :param language: The language of the pipeline
+        :param profile: The preprocessing profile of the pipeline
+        :return: The thread that loads the pipeline
+        """
+        def load() -> None:
+            try:
+                self.get_pipeline(language, profile)
+            except (OSError, ValueError):
+                # The error is raised again when the pipeline is used
+                return
+
+        thread = threading.Thread(target=load, daemon=True,
+                                  name=f"warm-up-{language.name}")
+        thread.start()
+        return thread
+
+    def _unload_pipelines(self) -> None:
+        """Unload the least recently used pipelines over the budget"""
+        while (len(self._pipelines) > 1
+               and sum(self._pipeline_sizes[language]
+                       for language in self._pipelines)
+               > self.memory_budget):
+            key, _ = self._pipelines.popitem(last=False)
+            del self._pipeline_sizes[key]
+
+    @staticmethod
+    def _get_pipeline_path(definition: PipelineDefinition) -> str:
+        """Get the folder of the SpaCy pipeline of a definition"""
+        return os.path.join(application_settings.data_folder,
+                            "preprocessing_data", "pipeline_download",
+                            definition.folder_name)
+
+    @classmethod
+    def _get_excluded_components(cls, definition: PipelineDefinition,
+                                 profile: PreprocessingProfile
+                                 ) -> tuple[str, ...]:
+        """
+        Get the components of the SpaCy pipeline that are not loaded for a
+        profile. The throughput profile does not load any of them.
+        """
+        if profile != PreprocessingProfile.Throughput:
+            return definition.exclude
+        config = spacy.util.load_config(os.path.join(
+            cls._get_pipeline_path(definition), "config.cfg"))
+        return tuple(config["nlp"]["pipeline"])
+
+    @staticmethod
+    def _get_lemma_lookup_path(language_code: str) -> str:
+        """Get the file of the lemma table of a language"""
+        return os.path.join(application_settings.data_folder,
+                            "preprocessing_data", "lemma_lookups",
+                            f"{language_code}_lemma_lookup.json.gz")
+
+    @classmethod
+    def _load_lemma_lookups(cls, language_code: str) -> Lookups:
+        """
+        Load the table with the lemma of every word of a language from the
+        data folder, or from the spacy-lookups-data package if the data
+        folder has no table for the language.
+
+        :param language_code: The code of the language, e.g., "nl"
+        :raises OSError: if there is no lemma table for the language
+        :return: The lookups containing the lemma table
+        """
+        path = cls._get_lemma_lookup_path(language_code)
+        if os.path.isfile(path):
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                lookups = Lookups()
+                lookups.add_table("lemma_lookup", json.load(file))
+                return lookups
+        try:
+            return load_lookups(language_code, ["lemma_lookup"])
+        except (ImportError, ValueError) as error:
+            raise OSError(f"Could not load the lemma table of language "
+                          f"'{language_code}' that the throughput "
+                          f"preprocessing profile needs. Expected it at "
+                          f"path {path} or in the spacy-lookups-data "
+                          f"package.") from error
+
+    @classmethod
+    def _estimate_size(cls, definition: PipelineDefinition,
+                       exclude: tuple[str, ...]) -> int:
+        """
+        Estimate the memory used by a loaded pipeline by the size of the
+        files of its components on disk.
+        """
+        size = 0
+        for folder, _, names in os.walk(cls._get_pipeline_path(definition)):
+            relative_folder = os.path.relpath(
+                folder, cls._get_pipeline_path(definition))
+            if relative_folder.split(os.sep)[0] in exclude:
+                continue
+            for name in names:
+                try:
+                    size += os.path.getsize(os.path.join(folder, name))
+                except OSError:
+                    continue
+        return size
+
+    @staticmethod
+    def _load_nltk_sent_tokenizer(*path_parts) -> nltk.PunktSentenceTokenizer:
+        """
+        Load a sentence tokenizer from nltk from the preprocessing data folder
+        :param path_parts: Components of the path to the desired tokenizer,
+            e.g., "dutch.pickle"
+        """
+        fpath = f"file:///{os.path.join(
+                           application_settings.data_folder,
+                           "preprocessing_data", "nltk_downloads",
+                           "tokenizers_punkt", *path_parts)}"
+        try:
+            tokenizer = nltk.data.load(fpath)
+        except LookupError:
+            raise LookupError(f"Could not load nltk tokenizer at path {fpath}")
+        return tokenizer
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Optional
+
+from tommy.support.application_settings import application_settings
+from tommy.support.blob_cache import BlobCache
+
+
+class PreprocessingCache(BlobCache):
+    """
+    A persistent store of the output of the SpaCy pipeline for single
+    documents. Every entry holds the lemma, part of speech and entity type
+    of every token of a document and is keyed by the hash of the text of
+    the document and the identity of the pipeline, so retraining a model
+    on the same corpus does not run the pipeline again. Stopwords and
+    synonyms are applied after the cache, so changing them does not
+    invalidate any entry.
+
+    The entries that were used least recently are removed when the total
+    size of the entries exceeds the maximum size.
+    """
+
+    def __init__(self, folder: str, max_bytes: int) -> None:
+        """
+        Initialize the cache that stores its entries in the given folder.
+
+        :param folder: The folder to store the cached entries in
+        :param max_bytes: The maximum total size of the entries in bytes
+        """
+        super().__init__(os.path.join(folder, "preprocessing"), max_bytes)
+
+    @classmethod
+    def from_application_settings(cls) -> Optional[PreprocessingCache]:
+        """
+        Create the cache in the cache folder of the application settings.
+
+        :return: The cache, or None if caching is disabled
+        """
+        if (application_settings.cache_folder is None
+                or application_settings.preprocessing_cache_size <= 0):
+            return None
+        return cls(application_settings.cache_folder,
+                   application_settings.preprocessing_cache_size)
+
+    @staticmethod
+    def key(text: str, pipeline_id: str) -> str:
+        """
+        Compute the key of the text of a document for a pipeline.
+
+        :param text: The text of the document
+        :param pipeline_id: The language, SpaCy version and name and
+            version of the pipeline that processes the text
+        :return: The key of the text in the cache
+        """
+        text_hash = hashlib.sha256(pipeline_id.encode("utf-8"))
+        text_hash.update(b"\0")
+        text_hash.update(text.encode("utf-8", "surrogatepass"))
+        return text_hash.hexdigest()
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
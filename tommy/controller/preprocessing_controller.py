@@ -1,86 +1,124 @@
-import os
+import itertools
+import re
+from collections import deque
+from collections.abc import Generator, Iterable
+from typing import Optional
 
+import numpy as np
 import spacy
+from spacy.attrs import ENT_TYPE, LEMMA, POS
 from spacy.tokens import Doc
-import nltk
-import nltk.data
 
+from tommy.controller.file_import.processed_body import ProcessedBody
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
+from tommy.controller.file_import.processed_file import ProcessedFile
+from tommy.controller.file_import.raw_file import RawFile
+from tommy.controller.pipeline_registry import PipelineRegistry
+from tommy.controller.preprocessing_cache import PreprocessingCache
+from tommy.model.model_parameters_model import ModelParametersModel
 from tommy.model.stopwords_model import StopwordsModel
 from tommy.model.synonyms_model import SynonymsModel
 from tommy.support.application_settings import application_settings
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.supported_languages import SupportedLanguage
 from tommy.controller.language_controller import LanguageController
 
 
 class PreprocessingController:
     """A class that can preprocess text using the Dutch SpaCy pipeline."""
+    # The version of the output of analyze, which is part of the key of the
+    # preprocessing cache
+    analysis_version = 2
+    # The throughput profile does not recognize entities, so numbers and
+    # dates are recognized by their form instead, such as 2024, 3,5%,
+    # 12-03-2024, 10:30 and 2de
+    _number_pattern = re.compile(r"[-+~€$£]?\d[\d.,:/'-]*(?:%|[a-z]{0,3})",
+                                 re.IGNORECASE)
+    # The end of a paragraph, which is the first place a long text is split
+    _paragraph_end_pattern = re.compile(r"\n[^\S\n]*\n\s*")
+    # The number of batches of every process that are read ahead when the
+    # preprocessing cache is used
+    _cache_window_batches = 8
     _stopwords_model: StopwordsModel = None
     _enable_pos: bool
     _synonyms_model: SynonymsModel = None
+    _model_parameters_model: ModelParametersModel = None
 
     def __init__(self) -> None:
-        self._pos_categories = None
-        self._entity_categories = None
-        self._nlp = None
-        self._enable_pos: bool
+        self._entity_categories = {"CARDINAL", "DATE", "LAW", "MONEY",
+                                   "ORDINAL", "PERCENT", "QUANTITY", "TIME"}
+        self._pos_categories = {"NOUN", "PROPN", "ADJ", "ADV", "VERB"}
+        self._enable_pos = False
+        self._language = None
         self._language_controller = None
+        self._pipeline_ids: dict[PreprocessingProfile, str] = {}
+        self._pipeline_registry = PipelineRegistry(
+            application_settings.pipeline_memory_budget)
+        self._preprocessing_cache = (
+            PreprocessingCache.from_application_settings())
 
-        # load punkt tokenizers for splitting sentences
-        self._dutch_sent_tokenizer = self._load_nltk_sent_tokenizer(
-            "dutch.pickle")
-        self._english_sent_tokenizer = self._load_nltk_sent_tokenizer(
-            "english.pickle")
+    def load_pipeline(self, language: SupportedLanguage) -> None:
+        """
+        Select the language of the texts that are preprocessed. The SpaCy
+        pipeline of the language is loaded in a background thread if it is
+        not in memory yet, so this does not block. Preprocessing waits for
+        the pipeline when it is used before it has been loaded.
 
-    @staticmethod
-    def _load_nltk_sent_tokenizer(*path_parts) -> nltk.PunktSentenceTokenizer:
-        """
-        Load a sentence tokenizer from nltk from the preprocessing data folder
-        :param path_parts: Components of the path to the desired tokenizer,
-            e.g., "dutch.pickle"
-        """
-        fpath = f"file:///{os.path.join(
-                           application_settings.data_folder,
-                           "preprocessing_data", "nltk_downloads", 
-                           "tokenizers_punkt", *path_parts)}"
-        try:
-            tokenizer = nltk.data.load(fpath)
-        except LookupError:
-            raise LookupError(f"Could not load nltk tokenizer at path {fpath}")
-        return tokenizer
+        :param language: The language of the texts
+        :raises ValueError: if the language cannot be preprocessed
+        :return: None
+        """
+        definition = self._pipeline_registry.get_definition(language)
+        self._language = language
+        self._enable_pos = definition.enable_pos
+        self._pipeline_ids = {}
+        if not self._pipeline_registry.is_loaded(language, self.profile):
+            self._pipeline_registry.warm_up(language, self.profile)
 
-    def load_pipeline(self, language: SupportedLanguage) -> None:
-        nlp: spacy.Language
-        match language:
-            case SupportedLanguage.Dutch:
-                self._enable_pos = True
-                pipeline_path = os.path.join(
-                    application_settings.data_folder,
-                    "preprocessing_data", "pipeline_download",
-                    "nl_core_news_sm-3.7.0")
-                nlp = spacy.load(pipeline_path,
-                                 exclude=["parser", "tagger",
-                                          "attribute_ruler"])
-            case SupportedLanguage.English:
-                self._enable_pos = False
-                pipeline_path = os.path.join(
-                    application_settings.data_folder,
-                    "preprocessing_data", "pipeline_download",
-                    "en_core_web_sm-3.7.1")
-                # tagger is taking over the role of the morphologizer (
-                # supposedly)
-                nlp = spacy.load(pipeline_path, exclude=["parser"])
-            case _:
-                raise ValueError("Unsupported preprocessing language")
-        self._nlp = nlp
-        self._nlp.add_pipe("merge_entities")
-        self._entity_categories = {"CARDINAL", "DATE", "LAW", "MONEY",
-                                   "ORDINAL", "PERCENT", "QUANTITY", "TIME"}
-        self._pos_categories = {"NOUN", "PROPN", "ADJ", "ADV", "VERB"}
+    @property
+    def profile(self) -> PreprocessingProfile:
+        """
+        The preprocessing profile of the selected configuration, which is
+        the full profile if there is no configuration.
+        """
+        if self._model_parameters_model is None:
+            return PreprocessingProfile.Full
+        return self._model_parameters_model.preprocessing_profile
+
+    @property
+    def pipeline_id(self) -> Optional[str]:
+        """
+        The identity of the SpaCy pipeline of the selected language and
+        profile. The lemmas of a text only change when the identity of the
+        pipeline changes. The output of the pipeline is cached per
+        language, SpaCy version, pipeline and profile, since each of them
+        can change the output.
+        """
+        if self._language is None:
+            return None
+        profile = self.profile
+        if profile not in self._pipeline_ids:
+            pipeline_id = self._pipeline_registry.get_pipeline_id(
+                self._language, profile)
+            self._pipeline_ids[profile] = (
+                f"{pipeline_id}-v{self.analysis_version}")
+        return self._pipeline_ids[profile]
+
+    def _get_nlp(self) -> spacy.Language:
+        """
+        Get the SpaCy pipeline of the selected language and profile,
+        waiting for it to be loaded if needed.
+        """
+        return self._pipeline_registry.get_pipeline(self._language,
+                                                    self.profile)
 
     def set_model_refs(self, stopwords_model: StopwordsModel,
-                       synonyms_model: SynonymsModel) -> None:
+                       synonyms_model: SynonymsModel,
+                       model_parameters_model: Optional[
+                           ModelParametersModel] = None) -> None:
         self._stopwords_model = stopwords_model
         self._synonyms_model = synonyms_model
+        self._model_parameters_model = model_parameters_model
 
     def set_controller_refs(self, language_controller: LanguageController):
         """Set the reference to the language controller"""
@@ -90,21 +128,340 @@ class PreprocessingController:
         self.load_pipeline(self._language_controller.get_language())
 
     def process_text(self, text: str) -> list[str]:
-        """Preprocesses the given text to a list of tokens."""
-        tokens = self._nlp(text)
-        tokens = self.process_tokens(tokens)
-        return tokens
+        """
+        Preprocesses the given text to a list of tokens. Long texts are
+        split into chunks that are processed as a batch.
+        """
+        return next(self.process_texts([text], n_process=1))
+
+    def process_texts(self, texts: Iterable[str],
+                      batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None) -> (
+            Generator[list[str], None, None]):
+        """
+        Preprocesses the given texts to lists of tokens. The texts are sent
+        through the SpaCy pipeline in batches, which is much faster than
+        processing them one by one with process_text. The output of the
+        pipeline is taken from the preprocessing cache for texts that were
+        processed before. Texts that are longer than the chunk size of the
+        application settings are processed in chunks, so the memory used by
+        the pipeline does not grow with the length of a text.
+
+        :param texts: The texts to preprocess
+        :param batch_size: The number of texts that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the tokens of every text, in the
+            order of the given texts
+        """
+        texts_with_context = ((text, None) for text in texts)
+        for analysis, _ in self._analyze_texts(texts_with_context,
+                                               batch_size, n_process):
+            yield self.process_analysis(analysis)
+
+    def process_files(self, files: Iterable[RawFile],
+                      batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None) -> (
+            Generator[ProcessedFile, None, None]):
+        """
+        Preprocesses the given files in batches, like process_texts. The
+        files are read from the given iterable while earlier batches are
+        processed, so the whole corpus does not have to be in memory.
+
+        :param files: The files to preprocess
+        :param batch_size: The number of files that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the processed files, in the order of
+            the given files
+        """
+        texts_with_metadata = ((file.body.body, file.metadata)
+                               for file in files)
+        for analysis, metadata in self._analyze_texts(texts_with_metadata,
+                                                      batch_size, n_process):
+            yield ProcessedFile(
+                metadata, ProcessedBody(self.process_analysis(analysis)))
+
+    def lemmatize_files(self, files: Iterable[RawFile],
+                        batch_size: Optional[int] = None,
+                        n_process: Optional[int] = None) -> (
+            Generator[ProcessedFile, None, None]):
+        """
+        Run the first stage of preprocessing on the given files in batches.
+        The lemmas of the files do not depend on the stopwords and synonyms
+        of the configuration, which are applied by filter_corpus.
+
+        :param files: The files to lemmatize
+        :param batch_size: The number of files that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the files with their lemmas, in the
+            order of the given files
+        """
+        texts_with_metadata = ((file.body.body, file.metadata)
+                               for file in files)
+        for analysis, metadata in self._analyze_texts(texts_with_metadata,
+                                                      batch_size, n_process):
+            yield ProcessedFile(metadata,
+                                ProcessedBody(self.lemmatize(analysis)))
+
+    def filter_corpus(self, lemmatized_corpus: Iterable[ProcessedFile]
+                      ) -> ProcessedCorpus:
+        """
+        Run the second stage of preprocessing, which applies the synonyms
+        and stopwords of the configuration to a lemmatized corpus. The
+        synonyms and stopwords are looked up once for every lemma in the
+        vocabulary of the corpus, after which the token ids of all
+        documents are mapped at once.
+
+        :param lemmatized_corpus: The files with their lemmas, as given by
+            lemmatize_files
+        :return: The processed corpus, in the order of the given files
+        """
+        lemmatized_corpus = ProcessedCorpus.from_documents(lemmatized_corpus)
+        tokens = self.apply_synonyms(lemmatized_corpus.vocabulary)
+        token_ids = {token: token_id for token_id, token
+                     in enumerate(dict.fromkeys(tokens))}
+        # The new id of every lemma, or -1 if its token is a stopword
+        new_ids = np.fromiter(
+            (-1 if token in self._stopwords_model else token_ids[token]
+             for token in tokens), dtype=np.int64, count=len(tokens))
+
+        ids = new_ids[lemmatized_corpus.tokens]
+        kept = ids >= 0
+        kept_before = np.zeros(len(kept) + 1, dtype=np.int64)
+        np.cumsum(kept, out=kept_before[1:])
+        return ProcessedCorpus.from_token_ids(
+            lemmatized_corpus.metadata, list(token_ids), ids[kept],
+            kept_before[lemmatized_corpus.offsets])
+
+    def _analyze_texts(self, texts_with_context: Iterable[tuple[str, object]],
+                       batch_size: Optional[int],
+                       n_process: Optional[int]) -> (
+            Generator[tuple[dict[str, list[str]], object], None, None]):
+        """
+        Get the output of the SpaCy pipeline for a stream of texts. Texts
+        that are in the preprocessing cache are not processed again, and the
+        output for the other texts is added to the cache.
+
+        :param texts_with_context: Tuples of a text and its context
+        :param batch_size: The number of texts that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the output of the pipeline for every
+            text with its context, in the order of the given texts
+        """
+        if self._preprocessing_cache is None:
+            yield from self._analyze_chunks(texts_with_context, batch_size,
+                                            n_process)
+            return
+
+        # The texts are read in windows, so the output for cached texts
+        # that waits for the texts before it to come out of the pipeline
+        # does not grow with the size of the corpus
+        window_size = ((batch_size or application_settings.
+                        preprocessing_batch_size)
+                       * max(n_process or application_settings.
+                             preprocessing_processes, 1)
+                       * self._cache_window_batches)
+        texts_with_context = iter(texts_with_context)
+        while window := list(itertools.islice(texts_with_context,
+                                              window_size)):
+            yield from self._analyze_window(window, batch_size, n_process)
+
+    def _analyze_window(self, texts_with_context: list[tuple[str, object]],
+                        batch_size: Optional[int],
+                        n_process: Optional[int]) -> (
+            Generator[tuple[dict[str, list[str]], object], None, None]):
+        """
+        Get the output of the SpaCy pipeline for a window of texts, taking
+        the output for the texts that are in the preprocessing cache from
+        the cache. The pipeline is not loaded if all texts are cached.
+
+        :param texts_with_context: Tuples of a text and its context
+        :param batch_size: The number of texts that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the output of the pipeline for every
+            text with its context, in the order of the given texts
+        """
+        cache = self._preprocessing_cache
+        # The texts that are cached are held back until the texts before
+        # them have come out of the pipeline, to keep the order of the texts
+        cached = deque()
+
+        def uncached_texts():
+            for index, (text, context) in enumerate(texts_with_context):
+                key = cache.key(text, self.pipeline_id)
+                analysis = cache.get(key)
+                if analysis is None:
+                    yield text, (index, key, context)
+                else:
+                    cached.append((index, analysis, context))
+
+        for analysis, (index, key, context) in self._analyze_chunks(
+                uncached_texts(), batch_size, n_process):
+            while cached and cached[0][0] < index:
+                yield cached.popleft()[1:]
+            cache.put(key, analysis)
+            yield analysis, context
+        while cached:
+            yield cached.popleft()[1:]
+
+    def _analyze_chunks(self,
+                        texts_with_context: Iterable[tuple[str, object]],
+                        batch_size: Optional[int],
+                        n_process: Optional[int]) -> (
+            Generator[tuple[dict[str, list], object], None, None]):
+        """
+        Run the SpaCy pipeline on a stream of texts, splitting long texts
+        into chunks. The chunks of a text go through the pipeline in the
+        same batches as the other texts, and the output of the chunks is
+        joined when the last chunk of the text has been processed.
+
+        :param texts_with_context: Tuples of a text and its context
+        :param batch_size: The number of chunks that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :return: A generator yielding the output of the pipeline for every
+            text with its context, in the order of the given texts
+        """
+        def chunks():
+            for text, context in texts_with_context:
+                text_chunks = self._split_into_chunks(text)
+                for number, chunk in enumerate(text_chunks, start=1):
+                    yield chunk, (context, number == len(text_chunks))
+
+        analyses = []
+        for doc, (context, is_last_chunk) in self._pipe(
+                chunks(), batch_size, n_process, as_tuples=True):
+            analyses.append(self.analyze(doc))
+            if is_last_chunk:
+                yield self._join_analyses(analyses), context
+                analyses = []
+
+    def _split_into_chunks(self, text: str) -> list[str]:
+        """
+        Split a text into chunks of at most the chunk size of the
+        application settings. A chunk ends at the last paragraph boundary
+        in the second half of the chunk, or else at the last sentence
+        boundary or whitespace there, so words and almost all sentences
+        stay whole.
+
+        :param text: The text to split
+        :return: The chunks, which together are the text
+        """
+        chunk_size = application_settings.preprocessing_chunk_size
+        if chunk_size is None or len(text) <= chunk_size:
+            return [text]
+
+        chunks = []
+        start = 0
+        while len(text) - start > chunk_size:
+            end = start + self._find_chunk_end(
+                text[start:start + chunk_size])
+            chunks.append(text[start:end])
+            start = end
+        chunks.append(text[start:])
+        return chunks
+
+    def _find_chunk_end(self, window: str) -> int:
+        """
+        Find where the chunk at the start of a window of text ends.
+
+        :param window: The text from the start of the chunk, as long as the
+            chunk size
+        :return: The number of characters of the window in the chunk
+        """
+        half = len(window) // 2
+        paragraph_ends = [match.end() for match
+                          in self._paragraph_end_pattern.finditer(window)
+                          if half < match.end() < len(window)]
+        if paragraph_ends:
+            return paragraph_ends[-1]
+
+        # The last sentence in the window is probably cut off, so the chunk
+        # ends where it starts
+        tokenizer = self._pipeline_registry.get_sentence_tokenizer(
+            self._language)
+        sentence_starts = [start for start, _
+                           in tokenizer.span_tokenize(window) if start > half]
+        if sentence_starts:
+            return sentence_starts[-1]
+
+        whitespace = max(window.rfind(" "), window.rfind("\n"))
+        if whitespace > half:
+            return whitespace + 1
+        return len(window)
+
+    @staticmethod
+    def _join_analyses(analyses: list[dict[str, list]]) -> dict[str, list]:
+        """
+        Join the output of the SpaCy pipeline for the chunks of a text into
+        the output for the whole text.
+
+        :param analyses: The output of analyze for every chunk, in order
+        :return: The distinct strings of all chunks, and the codes of the
+            tokens of the chunks one after the other
+        """
+        if len(analyses) == 1:
+            return analyses[0]
+
+        codes_by_string: dict[str, int] = {}
+        fields = ("lemmas", "pos", "entity_types")
+        parts = {field: [] for field in fields}
+        for analysis in analyses:
+            new_codes = np.fromiter(
+                (codes_by_string.setdefault(string, len(codes_by_string))
+                 for string in analysis["strings"]),
+                dtype=np.int64, count=len(analysis["strings"]))
+            for field in fields:
+                parts[field].append(
+                    new_codes[np.asarray(analysis[field], dtype=np.int64)])
+        joined = {"strings": list(codes_by_string)}
+        joined.update({field: np.concatenate(parts[field]).tolist()
+                       for field in fields})
+        return joined
+
+    def _pipe(self, texts: Iterable, batch_size: Optional[int],
+              n_process: Optional[int], as_tuples: bool = False) -> (
+            Iterable):
+        """
+        Run the SpaCy pipeline on a stream of texts.
+
+        :param texts: The texts, or tuples of a text and its context
+        :param batch_size: The number of texts that are processed at once,
+            or None to use the batch size of the application settings
+        :param n_process: The number of processes that run the pipeline, or
+            None to use the number of the application settings
+        :param as_tuples: Whether the texts are tuples with a context that
+            is passed along with the processed text
+        :return: The processed texts, in the order of the given texts
+        """
+        if batch_size is None:
+            batch_size = application_settings.preprocessing_batch_size
+        if n_process is None:
+            n_process = application_settings.preprocessing_processes
+        # The pipeline is only loaded when there is a text to process, so
+        # texts that are all cached do not wait for the pipeline
+        texts = iter(texts)
+        first_text = next(texts, None)
+        if first_text is None:
+            return
+        yield from self._get_nlp().pipe(
+            itertools.chain([first_text], texts), as_tuples=as_tuples,
+            batch_size=batch_size, n_process=n_process)
 
     def split_into_sentences(self, text: str) -> list[str]:
         """Split the given text to a list of sentences."""
-        match self._language_controller.get_language():
-            case SupportedLanguage.Dutch:
-                tokenizer = self._dutch_sent_tokenizer
-            case SupportedLanguage.English:
-                tokenizer = self._english_sent_tokenizer
-            case _:
-                raise ValueError("Current language is not supported by NLTK"
-                                 " sentence splitter.")
+        tokenizer = self._pipeline_registry.get_sentence_tokenizer(
+            self._language_controller.get_language())
         return tokenizer.tokenize(text)
 
     def process_tokens(self, doc: Doc) -> list[str]:
@@ -114,21 +471,102 @@ class PreprocessingController:
         :param doc: The tokens given by processing of the Dutch SpaCy pipeline
         :return list[str]: The processed tokens
         """
-        # All steps that require token-level information.
-        lemmas = [token.lemma_ for token in doc if
-                  token.ent_type_ not in self._entity_categories and
-                  not str.isspace(token.lemma_) and (
-                          not self._enable_pos or
-                          token.pos_ in self._pos_categories)]
+        return self.process_analysis(self.analyze(doc))
+
+    @staticmethod
+    def analyze(doc: Doc) -> dict[str, list]:
+        """
+        Get the output of the SpaCy pipeline that preprocessing uses, in a
+        form that can be stored in the preprocessing cache. The attributes
+        of all tokens are read at once as an array, and every distinct
+        string is stored once, so the filters only have to look at the
+        distinct strings instead of at every token.
 
-        # Take the lemmas.
-        lemmas = [lemma.lower() for lemma in lemmas if len(lemma) > 2]
+        :param doc: The tokens given by the SpaCy pipeline
+        :return: The distinct strings of the document, and the code of the
+            string of the lemma, part of speech and entity type of every
+            token
+        """
+        attributes = doc.to_array([LEMMA, POS, ENT_TYPE])
+        values, codes = np.unique(attributes, return_inverse=True)
+        codes = codes.reshape(attributes.shape)
+        return {"strings": [doc.vocab.strings[value]
+                            for value in values.tolist()],
+                "lemmas": codes[:, 0].tolist(),
+                "pos": codes[:, 1].tolist(),
+                "entity_types": codes[:, 2].tolist()}
 
-        # Apply synonyms and filter stopwords.
-        lemmas = self.apply_synonyms(lemmas)
-        lemmas = self.filter_stopwords(lemmas)
+    def process_analysis(self, analysis: dict[str, list]) -> list[str]:
+        """
+        Processes the output of the SpaCy pipeline for a text. The synonyms
+        and stopwords are looked up once for every distinct lemma.
 
-        return lemmas
+        :param analysis: The distinct strings and the codes of the tokens,
+            as given by analyze
+        :return list[str]: The processed tokens
+        """
+        lemmas, codes = self._get_kept_lemmas(analysis)
+        tokens = self.apply_synonyms(lemmas)
+        is_kept = np.fromiter((token not in self._stopwords_model
+                               for token in tokens),
+                              dtype=bool, count=len(tokens))
+        return np.array(tokens, dtype=object)[
+            codes[is_kept[codes]]].tolist()
+
+    def lemmatize(self, analysis: dict[str, list]) -> list[str]:
+        """
+        Get the lemmas of the tokens that are kept from the output of the
+        SpaCy pipeline. Entities such as dates and numbers, tokens with a
+        part of speech that carries little meaning and short lemmas are
+        removed.
+
+        :param analysis: The distinct strings and the codes of the tokens,
+            as given by analyze
+        :return list[str]: The lemmas in lower case
+        """
+        lemmas, codes = self._get_kept_lemmas(analysis)
+        return np.array(lemmas, dtype=object)[codes].tolist()
+
+    def _get_kept_lemmas(self, analysis: dict[str, list]) -> (
+            tuple[list[str], np.ndarray]):
+        """
+        Select the tokens that are kept from the output of the SpaCy
+        pipeline. The categories and lemmas are checked once for every
+        distinct string, after which the tokens are selected with masks.
+        The throughput profile has no entities and parts of speech, so
+        lemmas that look like numbers or dates are removed instead.
+
+        :param analysis: The distinct strings and the codes of the tokens,
+            as given by analyze
+        :return: The distinct strings in lower case, and the code of the
+            lemma of every token that is kept
+        """
+        strings = analysis["strings"]
+        is_throughput = self.profile == PreprocessingProfile.Throughput
+        is_entity = self._get_string_mask(strings, self._entity_categories)
+        is_lemma = np.fromiter(
+            (len(string) > 2 and not string.isspace()
+             and not (is_throughput
+                      and self._number_pattern.fullmatch(string))
+             for string in strings), dtype=bool, count=len(strings))
+
+        lemmas = np.asarray(analysis["lemmas"], dtype=np.int64)
+        is_kept = (is_lemma[lemmas]
+                   & ~is_entity[np.asarray(analysis["entity_types"],
+                                           dtype=np.int64)])
+        if self._enable_pos and not is_throughput:
+            is_meaningful = self._get_string_mask(strings,
+                                                  self._pos_categories)
+            is_kept &= is_meaningful[np.asarray(analysis["pos"],
+                                                dtype=np.int64)]
+        return [string.lower() for string in strings], lemmas[is_kept]
+
+    @staticmethod
+    def _get_string_mask(strings: list[str], categories: set[str]
+                         ) -> np.ndarray:
+        """Check for every string whether it is one of the categories"""
+        return np.fromiter((string in categories for string in strings),
+                           dtype=bool, count=len(strings))
 
     def apply_synonyms(self, tokens: list[str]) -> list[str]:
         """
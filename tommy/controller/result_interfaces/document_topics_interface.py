@@ -3,6 +3,9 @@ from collections.abc import Iterable
 
 from numpy import ndarray
 
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
+from tommy.controller.file_import.processed_file import ProcessedFile
+
 
 class DocumentTopicsInterface(ABC):
     """
@@ -23,6 +26,50 @@ class DocumentTopicsInterface(ABC):
             (topic_id, topic_probability) pairs
         """
 
+    @abstractmethod
+    def get_bag_of_words_topics(self, bag_of_words: list[tuple[int, int]],
+                                minimum_probability: float
+                                ) -> list[tuple[int, float]]:
+        """
+        Returns the topic distribution for a document that is given as a
+        bag of words with the token ids of get_token_ids
+        :param bag_of_words: the (token_id, count) pairs of the document
+        :param minimum_probability: the minimum probability of a topic for
+            it to be included in the results
+        :return: the (topic_id, topic_probability) pairs of the document
+        """
+
+    @abstractmethod
+    def get_token_ids(self) -> dict[str, int]:
+        """
+        Returns the ids of the tokens that the model was trained on
+        :return: the id of every token
+        """
+
+    def get_corpus_topics(self,
+                          processed_corpus: (ProcessedCorpus
+                                             | Iterable[ProcessedFile]),
+                          minimum_probability: float
+                          ) -> list[list[tuple[int, float]]]:
+        """
+        Returns the topic distribution of every document in a preprocessed
+        corpus, in the same form as get_document_topics. The bags of words
+        of all documents are counted at once from the token ids of the
+        corpus, instead of hashing the tokens of every document again.
+        :param processed_corpus: the preprocessed corpus
+        :param minimum_probability: the minimum probability of a topic for
+            it to be included in the results
+        :return: the (topic_id, topic_probability) pairs of every document,
+            in the order of the corpus
+        """
+        processed_corpus = ProcessedCorpus.from_documents(processed_corpus)
+        if not processed_corpus:
+            return []
+        bags_of_words = processed_corpus.bags_of_words(self.get_token_ids())
+        return [self.get_bag_of_words_topics(bag_of_words,
+                                             minimum_probability)
+                for bag_of_words in bags_of_words]
+
 
 """
 This program has been developed by students from the bachelor Computer Science
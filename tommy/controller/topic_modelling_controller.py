@@ -124,6 +124,15 @@ class TopicModellingController:
             self._model_trained_event.publish(self._config_model.topic_runner)
             self._calculate_document_topics_event.publish(
                 self._topic_model.document_topics)
+            # The metadata of the corpus now marks the removed duplicates
+            if self._corpus_controller.metadata_available():
+                self._corpus_controller.metadata_changed_event.publish(
+                    self._corpus_controller.get_metadata())
+            removed_duplicates = (
+                self._corpus_controller.describe_removed_duplicates())
+            if removed_duplicates:
+                ErrorView("Er zijn dubbele documenten uit het corpus "
+                          "verwijderd:", removed_duplicates)
 
         if self._corpus_controller.metadata_available() is False:
             ErrorView("Er is geen data beschikbaar om een model op te "
@@ -134,7 +143,12 @@ class TopicModellingController:
                                 "analyseren in een kolom staat die als header "
                                 "'body' heeft. Voor meer informatie zie de "
                                 "website <a href='tommy.fyor.nl'>"
-                                "tommy.fyor.nl</a>"])
+                                "tommy.fyor.nl</a>",
+                                "rtf, zoals geëxporteerd uit LexisNexis",
+                                "jsonl, met één JSON object per regel dat "
+                                "de tekst in het veld 'body' heeft",
+                                "zip en tar archieven met bovenstaande "
+                                "bestanden"])
             model_trained_callback()
             return
 
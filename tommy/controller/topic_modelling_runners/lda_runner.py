@@ -98,11 +98,9 @@ class LdaRunner(TopicRunner,
         :return: None
         """
 
-        processed_bodies = [document.body.body for document in processed_corpus]
-
-        self._dictionary = Dictionary(processed_bodies)
-        bags_of_words = [self._dictionary.doc2bow(tokens)
-                         for tokens in processed_bodies]
+        processed_corpus = ProcessedCorpus.from_documents(processed_corpus)
+        self._dictionary = processed_corpus.to_dictionary()
+        bags_of_words = processed_corpus.bags_of_words()
         self._bags_of_words = bags_of_words
 
         # Run optimized LDA if alpha and beta are None
@@ -133,18 +131,17 @@ class LdaRunner(TopicRunner,
         topic_model.document_topics = []
         n_topics = self.get_n_topics()
 
-        for document in processed_corpus:
-            topic_correspondence = (
-                self.get_document_topics(document.body.body, 0.0))
-
+        processed_corpus = ProcessedCorpus.from_documents(processed_corpus)
+        corpus_topics = self.get_corpus_topics(processed_corpus, 0.0)
+        for metadata, topic_correspondence in zip(processed_corpus.metadata,
+                                                  corpus_topics):
             probabilities = [0.0] * n_topics
 
             # Create list of topic probabilities for each document
             for (topic_id, topic_probability) in topic_correspondence:
                 probabilities[topic_id] = topic_probability
 
-            topic_model.document_topics.append(
-                (document.metadata, probabilities))
+            topic_model.document_topics.append((metadata, probabilities))
 
     def get_n_topics(self) -> int:
         return self._num_topics
@@ -206,6 +203,28 @@ class LdaRunner(TopicRunner,
                                                minimum_probability=
                                                minimum_probability)
 
+    def get_bag_of_words_topics(self, bag_of_words: list[tuple[int, int]],
+                                minimum_probability: float
+                                ) -> list[tuple[int, float]]:
+        """
+        Returns the topic distribution of the LDA model for a document
+        that is given as a bag of words with the token ids of get_token_ids
+        :param bag_of_words: the (token_id, count) pairs of the document
+        :param minimum_probability: the minimum probability of a topic for
+            it to be included in the results
+        :return: the (topic_id, topic_probability) pairs of the document
+        """
+        return self._model.get_document_topics(bag_of_words,
+                                               minimum_probability=
+                                               minimum_probability)
+
+    def get_token_ids(self) -> dict[str, int]:
+        """
+        Returns the ids of the tokens in the dictionary of the LDA model
+        :return: the id of every token
+        """
+        return self._dictionary.token2id
+
     def get_topic_coherence(self, num_topics):
         new_model = LdaModel(corpus=self._bags_of_words,
                              id2word=self._dictionary,
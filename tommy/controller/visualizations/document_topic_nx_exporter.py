@@ -68,11 +68,9 @@ class DocumentTopicNxExporter(NxExporterOnData[ProcessedCorpus]):
                            color=plot_colors[topic_id % len(plot_colors)])
 
         # Generate initial document topic network
-        for document_id, document in enumerate(processed_files):
-            document_topic = (
-                topic_runner.get_document_topics(document.body.body,
-                                                 minimum_probability))
-
+        corpus_topics = topic_runner.get_corpus_topics(processed_files,
+                                                       minimum_probability)
+        for document_id, document_topic in enumerate(corpus_topics):
             # Add edges from each document to all associated topics
             for (topic_id, topic_probability) in document_topic:
                 graph.add_edge(topic_id,
@@ -40,7 +40,7 @@ class DocumentWordCountCreator(AbstractVisualization):
             raise ValueError("Metadata Corpus keyword argument is necessary in"
                              " the document_word_count_creator")
 
-        document_counts = [file.length for file in metadata_corpus]
+        document_counts = metadata_corpus.column("length")
 
         # Construct a histogram
         fig, ax = plt.subplots()
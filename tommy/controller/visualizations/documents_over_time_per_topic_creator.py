@@ -1,9 +1,9 @@
-from datetime import datetime
-
 import matplotlib.figure
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 
+from tommy.controller.file_import.processed_corpus import ProcessedCorpus
 from tommy.controller.result_interfaces.document_topics_interface import (
     DocumentTopicsInterface)
 from tommy.controller.topic_modelling_runners.abstract_topic_runner import (
@@ -12,7 +12,7 @@ from tommy.controller.visualizations.abstract_visualization import (
     AbstractVisualization)
 from tommy.controller.visualizations.possible_visualization import VisGroup
 from tommy.controller.visualizations.visualization_input_datatypes import (
-    VisInputData, TopicID, ProcessedCorpus)
+    VisInputData, TopicID)
 from tommy.support.constant_variables import plot_colors
 
 
@@ -48,30 +48,27 @@ class DocumentsOverTimePerTopicCreator(AbstractVisualization):
         # Construct a plot and axes
         fig, ax = plt.subplots()
 
-        # Select all available dates with its corresponding probability
-        dates = {"date": [],
-                 "probability": []}
-        for document in processed_corpus:
-            if document.metadata.date is not None:
-                current_date = datetime.combine(document.metadata.date,
-                                                datetime.min.time())
-                topics = topic_runner.get_document_topics(document.body.body,
-                                                          0.0)
-
-                topic = [topic for topic in topics if topic[0] == topic_id]
-                if topic:
-                    current_probability = topic[0][1]
-                else:
-                    current_probability = 0.0
-                dates["date"].append(current_date)
-                dates["probability"].append(current_probability)
+        # Select the day of every document that has a date
+        processed_corpus = ProcessedCorpus.from_documents(processed_corpus)
+        dates = processed_corpus.metadata.column("date")
+        dated_rows = np.flatnonzero(~np.isnat(dates))
 
         # If no dates available, show it on screen
-        if all([dates[i] == [] for i in dates]):
+        if len(dated_rows) == 0:
             return self._get_no_dates_available_screen()
 
+        # Select the probability of the topic for every dated document
+        probabilities = np.zeros(len(dated_rows))
+        for index, topics in enumerate(topic_runner.get_corpus_topics(
+                processed_corpus.take(dated_rows), 0.0)):
+            probabilities[index] = next(
+                (probability for topic, probability in topics
+                 if topic == topic_id), 0.0)
+
         # Sort and group all dates
-        df = pd.DataFrame(dates)
+        df = pd.DataFrame({"date": dates[dated_rows].astype("datetime64[D]")
+                           .astype("datetime64[ns]"),
+                           "probability": probabilities})
         df = df.groupby("date", as_index=False).sum()
         df = df.sort_values(by="date", ascending=True)
         grouped_df = self._group_df(df)
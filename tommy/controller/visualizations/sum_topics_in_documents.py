@@ -45,8 +45,7 @@ class SumTopicsInDocuments(AbstractVisualization):
         doc_info = {"topic_id": [],
                     "probability": []}
 
-        for document in processed_corpus:
-            topics = topic_runner.get_document_topics(document.body.body, 0.0)
+        for topics in topic_runner.get_corpus_topics(processed_corpus, 0.0):
             for topic in topics:
                 doc_info["topic_id"].append(topic[0])
                 doc_info["probability"].append(topic[1])
@@ -1,8 +1,7 @@
-from collections.abc import Iterable
 from enum import Enum
 
-from tommy.controller.file_import.metadata import Metadata
-from tommy.controller.file_import.processed_file import ProcessedFile
+from tommy.controller.file_import import processed_corpus
+from tommy.controller.file_import.metadata_table import MetadataTable
 
 
 class VisInputData(Enum):
@@ -16,8 +15,8 @@ class VisInputData(Enum):
 # the data types of the input data for the visualizations. These correspond
 #   one-to-one to the entries in the VisInputData enumerator above.
 type TopicID = int
-type MetadataCorpus = list[Metadata]
-type ProcessedCorpus = Iterable[ProcessedFile]
+type MetadataCorpus = MetadataTable
+type ProcessedCorpus = processed_corpus.ProcessedCorpus
 
 """
 This program has been developed by students from the bachelor Computer Science
@@ -1,4 +1,5 @@
 import ctypes
+import multiprocessing
 import os
 import platform
 import sys
@@ -7,8 +8,11 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
 from tommy.main_window import MainWindow
-from tommy.support.application_settings import get_assets_folder
+from tommy.support.application_settings import (
+    application_settings, get_assets_folder, get_settings_file,
+    load_settings_file)
 from tommy.support.constant_variables import initialize_fonts
+from tommy.view.error_view import ErrorView
 
 """This file is the program entry point."""
 
@@ -30,6 +34,8 @@ def set_app_user_model_id():
 
 if __name__ == "__main__":
     # Program entry point
+    # Worker processes of a frozen executable start here as well
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     set_app_user_model_id()
 
@@ -50,9 +56,16 @@ if __name__ == "__main__":
     # Initialize & load application fonts
     initialize_fonts()
 
+    # Read the settings that the user changed before anything uses them
+    settings_problems = load_settings_file(application_settings,
+                                           get_settings_file())
+
     # Create and show main window
     window = MainWindow()
     window.show()
+    if settings_problems:
+        ErrorView("Niet alle instellingen in het instellingenbestand "
+                  "konden gebruikt worden:", settings_problems)
 
     # Execute the application
     app.exec()
@@ -1,7 +1,7 @@
 import os
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QGuiApplication
+from PySide6.QtGui import QCloseEvent, QIcon, QGuiApplication
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget, QHBoxLayout, QVBoxLayout, QSizePolicy
@@ -111,11 +111,12 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
 
         # Initialize the menu bar
-        self.setMenuBar(MenuBar(self,
+        self.menu_bar = MenuBar(self,
                                 self._controller.project_settings_controller,
                                 self._controller.saving_loading_controller,
                                 self._controller.export_controller,
-                                self._controller.topic_modelling_controller))
+                                self._controller.topic_modelling_controller)
+        self.setMenuBar(self.menu_bar)
 
         # Create widgets
         self.preprocessing_view = PreprocessingView(
@@ -143,7 +144,8 @@ class MainWindow(QMainWindow):
             self._controller.model_parameters_controller)
         self.selected_information_view = SelectedInformationView(
             self._controller.graph_controller,
-            self._controller.model_parameters_controller)
+            self._controller.model_parameters_controller,
+            self._controller.corpus_controller)
 
         # Initialize widgets
         self.left_layout.addWidget(self.model_params_view)
@@ -160,6 +162,13 @@ class MainWindow(QMainWindow):
         self.splitter.setStretchFactor(2,
                                        1)
 
+        # The actions that start another import or use the corpus are
+        # disabled while the input folder is imported
+        self._import_running = False
+        self._close_after_import = False
+        self._controller.corpus_controller.import_running_event.subscribe(
+            self.on_import_running_changed)
+
         self.display_correct_initial_files()
 
         # Initialize event handlers
@@ -231,6 +240,41 @@ class MainWindow(QMainWindow):
         self.imported_files_view.on_topic_selected(topic_entity)
         self.selected_information_view.display_topic_info(topic_entity)
 
+    def on_import_running_changed(self, running: bool) -> None:
+        """
+        Event handler for when an import of the input folder starts or
+        finishes. The import processes the events of the application to
+        show its progress, so the actions that would start another import,
+        export results, switch the language or configuration, or train a
+        model are disabled while it runs. A window that was closed during
+        the import is closed once the import has stopped.
+
+        :param running: Whether the import is running
+        :return: None
+        """
+        self._import_running = running
+        self.menu_bar.set_import_actions_enabled(not running)
+        self.model_params_view.set_enabled_on_import(not running)
+        if not running and self._close_after_import:
+            self.close()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Event handler for when the window is closed. A running import is
+        stopped first, since it still runs in the event handler that
+        processed the close event, and the window is closed when it has
+        stopped.
+
+        :param event: The close event
+        :return: None
+        """
+        if self._import_running:
+            self._close_after_import = True
+            self._controller.corpus_controller.cancel_import()
+            event.ignore()
+            return
+        super().closeEvent(event)
+
     def on_topic_name_changed(self, topic_entity: TopicEntity) -> None:
         """
         Event handler for when a topic name is changed.
@@ -4,7 +4,7 @@ from copy import copy
 
 from gensim.corpora import Dictionary
 
-from tommy.controller.file_import.metadata import Metadata
+from tommy.controller.file_import.metadata_table import MetadataTable
 from tommy.controller.file_import.processed_corpus import ProcessedCorpus
 
 
@@ -14,10 +14,17 @@ class CorpusModel:
     is only accessible through the CorpusController class. The raw corpus
     data is not stored as it wouldn't fit in memory. The processed corpus is
     stored in the ProcessedCorpus class.
+
+    The lemmas of the documents do not depend on the configuration, so they
+    are kept in the lemmatized corpus together with the identity of the
+    pipeline that produced them. Only the stopwords and synonyms have to be
+    applied to them again when the configuration changes.
     """
-    metadata: list[Metadata] = None
+    metadata: MetadataTable = None
     dictionary: Dictionary = None
     processed_corpus: ProcessedCorpus
+    lemmatized_corpus: ProcessedCorpus = None
+    lemmatized_pipeline_id: str = None
 
     def __init__(self, derive_from: CorpusModel = None):
         """
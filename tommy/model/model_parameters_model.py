@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from tommy.support.model_type import ModelType
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.parameter_limits import *
 
 
@@ -17,6 +18,8 @@ class ModelParametersModel:
     default_alpha_beta_custom_enabled: bool = False
     default_bert_min_df: float | None = None
     default_bert_max_features: int | None = None
+    default_preprocessing_profile: PreprocessingProfile = (
+        PreprocessingProfile.Full)
 
     def __init__(self, derive_from: ModelParametersModel = None):
         """
@@ -37,6 +40,8 @@ class ModelParametersModel:
             self.bert_min_df = ModelParametersModel.default_bert_min_df
             self.bert_max_features = (ModelParametersModel.
                                       default_bert_max_features)
+            self.preprocessing_profile: PreprocessingProfile = (
+                ModelParametersModel.default_preprocessing_profile)
         else:
             self.n_topics = derive_from.n_topics
             self.model_type = derive_from.model_type
@@ -47,6 +52,7 @@ class ModelParametersModel:
                 derive_from.alpha_beta_custom_enabled)
             self.bert_min_df = derive_from.bert_min_df
             self.bert_max_features = derive_from.bert_max_features
+            self.preprocessing_profile = derive_from.preprocessing_profile
 
     def to_dict(self):
         """
@@ -63,7 +69,9 @@ class ModelParametersModel:
             "bert_min_df": "None" if self.bert_min_df is None else
             self.bert_min_df,
             "bert_max_features": "None" if self.bert_max_features is None
-            else self.bert_max_features
+            else self.bert_max_features,
+            "preprocessing_profile": PreprocessingProfile.to_string(
+                self.preprocessing_profile)
         }
 
     @classmethod
@@ -86,6 +94,10 @@ class ModelParametersModel:
             "alpha_beta_custom_enabled"]
         bert_min_df = model_parameters_dict["bert_min_df"]
         bert_max_features = model_parameters_dict["bert_max_features"]
+        # projects saved before profiles existed used the full pipeline
+        preprocessing_profile = model_parameters_dict.get(
+            "preprocessing_profile", PreprocessingProfile.to_string(
+                cls.default_preprocessing_profile))
 
         # check if the values are of the correct type and within the correct
         # range
@@ -138,6 +150,10 @@ class ModelParametersModel:
                              f" {max_features_max_value}, but is:"
                              f" {model_params_model.bert_max_features}")
 
+        if not isinstance(preprocessing_profile, str):
+            raise ValueError("Preprocessing profile should be a string, but"
+                             " is not")
+
         # set the values in the model
         model_params_model.n_topics = num_topics
         model_params_model.model_type = ModelType.from_string(model_type)
@@ -151,6 +167,8 @@ class ModelParametersModel:
         model_params_model.bert_max_features = (
             None if bert_max_features == "None"
             else bert_max_features)
+        model_params_model.preprocessing_profile = (
+            PreprocessingProfile.from_string(preprocessing_profile))
 
         return model_params_model
 
@@ -1,13 +1,75 @@
+import json
 import os
+import platform
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from typing import Optional, Union, get_args, get_origin
 
 
 @dataclass
 class ApplicationSettings:
     """A class that holds the application-wide settings."""
     data_folder: str
+    # The folder where intermediate results are cached between runs. No
+    # caches are used when this is None.
+    cache_folder: Optional[str] = None
     default_config_name: str = "Config 1"
+    # The number of processes used to import files. With a single worker
+    # all files are imported one by one in the calling thread.
+    import_workers: int = 1
+    # The number of processes that extract the pages of a long PDF file
+    pdf_page_workers: int = 1
+    # The maximum number of pages read from a PDF file, None for no limit
+    pdf_max_pages: Optional[int] = None
+    # The maximum size in bytes of the text that was extracted from Word,
+    # PDF and RTF files. The least recently used files are removed when it
+    # is exceeded, and the text is not cached when this is 0.
+    extracted_text_cache_size: int = 1 << 30
+    # The JSON keys that the fields of the documents in JSON Lines files are
+    # read from, for the fields whose key differs from their name
+    jsonl_field_mapping: dict[str, str] = field(default_factory=dict)
+    # Gitignore-style patterns of the files and folders that are not
+    # imported from the input folder
+    import_exclude_patterns: list[str] = field(default_factory=list)
+    # The maximum depth of the subfolders of the input folder that are
+    # imported, where 0 only imports the input folder itself
+    import_max_depth: Optional[int] = None
+    # The maximum number of files that is imported from the input folder
+    import_max_files: Optional[int] = None
+    # Whether documents with the same text as an earlier document are
+    # removed from the corpus before preprocessing. This is off by default,
+    # since reprinted articles can be part of what is studied.
+    remove_duplicates: bool = False
+    # The similarity of the word shingles of two documents from which the
+    # later document is removed as a near-duplicate, None to only remove
+    # exact duplicates
+    duplicate_threshold: Optional[float] = 0.9
+    # The number of documents that the spaCy pipeline processes at once
+    preprocessing_batch_size: int = 64
+    # The number of processes that run the spaCy pipeline. With a single
+    # process all documents are preprocessed in the calling thread.
+    preprocessing_processes: int = 1
+    # The maximum number of characters that the spaCy pipeline processes at
+    # once. Longer documents are split into chunks on paragraph or sentence
+    # boundaries, and are not split when this is None.
+    preprocessing_chunk_size: Optional[int] = 100_000
+    # The maximum size in bytes of the cached output of the spaCy pipeline.
+    # The least recently used documents are removed when it is exceeded,
+    # and the output is not cached when this is 0.
+    preprocessing_cache_size: int = 1 << 30
+    # The estimated memory in bytes that the loaded spaCy pipelines may use
+    # together. The pipelines of the languages that were used least
+    # recently are unloaded when it is exceeded.
+    pipeline_memory_budget: int = 1 << 30
+    # Whether the processed corpus is written to a temporary file as bags of
+    # words in a single pass over the input folder, instead of being kept
+    # in memory. Topic models then read the corpus back as a stream.
+    streaming_corpus: bool = False
+
+
+# The settings that are read before the settings file is loaded, and can
+# therefore not be changed in it
+_fixed_settings = ("data_folder", "default_config_name")
 
 
 def get_data_folder() -> str:
@@ -28,6 +90,100 @@ def get_assets_folder() -> str:
     return os.path.join(base_dir, "assets")
 
 
+def get_cache_folder() -> str:
+    """
+    Returns the standard location where cached data is stored for the
+    current user, following the conventions of the operating system.
+    :return: the location of the cache folder of the application
+    """
+    match platform.system():
+        case "Windows":
+            base_dir = os.environ.get("LOCALAPPDATA",
+                                      os.path.expanduser("~"))
+        case "Darwin":
+            base_dir = os.path.join(os.path.expanduser("~"), "Library",
+                                    "Caches")
+        case _:
+            base_dir = os.environ.get("XDG_CACHE_HOME",
+                                      os.path.join(os.path.expanduser("~"),
+                                                   ".cache"))
+    return os.path.join(base_dir, "tommy")
+
+
+def get_settings_file() -> str:
+    """
+    Returns the location of the file in which the user can change the
+    application settings, following the conventions of the operating system.
+    :return: the location of the settings file of the application
+    """
+    match platform.system():
+        case "Windows":
+            base_dir = os.environ.get("APPDATA", os.path.expanduser("~"))
+        case "Darwin":
+            base_dir = os.path.join(os.path.expanduser("~"), "Library",
+                                    "Application Support")
+        case _:
+            base_dir = os.environ.get("XDG_CONFIG_HOME",
+                                      os.path.join(os.path.expanduser("~"),
+                                                   ".config"))
+    return os.path.join(base_dir, "tommy", "settings.json")
+
+
+def load_settings_file(settings: ApplicationSettings,
+                       path: str) -> list[str]:
+    """
+    Read the settings in a JSON file into the application settings. The file
+    holds an object with the names of the settings as keys, and settings
+    that are not in the file keep their default value. Nothing is changed
+    when the file does not exist.
+    :param settings: the application settings to change
+    :param path: the location of the settings file
+    :return: a description of every setting in the file that was ignored
+    """
+    try:
+        with open(path, encoding="utf-8") as settings_file:
+            values = json.load(settings_file)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as error:
+        return [f"Het bestand {path} kon niet gelezen worden: {error}"]
+    if not isinstance(values, dict):
+        return [f"Het bestand {path} bevat geen JSON-object"]
+
+    setting_types = {setting.name: setting.type
+                     for setting in fields(settings)
+                     if setting.name not in _fixed_settings}
+    problems = []
+    for name, value in values.items():
+        if name not in setting_types:
+            problems.append(f"Onbekende instelling '{name}'")
+        elif not _matches_type(value, setting_types[name]):
+            problems.append(f"Ongeldige waarde {value!r} voor '{name}'")
+        else:
+            setattr(settings, name, value)
+    return problems
+
+
+def _matches_type(value: object, annotation: type) -> bool:
+    """
+    Check whether a value that was read from JSON fits the type annotation
+    of a setting
+    :param value: the value read from JSON
+    :param annotation: the type annotation of the setting
+    :return: whether the value can be used for the setting
+    """
+    if get_origin(annotation) is Union:
+        return any(_matches_type(value, option)
+                   for option in get_args(annotation))
+    if annotation is type(None):
+        return value is None
+    if isinstance(value, bool):
+        return annotation is bool
+    if annotation is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, get_origin(annotation) or annotation)
+
+
 def get_base_dir() -> str:
     """
     Returns the current working directory
@@ -39,7 +195,8 @@ def get_base_dir() -> str:
                                                                  "tommy")))
 
 
-application_settings = ApplicationSettings(get_data_folder())
+application_settings = ApplicationSettings(get_data_folder(),
+                                           get_cache_folder())
 
 """
 This program has been developed by students from the bachelor Computer Science
@@ -0,0 +1,117 @@
+import gzip
+import json
+import os
+from typing import Any, Optional
+
+
+class BlobCache:
+    """
+    A persistent store of JSON values in a folder, where every entry is a
+    compressed blob named after its key. The entries that were used least
+    recently are removed when the total size of the entries exceeds the
+    maximum size.
+    """
+
+    # The fraction of the maximum size that is kept when entries are
+    # removed, so the folder is not scanned again on every new entry
+    _prune_fraction = 0.9
+
+    def __init__(self, folder: str, max_bytes: int) -> None:
+        """
+        Initialize the cache that stores its entries in the given folder.
+
+        :param folder: The folder to store the cached entries in
+        :param max_bytes: The maximum total size of the entries in bytes
+        """
+        self.folder = folder
+        self.max_bytes = max_bytes
+        # The total size of the entries, which is only known after the
+        # folder has been scanned once
+        self._size: Optional[int] = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get an entry from the cache and mark it as recently used.
+
+        :param key: The key of the entry
+        :return: The value of the entry, or None if it is not cached
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with gzip.open(entry_path, "rt", encoding="utf-8") as file:
+                value = json.load(file)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store an entry in the cache, and remove the least recently used
+        entries if the cache is full. Entries that cannot be written are
+        skipped, since the cache is only an optimization.
+
+        :param key: The key of the entry
+        :param value: The value of the entry, which must be JSON
+            serializable
+        :return: None
+        """
+        entry_path = self._entry_path(key)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with gzip.open(temporary_path, "wt", encoding="utf-8") as file:
+                json.dump(value, file, separators=(",", ":"))
+            size = os.path.getsize(temporary_path)
+            os.replace(temporary_path, entry_path)
+        except OSError:
+            return
+
+        if self._size is None:
+            self.prune()
+        else:
+            self._size += size
+            if self._size > self.max_bytes:
+                self.prune()
+
+    def prune(self) -> None:
+        """
+        Remove the least recently used entries until the entries fit in
+        the maximum size, leaving some room for new entries.
+
+        :return: None
+        """
+        entries = []
+        for folder, _, names in os.walk(self.folder):
+            for name in names:
+                path = os.path.join(folder, name)
+                try:
+                    status = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((status.st_mtime, status.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size > self.max_bytes:
+            target = self.max_bytes * self._prune_fraction
+            for _, entry_size, path in sorted(entries):
+                if size <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                size -= entry_size
+        self._size = size
+
+    def _entry_path(self, key: str) -> str:
+        """Get the path of the blob of an entry"""
+        return os.path.join(self.folder, key[-2:], f"{key}.json.gz")
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
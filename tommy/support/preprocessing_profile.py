@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class PreprocessingProfile(Enum):
+    """
+    An enumeration of the ways the texts of the corpus can be preprocessed.
+    The full profile runs the whole SpaCy pipeline, and the throughput
+    profile only tokenizes and lemmatizes the texts, which is much faster
+    for exploring very large corpora.
+    """
+    Full = 1
+    Throughput = 2
+
+    @staticmethod
+    def from_string(profile: str) -> PreprocessingProfile:
+        """
+        Convert a string to a PreprocessingProfile.
+        :param profile: The string to convert
+        :return: The PreprocessingProfile
+        """
+        match profile:
+            case "Full":
+                return PreprocessingProfile.Full
+            case "Throughput":
+                return PreprocessingProfile.Throughput
+            case _:
+                raise ValueError(
+                    f"Preprocessing profile {profile} not recognized")
+
+    @staticmethod
+    def to_string(profile: PreprocessingProfile) -> str:
+        """
+        Convert a PreprocessingProfile to a string.
+        :param profile: The PreprocessingProfile to convert
+        :return: The string
+        """
+        match profile:
+            case PreprocessingProfile.Full:
+                return "Full"
+            case PreprocessingProfile.Throughput:
+                return "Throughput"
+            case _:
+                raise ValueError(
+                    f"Preprocessing profile {profile} not recognized")
+
+
+"""
+This program has been developed by students from the bachelor Computer Science
+at Utrecht University within the Software Project course.
+© Copyright Utrecht University
+(Department of Information and Computing Sciences)
+"""
@@ -46,6 +46,13 @@ class FileLabel(QLabel):
         else:
             self.setText(file_metadata.title or file_metadata.name)
 
+        # Duplicates are shown, but were not used to train the model
+        if file_metadata.duplicate_of is not None:
+            self.setText(f"{self.text()} (duplicaat)")
+            self.setToolTip(f"Dit document is een duplicaat van "
+                            f"{file_metadata.duplicate_of} en is niet "
+                            f"gebruikt om het model te trainen")
+
     def set_formatted_text(self):
         """
         Set the text of the label with the
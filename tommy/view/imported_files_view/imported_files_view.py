@@ -1,17 +1,19 @@
 from PySide6.QtCore import Qt
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (QLabel, QVBoxLayout, QScrollArea, QWidget,
-                               QSizePolicy, QPushButton, QGridLayout)
+                               QSizePolicy, QPushButton, QGridLayout,
+                               QHBoxLayout, QApplication)
 
 from tommy.controller.config_controller import ConfigController
 from tommy.controller.corpus_controller import CorpusController
+from tommy.controller.file_import.import_progress import ImportProgress
 from tommy.controller.file_import.metadata import Metadata
 from tommy.controller.topic_modelling_controller import \
     TopicModellingController
 from tommy.support.constant_variables import (
     heading_font, prim_col_red,
     hover_prim_col_red, scrollbar_style, title_label_font,
-    collapse_button_font)
+    collapse_button_font, medium_light_gray)
 from tommy.support.types import Document_topics
 from tommy.view.imported_files_view.file_label import FileLabel
 from tommy.view.topic_view.topic_entity_component.topic_entity import \
@@ -34,6 +36,8 @@ class ImportedFilesView(QWidget):
         self.config_controller = config_controller
         corpus_controller.metadata_changed_event.subscribe(
             self.on_metadata_changed)
+        corpus_controller.import_progress_event.subscribe(
+            self.on_import_progress)
 
         topic_modelling_controller.model_trained_event.subscribe(
             lambda _: self.display_files())
@@ -59,6 +63,10 @@ class ImportedFilesView(QWidget):
         self.title_widget = None
         self.initialize_title_widget()
 
+        # Initialize the progress of the import, shown during an import
+        self.progress_widget = None
+        self.initialize_progress_widget()
+
         # Initialize scroll area and its layout
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
@@ -146,6 +154,75 @@ class ImportedFilesView(QWidget):
         # Connect label click event to toggle_collapse method
         self.title_widget.title_button.mousePressEvent = self.toggle_collapse
 
+    def initialize_progress_widget(self) -> None:
+        """
+        Initialize the widget showing the progress of an import, with a
+        button to stop the import.
+
+        :return: None
+        """
+        self.progress_widget = QWidget()
+        self.progress_widget.setStyleSheet(f"background-color: "
+                                           f"{medium_light_gray};")
+        progress_layout = QHBoxLayout(self.progress_widget)
+        progress_layout.setContentsMargins(10, 5, 10, 5)
+
+        self.progress_widget.progress_label = QLabel()
+        self.progress_widget.progress_label.setWordWrap(True)
+        progress_layout.addWidget(self.progress_widget.progress_label, 1)
+
+        self.progress_widget.cancel_button = QPushButton("Stoppen")
+        self.progress_widget.cancel_button.setStyleSheet(
+            f"QPushButton {{background-color: {prim_col_red};"
+            f"color: white; padding: 5px 10px;}}"
+            f"QPushButton:hover {{background-color: {hover_prim_col_red};}}")
+        self.progress_widget.cancel_button.clicked.connect(
+            self._corpus_controller.cancel_import)
+        progress_layout.addWidget(self.progress_widget.cancel_button)
+
+        self.progress_widget.setVisible(False)
+        self.layout.addWidget(self.progress_widget)
+
+    def on_import_progress(self, progress: ImportProgress) -> None:
+        """
+        Show the progress of the import that is in progress. The events of
+        the application are processed, so the import can be stopped while
+        it runs. The actions that would start another import or use the
+        corpus, such as exporting, switching the language and training a
+        model, are disabled by the main window during the import, and
+        closing the window stops the import first.
+
+        :param progress: The progress of the import
+        :return: None
+        """
+        self.progress_widget.setVisible(not progress.finished)
+        self.progress_widget.progress_label.setText(
+            self.describe_progress(progress))
+        QApplication.processEvents()
+
+    @staticmethod
+    def describe_progress(progress: ImportProgress) -> str:
+        """
+        Describe the progress of an import in a short text.
+
+        :param progress: The progress of the import
+        :return: The description of the progress
+        """
+        if progress.files_total is None:
+            return f"Bestanden zoeken: {progress.files_found} gevonden"
+
+        megabytes = progress.bytes_done / 1_000_000
+        description = (f"Bestanden: {progress.files_done}/"
+                       f"{progress.files_total} ({megabytes:.1f} MB), "
+                       f"{progress.documents_per_second:.0f} documenten/s")
+        throughputs = [f"{file_type}: "
+                       f"{file_type_progress.documents_per_second:.0f}/s"
+                       for file_type, file_type_progress
+                       in sorted(progress.file_types.items())]
+        if throughputs:
+            description += f" ({', '.join(throughputs)})"
+        return description
+
     def display_files(self) -> None:
         """
         Display the metadata from files in the layout
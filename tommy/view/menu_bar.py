@@ -196,6 +196,22 @@ class MenuBar(QMenuBar):
         """
         self.import_input_folder_action.setEnabled(True)
 
+    def set_import_actions_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the actions that start an import of an input
+        folder or use the corpus, which are disabled while an import is in
+        progress.
+
+        :param enabled: Whether the actions are enabled
+        :return: None
+        """
+        self.import_input_folder_action.setEnabled(enabled)
+        self.load_settings_action.setEnabled(enabled)
+        self.export_to_gexf_action.setEnabled(enabled)
+        self.export_to_png_action.setEnabled(enabled)
+        self.export_topic_words_action.setEnabled(enabled)
+        self.export_document_topic_action.setEnabled(enabled)
+
     def export_topic_words(self) -> None:
         """
         Export words related to topics to a CSV file.
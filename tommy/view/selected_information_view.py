@@ -2,6 +2,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QLabel, QScrollArea, QVBoxLayout, QLayout,
                                QWidget, QSizePolicy, QPushButton, QGridLayout)
 
+from tommy.controller.corpus_controller import CorpusController
 from tommy.controller.graph_controller import GraphController
 from tommy.controller.model_parameters_controller import (
     ModelParametersController)
@@ -17,9 +18,13 @@ from tommy.view.imported_files_view.file_label import FileLabel
 class SelectedInformationView(QScrollArea):
     """Class to define the SelectedInformationView UI component"""
 
+    # The number of characters of the text of a file that is shown
+    text_preview_length = 1000
+
     def __init__(self,
                  graph_controller: GraphController,
-                 model_parameters_controller: ModelParametersController
+                 model_parameters_controller: ModelParametersController,
+                 corpus_controller: CorpusController
                  ) -> None:
         """Initialize the SelectedInformationView."""
         super().__init__()
@@ -60,6 +65,7 @@ class SelectedInformationView(QScrollArea):
         # Initialize controllers
         self._graph_controller = graph_controller
         self._model_parameters_controller = model_parameters_controller
+        self._corpus_controller = corpus_controller
 
         # Initialize widgets
         self.display_no_component_selected()
@@ -286,6 +292,22 @@ class SelectedInformationView(QScrollArea):
         file_size_label.setMinimumHeight(20)
         vertical_layout.addWidget(file_size_label)
 
+        # Add the start of the text, which is loaded for this file only
+        try:
+            text = self._corpus_controller.get_body(file_metadata).body
+            if len(text) > self.text_preview_length:
+                text = text[:self.text_preview_length] + "…"
+        except Exception:
+            text = "De tekst van dit bestand kon niet worden geladen"
+        file_text_label = QLabel(text)
+        file_text_label.setFont(file_property_font)
+        file_text_label.setStyleSheet("font-size: 14px;")
+        file_text_label.setWordWrap(True)
+        file_text_label.setTextFormat(Qt.TextFormat.PlainText)
+        file_text_label.setAlignment(Qt.AlignmentFlag.AlignLeft |
+                                     Qt.AlignmentFlag.AlignTop)
+        vertical_layout.addWidget(file_text_label)
+
     def display_topic_info(self, topic_entity) -> None:
         """
         Display the topic information
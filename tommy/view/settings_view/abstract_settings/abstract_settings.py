@@ -15,6 +15,7 @@ from tommy.support.constant_variables import (
 from tommy.support.model_type import ModelType
 from tommy.support.parameter_limits import num_topics_min_value, \
     num_topics_max_value, amount_of_words_min_value, amount_of_words_max_value
+from tommy.support.preprocessing_profile import PreprocessingProfile
 from tommy.support.supported_languages import SupportedLanguage
 from tommy.view.config_view import ConfigView
 from tommy.view.settings_view.abstract_settings.better_combo_box import \
@@ -25,6 +26,8 @@ class AbstractSettings:
     """
     Abstract class for settings view
     """
+    _profile_labels = {"Volledig": PreprocessingProfile.Full,
+                       "Snel": PreprocessingProfile.Throughput}
     _model_parameters_controller: ModelParametersController
     _config_controller: ConfigController
     _scroll_layout: QVBoxLayout
@@ -104,6 +107,7 @@ class AbstractSettings:
         # Initialize input fields
         self._algorithm_field = BetterComboBox()
         self._language_field = BetterComboBox()
+        self._profile_field = BetterComboBox()
         self._topic_amount_field = QLineEdit()
         self._amount_of_words_field = QLineEdit()
 
@@ -135,6 +139,7 @@ class AbstractSettings:
         self.initialize_algorithm_field()
         self.initialize_topic_amount_field()
         self.initialize_language_field()
+        self.initialize_profile_field()
         self.add_margin(10)
 
     def all_fields_valid(self) -> bool:
@@ -571,6 +576,47 @@ class AbstractSettings:
         self._language_controller.set_language(
             SupportedLanguage.from_string(selected_model_type))
 
+    def initialize_profile_field(self) -> None:
+        """
+        Initialize the field for the way the texts are preprocessed
+
+        :return: None
+        """
+        profile_layout = QHBoxLayout()
+
+        # Add label
+        self._profile_field = BetterComboBox()
+        profile_label = QLabel("Voorbewerking:")
+        profile_label.setStyleSheet(f"font-size: 16px;"
+                                    f"color: black;"
+                                    f"font-family: {text_font};")
+        profile_label.setAlignment(Qt.AlignmentFlag.AlignLeft |
+                                   Qt.AlignmentFlag.AlignVCenter)
+        profile_label.setFont(settings_label_font)
+        profile_layout.addWidget(profile_label)
+
+        # Add input field
+        self._profile_field.setFixedWidth(100)
+        for label in self._profile_labels:
+            self._profile_field.addItem(label)
+        self._profile_field.setFont(settings_label_font)
+        self._profile_field.setStyleSheet(self.enabled_input_stylesheet)
+        profile_layout.addWidget(self._profile_field)
+        self._profile_field.currentIndexChanged.connect(
+            self.profile_field_changed_event)
+
+        # Add profile layout to container layout
+        self._scroll_layout.addLayout(profile_layout)
+
+    def profile_field_changed_event(self) -> None:
+        """
+        Event handler for when the preprocessing profile field is changed
+
+        :return: None
+        """
+        self._model_parameters_controller.set_preprocessing_profile(
+            self._profile_labels[self._profile_field.currentText()])
+
     def set_field_values_from_backend(self):
         """
         Get the parameter values from the backend and put them in the
@@ -587,6 +633,11 @@ class AbstractSettings:
         current_language = self._language_controller.get_language()
         self._language_field.set_current_text_without_signal(
             SupportedLanguage.to_string(current_language))
+        current_profile = (
+            self._model_parameters_controller.get_preprocessing_profile())
+        self._profile_field.set_current_text_without_signal(
+            next(label for label, profile in self._profile_labels.items()
+                 if profile == current_profile))
 
     def disable_input_field(self, field: QLineEdit) -> None:
         """
@@ -658,6 +709,7 @@ class AbstractSettings:
         self.disable_input_field(self._amount_of_words_field)
         self.disable_combobox(self._algorithm_field)
         self.disable_combobox(self._language_field)
+        self.disable_combobox(self._profile_field)
         self.disable_button(self._config_management_button)
 
     def enable_input_fields_on_model_trained(self) -> None:
@@ -670,6 +722,7 @@ class AbstractSettings:
         self.enable_input_field(self._amount_of_words_field)
         self.enable_combobox(self._algorithm_field)
         self.enable_combobox(self._language_field)
+        self.enable_combobox(self._profile_field)
         self.enable_button(self._config_management_button)
 
 
@@ -306,6 +306,21 @@ class ModelParamsView(QScrollArea):
         current_view = self.get_current_settings_view()
         current_view.disable_input_fields_on_model_training()
 
+    def set_enabled_on_import(self, enabled: bool) -> None:
+        """
+        Enable or disable the apply button and the input fields, which
+        are disabled while the input folder is imported so no model is
+        trained and no configuration is switched during the import.
+
+        :param enabled: Whether the apply button and fields are enabled
+        :return: None
+        """
+        if enabled:
+            self._reset_apply_button_on_model_trained()
+        else:
+            self.disable_apply_button_on_model_training()
+            self.disable_input_fields_on_model_training()
+
     def _reset_apply_button_on_model_trained(self) -> None:
         """
         Re-enable the apply button and restore its text when training is